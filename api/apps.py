@@ -7,3 +7,8 @@ class ApiConfig(AppConfig):
 
     def ready(self):
         import api.signals  # noqa
+        from api.bro_upload.template_registry import registry
+
+        # Compile the upload templates once per process, so broken or missing
+        # templates fail at startup instead of during a delivery.
+        registry.load()
@@ -6,6 +6,7 @@ from django.conf import settings
 
 from api import models as api_models
 from api.bro_import import config
+from api.progress import ProgressReporter
 from frd.models import FRD
 from gar.models import GAR
 from gld.models import GLD
@@ -68,11 +69,9 @@ class BulkImporter:
             bro_ids = self._fetch_bro_ids(url)
 
             total_bro_ids = len(bro_ids)
-            counter = 0
-            update_interval = max(total_bro_ids // 10, 1)
+            reporter = ProgressReporter(self.import_task_instance, total=total_bro_ids)
             logger.info(f"Starting import with {total_bro_ids} BRO-IDs.")
             for bro_id in bro_ids:
-                counter += 1
                 try:
                     data_importer = self.object_importer_class(bro_id, self.data_owner)
                     data_importer.run(force=self.force)
@@ -82,16 +81,12 @@ class BulkImporter:
                         f"Error while importing data for bro id: {bro_id}: {e}"
                     ) from e
 
-                if counter % update_interval == 0 or counter == total_bro_ids:
-                    progress = (counter / total_bro_ids) * 100
-                    logger.info(f"At {round(progress, 2)}% of import.")
-                    self.import_task_instance.progress = round(progress, 2)
-                    self.import_task_instance.save()
-
+                reporter.advance()
                 time.sleep(3)
 
+            self.import_task_instance.progress = 100.00
             self.import_task_instance.status = "COMPLETED"
-            self.import_task_instance.save()
+            reporter.finish()
             logger.info("Completed import succesfully.")
 
         except Exception as e:
@@ -14,6 +14,7 @@ from requests.adapters import HTTPAdapter, Retry
 from requests.auth import HTTPBasicAuth
 
 from api.models import ImportTask, Organisation
+from api.utils.helpers import to_float
 from frd.models import (
     FRD,
     CalculatedApparentFormationResistance,
@@ -557,15 +558,19 @@ class GMWObjectImporter(ObjectImporter):
                 )
                 .get("gmwcommon:localVerticalReferencePoint", {})
                 .get("#text", None),
-                "offset": gmw_data.get("deliveredVerticalPosition", {})
-                .get("gmwcommon:offset", {})
-                .get("#text", None),
+                "offset": to_float(
+                    gmw_data.get("deliveredVerticalPosition", {})
+                    .get("gmwcommon:offset", {})
+                    .get("#text", None)
+                ),
                 "vertical_datum": gmw_data.get("deliveredVerticalPosition", {})
                 .get("gmwcommon:verticalDatum", {})
                 .get("#text", None),
-                "ground_level_position": gmw_data.get("deliveredVerticalPosition", {})
-                .get("gmwcommon:groundLevelPosition", {})
-                .get("#text", None),
+                "ground_level_position": to_float(
+                    gmw_data.get("deliveredVerticalPosition", {})
+                    .get("gmwcommon:groundLevelPosition", {})
+                    .get("#text", None)
+                ),
                 "ground_level_positioning_method": gmw_data.get(
                     "deliveredVerticalPosition", {}
                 )
@@ -692,15 +697,17 @@ class GMWObjectImporter(ObjectImporter):
                         "numberOfGeoOhmCables", None
                     ),
                     "geo_ohm_cables": geo_ohm_data or [],
-                    "tube_top_diameter": monitoringtube.get("tubeTopDiameter", {}).get(
-                        "#text"
+                    "tube_top_diameter": to_float(
+                        monitoringtube.get("tubeTopDiameter", {}).get("#text")
                     ),
                     "variable_diameter": monitoringtube.get("variableDiameter", None),
                     "tube_status": monitoringtube.get("tubeStatus", {}).get(
                         "#text", None
                     ),
-                    "tube_top_position": self._lookup_most_recent_top_position(
-                        monitoringtube, event_data
+                    "tube_top_position": to_float(
+                        self._lookup_most_recent_top_position(
+                            monitoringtube, event_data
+                        )
                     ),
                     "tube_top_positioning_method": monitoringtube.get(
                         "tubeTopPositioningMethod", {}
@@ -716,21 +723,29 @@ class GMWObjectImporter(ObjectImporter):
                     "glue": monitoringtube.get("materialUsed", {})
                     .get("gmwcommon:glue", {})
                     .get("#text", None),
-                    "screen_length": monitoringtube.get("screen", {})
-                    .get("screenLength", {})
-                    .get("#text", None),
+                    "screen_length": to_float(
+                        monitoringtube.get("screen", {})
+                        .get("screenLength", {})
+                        .get("#text", None)
+                    ),
                     "sock_material": monitoringtube.get("screen", {})
                     .get("sockMaterial", {})
                     .get("#text", None),
-                    "screen_top_position": monitoringtube.get("screen", {})
-                    .get("screenTopPosition", {})
-                    .get("#text", None),
-                    "screen_bottom_position": monitoringtube.get("screen", {})
-                    .get("screenBottomPosition", {})
-                    .get("#text", None),
-                    "plain_tube_part_length": monitoringtube.get("plainTubePart", {})
-                    .get("gmwcommon:plainTubePartLength", {})
-                    .get("#text", None),
+                    "screen_top_position": to_float(
+                        monitoringtube.get("screen", {})
+                        .get("screenTopPosition", {})
+                        .get("#text", None)
+                    ),
+                    "screen_bottom_position": to_float(
+                        monitoringtube.get("screen", {})
+                        .get("screenBottomPosition", {})
+                        .get("#text", None)
+                    ),
+                    "plain_tube_part_length": to_float(
+                        monitoringtube.get("plainTubePart", {})
+                        .get("gmwcommon:plainTubePartLength", {})
+                        .get("#text", None)
+                    ),
                 },
             )
 
@@ -6,17 +6,25 @@ from typing import TypeVar
 
 import pandas as pd
 import polars as pl
+from django.core.files.uploadedfile import UploadedFile
 
 from api import models as api_models
 from api.bro_upload import config
 from api.bro_upload.upload_datamodels import (
     GAR,
-    Analysis,
     AnalysisProcess,
     FieldMeasurement,
     FieldResearch,
     LaboratoryAnalysis,
 )
+from api.bro_upload.utils import (
+    ARROW_EXTENSIONS,
+    bulk_create_upload_tasks,
+    dry_run_report,
+    file_error,
+    read_excel,
+)
+from api.progress import ProgressReporter
 
 logger = logging.getLogger("general")
 
@@ -43,7 +51,7 @@ def _is_missing_measurement_value(value: object) -> bool:
 
 
 def _resolve_field_measurement_columns(
-    row: pd.Series,
+    columns: list[str],
 ) -> tuple[dict[str, str], dict[str, str]]:
     """Map parameter names to source columns, preferring *_field over unsuffixed columns.
 
@@ -53,7 +61,7 @@ def _resolve_field_measurement_columns(
     columns_by_base_name: dict[str, str] = {}
     normalized_columns: dict[str, str] = {}
 
-    for column in row.index.tolist():
+    for column in columns:
         column_str = str(column)
         if column_str.endswith("_lab"):
             continue
@@ -72,7 +80,7 @@ def _resolve_field_measurement_columns(
 
 
 def _resolve_lab_analysis_columns(
-    row: pd.Series,
+    columns: list[str],
 ) -> tuple[dict[str, str], dict[str, str], dict[str, str]]:
     """Map lab parameter names to source columns, preferring *_lab over unsuffixed.
 
@@ -83,7 +91,7 @@ def _resolve_lab_analysis_columns(
     reporting_limit_columns_by_parameter: dict[str, str] = {}
     analysis_date_columns_by_parameter: dict[str, str] = {}
 
-    for column in row.index:
+    for column in columns:
         column_str = str(column)
         is_lab_column = column_str.endswith("_lab")
 
@@ -197,47 +205,7 @@ class GARBulkUploader:
         self, fieldwork_df: pd.DataFrame, lab_df: pd.DataFrame
     ) -> pd.DataFrame:
         try:
-            # Rename headers
-            required_fields_field = ["GMW BRO ID", "Datum bemonsterd", "Filternummer"]
-            required_fields_lab = ["GMW BRO ID", "Datum bemonsterd", "Filternummer"]
-            has_lab = True
-            if all(
-                field in fieldwork_df.columns for field in required_fields_field
-            ) and all(field in lab_df.columns for field in required_fields_lab):
-                merged_df = merge_fieldwork_and_lab_dfs(fieldwork_df, lab_df)
-            elif all(field in fieldwork_df.columns for field in required_fields_field):
-                merged_df = fieldwork_df
-                has_lab = False
-            else:
-                merged_df = lab_df
-
-            logger.info(f"has lab: {has_lab}")
-
-            fieldwork_df_rename_dict = {
-                "GMW BRO ID": "bro_id",
-                "Datum bemonsterd": "date",
-                "Filternummer": "filter_num",
-            }
-            merged_df = rename_df_columns(merged_df, fieldwork_df_rename_dict)
-            field_columns_exclude = [
-                "NITG",
-                "Putcode",
-                "coördinaat",
-                "Bijzonderheden",
-                "MeetpuntId",
-                "Projectcode lab",
-                "Monsternummer lab",
-            ]
-            trimmed_df = remove_df_columns(merged_df, field_columns_exclude)
-            logger.info(
-                f"Trimmed the dataframe to the following columns: {trimmed_df.columns.tolist()}"
-            )
-            # Pandas DF: create new column meetronde, which should only have the year of datum bemonsterd, as a string
-            trimmed_df["Meetronde"] = trimmed_df["date"].dt.year.astype(str)
-
-            assert len(trimmed_df) > 0, (
-                "The combination of the lab and field files gave no resulting possible GARs"
-            )
+            trimmed_df, has_lab = transform_fieldwork_and_lab_dfs(fieldwork_df, lab_df)
 
             self.bulk_upload_instance.progress = 20.00
             self.bulk_upload_instance.save(update_fields=["progress"])
@@ -276,20 +244,32 @@ class GARBulkUploader:
             "requestReference": self.bulk_upload_instance.metadata["requestReference"],
         }
 
-        progress_per_row = round((80 / len(trimmed_df)), 2)
+        reporter = ProgressReporter(
+            self.bulk_upload_instance, total=len(trimmed_df), start=20.00
+        )
+
+        # Resolve the headers once, and create the measurements for all rows at once
+        plan = GARColumnPlan(trimmed_df.columns.tolist(), has_lab=has_lab)
+        field_measurements_per_row = plan.field_measurements(trimmed_df)
+        analysis_processes_per_row = plan.analysis_processes(trimmed_df)
 
-        for _, row in trimmed_df.iterrows():
+        upload_tasks = []
+        for position, (_, row) in enumerate(trimmed_df.iterrows()):
             logger.info(f"Processing GAR row: {row}")
             try:
                 uploadtask_sourcedocument_data: GAR = create_gar_sourcesdocs_data(
-                    row, self.bulk_upload_instance.metadata, has_lab
+                    row,
+                    self.bulk_upload_instance.metadata,
+                    has_lab,
+                    field_measurements=field_measurements_per_row[position],
+                    analysis_processes=analysis_processes_per_row[position],
                 )
 
                 uploadtask_sourcedocument_data_dict = (
                     uploadtask_sourcedocument_data.model_dump(by_alias=True)
                 )
 
-                api_models.UploadTask.objects.create(
+                upload_task = api_models.UploadTask(
                     data_owner=self.bulk_upload_instance.data_owner,
                     bro_domain="GAR",
                     project_number=self.bulk_upload_instance.project_number,
@@ -298,37 +278,176 @@ class GARBulkUploader:
                     metadata=uploadtask_metadata,
                     sourcedocument_data=uploadtask_sourcedocument_data_dict,
                 )
-
-                self.bulk_upload_instance.progress += progress_per_row
-                self.bulk_upload_instance.save(update_fields=["progress"])
+                upload_tasks.append(upload_task)
             except Exception as e:
                 logger.info(f"Failed to upload GAR ({row.bro_id}) in bulk upload: {e}")
-                self.bulk_upload_instance.progress += progress_per_row
-                self.bulk_upload_instance.save(update_fields=["progress"])
+            reporter.advance()
+
+        # Step 4: Create all uploadtasks at once and start their deliveries
+        bulk_create_upload_tasks(upload_tasks)
 
         self.bulk_upload_instance.progress = 100.00
         self.bulk_upload_instance.status = "FINISHED"
-        self.bulk_upload_instance.save(update_fields=["progress", "status"])
+        reporter.finish()
 
 
-def csv_or_excel_to_df(file_instance: T) -> pd.DataFrame:
-    """Reads out csv or excel files and returns a pandas df."""
+def transform_fieldwork_and_lab_dfs(
+    fieldwork_df: pd.DataFrame, lab_df: pd.DataFrame
+) -> tuple[pd.DataFrame, bool]:
+    """Merges the fieldwork and lab files to one row per GAR, and trims the columns."""
+    # Rename headers
+    required_fields_field = ["GMW BRO ID", "Datum bemonsterd", "Filternummer"]
+    required_fields_lab = ["GMW BRO ID", "Datum bemonsterd", "Filternummer"]
+    has_lab = True
+    if all(field in fieldwork_df.columns for field in required_fields_field) and all(
+        field in lab_df.columns for field in required_fields_lab
+    ):
+        merged_df = merge_fieldwork_and_lab_dfs(fieldwork_df, lab_df)
+    elif all(field in fieldwork_df.columns for field in required_fields_field):
+        merged_df = fieldwork_df
+        has_lab = False
+    else:
+        merged_df = lab_df
+
+    logger.info(f"has lab: {has_lab}")
+
+    fieldwork_df_rename_dict = {
+        "GMW BRO ID": "bro_id",
+        "Datum bemonsterd": "date",
+        "Filternummer": "filter_num",
+    }
+    merged_df = rename_df_columns(merged_df, fieldwork_df_rename_dict)
+    field_columns_exclude = [
+        "NITG",
+        "Putcode",
+        "coördinaat",
+        "Bijzonderheden",
+        "MeetpuntId",
+        "Projectcode lab",
+        "Monsternummer lab",
+    ]
+    trimmed_df = remove_df_columns(merged_df, field_columns_exclude)
+    logger.info(
+        f"Trimmed the dataframe to the following columns: {trimmed_df.columns.tolist()}"
+    )
+    # Pandas DF: create new column meetronde, which should only have the year of datum bemonsterd, as a string
+    trimmed_df["Meetronde"] = trimmed_df["date"].dt.year.astype(str)
+
+    assert len(trimmed_df) > 0, (
+        "The combination of the lab and field files gave no resulting possible GARs"
+    )
+    return trimmed_df, has_lab
+
+
+def check_gars(
+    trimmed_df: pd.DataFrame, has_lab: bool, metadata: dict[str, any]
+) -> list[dict]:
+    """Reports the GARs of the merged files that would fail in the bulk upload.
+
+    The rows of the merged dataframe do not match the rows of one of the
+    files, so the errors refer to the well, tube and sampling date instead.
+    """
+    plan = GARColumnPlan(trimmed_df.columns.tolist(), has_lab=has_lab)
+    field_measurements_per_row = plan.field_measurements(trimmed_df)
+    analysis_processes_per_row = plan.analysis_processes(trimmed_df)
+
+    errors = []
+    for position, (_, row) in enumerate(trimmed_df.iterrows()):
+        try:
+            create_gar_sourcesdocs_data(
+                row,
+                metadata,
+                has_lab,
+                field_measurements=field_measurements_per_row[position],
+                analysis_processes=analysis_processes_per_row[position],
+            )
+        except Exception as e:
+            errors.append(
+                {
+                    "row": None,
+                    "column": None,
+                    "value": f"{row['bro_id']} tube {row['filter_num']} ({row['date']})",
+                    "error": str(e),
+                }
+            )
+    return errors
+
+
+def dry_run(
+    fieldwork_file: UploadedFile | None,
+    lab_file: UploadedFile | None,
+    metadata: dict[str, any],
+) -> dict:
+    """Checks the files of a GAR bulk upload, without creating UploadTasks."""
+    try:
+        fieldwork_df = (
+            csv_or_excel_to_df(fieldwork_file) if fieldwork_file else pd.DataFrame()
+        )
+        lab_df = csv_or_excel_to_df(lab_file) if lab_file else pd.DataFrame()
+    except Exception as e:
+        return dry_run_report(0, [file_error(f"Failed to open the files: {e}")])
+
+    try:
+        trimmed_df, has_lab = transform_fieldwork_and_lab_dfs(fieldwork_df, lab_df)
+    except Exception as e:
+        return dry_run_report(0, [file_error(f"Failed to transform the files: {e}")])
+
+    return dry_run_report(len(trimmed_df), check_gars(trimmed_df, has_lab, metadata))
+
+
+def _restore_numeric_cells(df: pd.DataFrame) -> pd.DataFrame:
+    """Gives the numbers in the text columns of a spreadsheet their number type back.
+
+    calamine reads a column that mixes numbers and text, like a lab value
+    column with "<" for values below the reporting limit, as text ("1.5").
+    pandas converted every cell that looks like a number, and the field
+    measurements and analyses only take numbers.
+    """
+    for column in df.select_dtypes(include="object").columns:
+        numbers = pd.to_numeric(df[column], errors="coerce")
+        is_text = df[column].notna() & numbers.isna()
+        if not is_text.any():
+            df[column] = numbers
+        elif numbers.notna().any():
+            df[column] = numbers.astype(object).where(numbers.notna(), df[column])
+    return df
+
+
+def csv_or_excel_to_df(file_instance: T | UploadedFile) -> pd.DataFrame:
+    """Reads out csv, excel, parquet or arrow files and returns a pandas df.
+
+    Also accepts the (not yet stored) file of a request, for a dry run.
+    """
+    if isinstance(file_instance, UploadedFile):
+        file = file_instance
+    else:
+        file = file_instance.file
+
     # Get the file extension more robustly
-    _, ext = os.path.splitext(file_instance.file.name)
+    _, ext = os.path.splitext(file.name)
     filetype = ext.lstrip(".").lower().strip()
 
-    logger.info(f"Reading file {file_instance.file.name} of type '{filetype}'")
+    logger.info(f"Reading file {file.name} of type '{filetype}'")
 
     # Ensure file pointer is at the beginning
-    if hasattr(file_instance.file, "seek"):
-        file_instance.file.seek(0)
+    if hasattr(file, "seek"):
+        file.seek(0)
     if filetype == "csv":
-        df = pd.read_csv(file_instance.file)
+        df = pd.read_csv(file)
     elif filetype in ["xls", "xlsx"]:
-        df = pd.read_excel(file_instance.file)
+        df = read_excel(
+            file_instance
+            if isinstance(file_instance, api_models.UploadFile)
+            else file.read()
+        )
+        df = _restore_numeric_cells(df.to_pandas())
+    elif filetype == "parquet":
+        df = pd.read_parquet(file)
+    elif filetype in ARROW_EXTENSIONS:
+        df = pd.read_feather(file)
     else:
         raise ValueError(
-            "Unsupported file type. Only CSV and Excel files are supported."
+            "Unsupported file type. Only CSV, Excel, Parquet and Arrow files are supported."
         )
     logger.info(f"For fileinstance {file_instance}, imported the following:")
     logger.info(df.head())
@@ -363,16 +482,26 @@ def remove_df_columns(
 
 
 def create_gar_sourcesdocs_data(
-    row: pd.Series, metadata: dict[str, any], has_lab: bool
+    row: pd.Series,
+    metadata: dict[str, any],
+    has_lab: bool,
+    field_measurements: list[dict] | None = None,
+    analysis_processes: list[dict] | None = None,
 ) -> GAR:
-    """Creates a GAR (the pydantic model), based on a row of the merged df of the GAR bulk upload input."""
+    """Creates a GAR (the pydantic model), based on a row of the merged df of the GAR bulk upload input.
+
+    The field measurements and analysis processes can be passed when they
+    are already created for all rows with a GARColumnPlan.
+    """
     sourcedocs_data_dict = {
         "objectIdAccountableParty": f"{row['bro_id']}-{int(row['filter_num']):03d}-{int(row['Meetronde'])}",
         "qualityControlMethod": metadata["qualityControlMethod"],
         "gmwBroId": row["bro_id"],
         "tubeNumber": row["filter_num"],
-        "fieldResearch": create_gar_field_research(row, metadata),
-        "laboratoryAnalyses": create_gar_lab_analysis(row, metadata) if has_lab else [],
+        "fieldResearch": create_gar_field_research(row, metadata, field_measurements),
+        "laboratoryAnalyses": create_gar_lab_analysis(row, metadata, analysis_processes)
+        if has_lab
+        else [],
     }
 
     if "groundwaterMonitoringNets" in metadata:
@@ -432,7 +561,9 @@ FIELD_RESEARCH_ITEMS = [
 
 
 def create_gar_field_research(
-    row: pd.Series, metadata: dict[str, any]
+    row: pd.Series,
+    metadata: dict[str, any],
+    field_measurements: list[dict] | None = None,
 ) -> FieldResearch:
     """Creates the FieldResearch pydantic model based on a row of the merged df of the GAR bulk upload input."""
     samplingdate = row["date"].strftime("%Y-%m-%d")
@@ -445,15 +576,13 @@ def create_gar_field_research(
         print(f"Error: {e}")
         sampling_time = "12:00"  # Or handle the error appropriately
 
-    # Get columns to exclude for measurements
-    columns_to_exclude = REQUIRED_COLUMNS + FIELD_RESEARCH_ITEMS
-    existing_columns_to_drop = [col for col in columns_to_exclude if col in row.index]
-    measurement_row = row.drop(labels=existing_columns_to_drop)
+    if field_measurements is None:
+        field_measurements = create_gar_field_measurements(row)
 
     # Start with required fields
     field_research_dict = {
         "samplingDateTime": f"{samplingdate}T{sampling_time}:00+00:00",
-        "fieldMeasurements": create_gar_field_measurements(measurement_row),
+        "fieldMeasurements": field_measurements,
     }
 
     # Add optional fields only if present in row
@@ -492,15 +621,44 @@ def create_gar_field_research(
 
 
 def create_gar_field_measurements(row: pd.Series) -> list[FieldMeasurement]:
-    """For now, the config dict is hardcoded in this function.
-    If the options for other organisations differ, this should be redesigned"""
-    field_measurement_list = []
+    """Creates the FieldMeasurements of a single row, see GARColumnPlan for multiple rows."""
+    plan = GARColumnPlan(row.index.tolist(), has_lab=False)
+    return [
+        FieldMeasurement(**field_measurement)
+        for field_measurement in plan.field_measurements(row.to_frame().T)[0]
+    ]
+
+
+def create_gar_lab_analysis(
+    row: pd.Series,
+    metadata: dict[str, any],
+    analysis_processes: list[dict] | None = None,
+) -> list[LaboratoryAnalysis]:
+    """Creates the LaboratoryAnalysis pydantic model based on a row of the merged df of the GAR bulk upload input."""
+    if analysis_processes is None:
+        analysis_processes = create_analysis_process(row)
 
-    curdir = os.path.dirname(os.path.abspath(__file__))
-    logger.info(f"column names: {row.index.tolist()}")
+    lab_analysis = {
+        "responsibleLaboratoryKvk": metadata["responsibleLaboratoryKvk"],
+        "analysisProcesses": analysis_processes,
+    }
 
-    columns_by_base_name, _ = _resolve_field_measurement_columns(row)
-    logger.info(f"columns by base name: {columns_by_base_name}")
+    return [LaboratoryAnalysis(**lab_analysis)]
+
+
+def create_analysis_process(row: pd.Series) -> list[AnalysisProcess]:
+    """Creates the AnalysisProcesses of a single row, see GARColumnPlan for multiple rows."""
+    plan = GARColumnPlan(row.index.tolist(), has_field=False)
+    return [
+        AnalysisProcess(**analysis_process)
+        for analysis_process in plan.analysis_processes(row.to_frame().T)[0]
+    ]
+
+
+def _load_field_parameters(
+    columns_by_base_name: dict[str, str],
+) -> dict[str, tuple[int, str]]:
+    """Returns the parameter_id and unit per field parameter code."""
     has_old_format_trigger = any(
         trigger in columns_by_base_name for trigger in _OLD_FORMAT_TRIGGER_HEADERS
     )
@@ -511,118 +669,191 @@ def create_gar_field_measurements(row: pd.Series) -> list[FieldMeasurement]:
         df = pl.DataFrame(config.FIELD_PARAMETER_OPTIONS)
     else:
         logger.info("Using new format parameter config from CSV file.")
+        curdir = os.path.dirname(os.path.abspath(__file__))
         df = pl.read_csv(os.path.join(curdir, "20260107_GARVarList.csv"), separator=";")
         df = df.rename({"aquocode": "code", "ID": "parameter_id", "eenheid": "unit"})
 
-    for param in columns_by_base_name.keys():
-        logger.info(f"Checking parameter '{param}' against config options.")
+    field_parameters = {}
+    for code, parameter_id, unit in df.select(
+        "code", "parameter_id", "unit"
+    ).iter_rows():
+        # The first occurrence of a code wins
+        field_parameters.setdefault(code, (parameter_id, unit))
+    return field_parameters
 
-        parameter = df.filter(pl.col("code") == param).select("parameter_id", "unit")
-        if parameter.height == 0:
-            logger.warning(
-                f"Parameter '{param}' not found in config, skipping this parameter."
-            )
-            continue
-
-        parameter = parameter.row(0, named=True)
-        source_column = columns_by_base_name.get(param)
-        value = row[source_column]
-        if _is_missing_measurement_value(value):
-            logger.warning(
-                f"Skipping missing value for parameter '{parameter['parameter_id']}' in column '{source_column}'"
-            )
-            continue
-
-        parameter_dict = {
-            "parameter": parameter["parameter_id"],
-            "unit": parameter["unit"],
-            "fieldMeasurementValue": value,
-            "qualityControlStatus": "onbeslist",
-        }
-        logger.info(
-            f"Created field measurement dict for parameter '{parameter['parameter_id']}': {parameter_dict}"
-        )
-
-        field_measurement = FieldMeasurement(**parameter_dict)
-        field_measurement_list.append(field_measurement)
-
-    return field_measurement_list
 
+def _melt_columns(df: pd.DataFrame, columns: list[str]) -> pd.DataFrame:
+    """Stacks the columns into a long df with the row position and the column order.
 
-def create_gar_lab_analysis(
-    row: pd.Series, metadata: dict[str, any]
-) -> list[LaboratoryAnalysis]:
-    """Creates the LaboratoryAnalysis pydantic model based on a row of the merged df of the GAR bulk upload input."""
-    lab_analysis = {
-        "responsibleLaboratoryKvk": metadata["responsibleLaboratoryKvk"],
-        "analysisProcesses": create_analysis_process(row),
-    }
+    The result is sorted per row, and within a row in the order of the columns.
+    """
+    long_df = pd.concat(
+        [
+            pd.DataFrame(
+                {
+                    "row": range(len(df)),
+                    "order": order,
+                    "value": df[column].to_numpy(dtype=object),
+                }
+            )
+            for order, column in enumerate(columns)
+        ],
+        ignore_index=True,
+    )
+    return long_df.sort_values(["row", "order"], kind="stable")
 
-    return [LaboratoryAnalysis(**lab_analysis)]
 
+class GARColumnPlan:
+    """Maps the headers of a GAR bulk upload to the BRO parameters, once per file.
 
-def create_analysis_process(row: pd.Series) -> list[AnalysisProcess]:  # noqa C901
-    analysis_processes = []
+    Resolving the headers means normalising every column name and walking
+    the parameter configs. With the plan, this is done once for all rows
+    instead of once per row. The field measurements and analysis processes
+    are then created for all rows at once, by melting the planned columns
+    to a long df and grouping them per row.
+    """
 
-    (
-        value_columns_by_parameter,
-        reporting_limit_columns_by_parameter,
-        analysis_date_columns_by_parameter,
-    ) = _resolve_lab_analysis_columns(row)
+    def __init__(
+        self, columns: list[str], has_field: bool = True, has_lab: bool = True
+    ) -> None:
+        # (column, parameter_id, unit), in the order of the columns
+        self.field_measurement_columns: list[tuple[str, int, str]] = []
+        # (technique, method, parameter_id, unit, value, date, reporting limit column)
+        self.lab_analysis_columns: list[
+            tuple[str, str, int, str, str, str, str | None]
+        ] = []
+
+        if has_field:
+            self._plan_field_measurements(columns)
+        if has_lab:
+            self._plan_lab_analyses(columns)
+
+    def _plan_field_measurements(self, columns: list[str]) -> None:
+        columns_to_exclude = REQUIRED_COLUMNS + FIELD_RESEARCH_ITEMS
+        measurement_columns = [
+            column for column in columns if column not in columns_to_exclude
+        ]
+        logger.info(f"column names: {measurement_columns}")
 
-    for (technique, method), parameters in LAB_PARAMETERS_BY_PROCESS.items():
-        analyses = []
-        process_date = None
+        columns_by_base_name, _ = _resolve_field_measurement_columns(
+            measurement_columns
+        )
+        logger.info(f"columns by base name: {columns_by_base_name}")
+        field_parameters = _load_field_parameters(columns_by_base_name)
 
-        for parameter, parameter_id, unit in parameters:
-            value_column = value_columns_by_parameter.get(parameter)
-            if not value_column:
+        for param, source_column in columns_by_base_name.items():
+            if param not in field_parameters:
+                logger.warning(
+                    f"Parameter '{param}' not found in config, skipping this parameter."
+                )
                 continue
 
-            date_column = analysis_date_columns_by_parameter.get(parameter)
-            if not date_column:
-                continue
+            parameter_id, unit = field_parameters[param]
+            self.field_measurement_columns.append((source_column, parameter_id, unit))
+
+    def _plan_lab_analyses(self, columns: list[str]) -> None:
+        (
+            value_columns_by_parameter,
+            reporting_limit_columns_by_parameter,
+            analysis_date_columns_by_parameter,
+        ) = _resolve_lab_analysis_columns(columns)
+
+        for (technique, method), parameters in LAB_PARAMETERS_BY_PROCESS.items():
+            for parameter, parameter_id, unit in parameters:
+                value_column = value_columns_by_parameter.get(parameter)
+                date_column = analysis_date_columns_by_parameter.get(parameter)
+                if not value_column or not date_column:
+                    continue
+
+                self.lab_analysis_columns.append(
+                    (
+                        technique,
+                        method,
+                        parameter_id,
+                        unit,
+                        value_column,
+                        date_column,
+                        reporting_limit_columns_by_parameter.get(parameter),
+                    )
+                )
 
-            date_value = row.get(date_column)
-            if pd.isna(date_value) or date_value == "":
-                continue
+    def field_measurements(self, df: pd.DataFrame) -> list[list[dict]]:
+        """Returns the fieldMeasurements per row of the df."""
+        field_measurements: list[list[dict]] = [[] for _ in range(len(df))]
+        if not self.field_measurement_columns:
+            return field_measurements
 
-            value = row[value_column]
-            reporting_limit_column = reporting_limit_columns_by_parameter.get(parameter)
-            reporting_limit = (
-                row[reporting_limit_column] if reporting_limit_column else None
-            )
+        long_df = _melt_columns(
+            df, [column for column, _, _ in self.field_measurement_columns]
+        )
+        long_df = long_df[~long_df["value"].map(_is_missing_measurement_value)]
 
-            if pd.api.types.is_number(value) and pd.notna(value):
-                analysis_dict = {
-                    "parameter": parameter_id,
-                    "unit": unit,
-                    "analysisMeasurementValue": value,
-                    "reportingLimit": reporting_limit,
-                    "qualityControlStatus": "onbeslist",
-                }
-                analyses.append(Analysis(**analysis_dict))
-                if process_date is None:
-                    process_date = date_value
-            elif value in ["<", "GT"]:
-                analysis_dict = {
+        for row, order, value in long_df.itertuples(index=False):
+            _, parameter_id, unit = self.field_measurement_columns[order]
+            field_measurements[row].append(
+                {
                     "parameter": parameter_id,
                     "unit": unit,
-                    "reportingLimit": reporting_limit,
-                    "limitSymbol": "LT" if value == "<" else value,
+                    "fieldMeasurementValue": value,
                     "qualityControlStatus": "onbeslist",
                 }
-                analyses.append(Analysis(**analysis_dict))
-                if process_date is None:
-                    process_date = date_value
-
-        if analyses and process_date is not None:
-            analysis_process_dict = {
-                "date": process_date,
-                "analyticalTechnique": technique,
-                "valuationMethod": method,
-                "analyses": analyses,
+            )
+
+        return field_measurements
+
+    def analysis_processes(self, df: pd.DataFrame) -> list[list[dict]]:
+        """Returns the analysisProcesses per row of the df.
+
+        Analyses are grouped per analytical technique and valuation method.
+        The date of a process is the analysis date of its first analysis.
+        """
+        analysis_processes: list[list[dict]] = [[] for _ in range(len(df))]
+        if not self.lab_analysis_columns:
+            return analysis_processes
+
+        plan = self.lab_analysis_columns
+        long_df = _melt_columns(df, [entry[4] for entry in plan])
+        long_df["date"] = _melt_columns(df, [entry[5] for entry in plan])["value"]
+        long_df["reporting_limit"] = _melt_columns(
+            df.assign(_no_reporting_limit=None),
+            [entry[6] or "_no_reporting_limit" for entry in plan],
+        )["value"]
+
+        has_date = long_df["date"].notna() & (long_df["date"] != "")
+        is_number = (
+            long_df["value"].map(pd.api.types.is_number) & long_df["value"].notna()
+        )
+        is_limit = long_df["value"].isin(["<", "GT"])
+        long_df = long_df[has_date & (is_number | is_limit)]
+
+        # The long df is sorted per row, and the plan is ordered per process,
+        # so the analyses of one process in one row are consecutive.
+        current_process = None
+        for row, order, value, date, reporting_limit in long_df[
+            ["row", "order", "value", "date", "reporting_limit"]
+        ].itertuples(index=False):
+            technique, method, parameter_id, unit, _, _, _ = plan[order]
+            if current_process != (row, technique, method):
+                current_process = (row, technique, method)
+                analysis_processes[row].append(
+                    {
+                        "date": date,
+                        "analyticalTechnique": technique,
+                        "valuationMethod": method,
+                        "analyses": [],
+                    }
+                )
+
+            analysis = {
+                "parameter": parameter_id,
+                "unit": unit,
+                "reportingLimit": reporting_limit,
+                "qualityControlStatus": "onbeslist",
             }
-            analysis_processes.append(AnalysisProcess(**analysis_process_dict))
+            if value in ["<", "GT"]:
+                analysis["limitSymbol"] = "LT" if value == "<" else value
+            else:
+                analysis["analysisMeasurementValue"] = value
+            analysis_processes[row][-1]["analyses"].append(analysis)
 
-    return analysis_processes
+        return analysis_processes
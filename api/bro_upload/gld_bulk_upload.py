@@ -1,49 +1,79 @@
 import datetime
 import logging
+import os
+import tempfile
 import uuid
+from collections.abc import Iterator
 
 import polars as pl
+import pyarrow.parquet as pq
 import pytz
+from django.conf import settings
+from django.core.files.uploadedfile import UploadedFile
 
 from api import models as api_models
 from api.bro_upload.upload_datamodels import (
     TimeValuePair,
 )
-from api.bro_upload.utils import file_to_df
+from api.bro_upload.utils import (
+    bulk_create_upload_tasks,
+    dry_run_report,
+    file_error,
+    file_to_lazy_df,
+    row_errors,
+    uploaded_file_to_df,
+)
+from api.progress import ProgressReporter
+from gld.models import Observation
+from gld.series import get_series_storage
 
 logger = logging.getLogger("general")
 
 
 amsterdam_tz = pytz.timezone("Europe/Amsterdam")
 
-
-def _convert_and_check_df(df: pl.DataFrame) -> pl.DataFrame:
-    column_names = df.columns.copy()
-    # Columns 0 to 5 should have the following names
-    new_names = [
-        "bro_id",
-        "time",
-        "value",
-        "statusQualityControl",
-        "censorReason",
-        "censoringLimitvalue",
-    ]
-
+# Columns 0 to 5 should have the following names
+MEASUREMENT_COLUMNS = [
+    "bro_id",
+    "time",
+    "value",
+    "statusQualityControl",
+    "censorReason",
+    "censoringLimitvalue",
+]
+
+# The UploadTasks are inserted once this many measurements are waiting
+MAX_MEASUREMENTS_PER_BATCH = 500_000
+# Rows per row group of the stored measurements, and per batch when reading them
+STORED_BATCH_SIZE = 100_000
+
+# Periods to split the GLD_Additions on, with the length of the time prefix
+# (e.g. "2024-01" for a month) that the measurements of a period share.
+ADDITION_PERIODS = {
+    "year": 4,
+    "month": 7,
+    "day": 10,
+}
+
+
+def _rename_columns(df: pl.DataFrame | pl.LazyFrame) -> pl.DataFrame | pl.LazyFrame:
+    """Renames the first columns to MEASUREMENT_COLUMNS, the others are kept."""
+    column_names = df.collect_schema().names()
     # Replace up to the number of existing columns
-    updated_names = new_names[: len(column_names)]
+    return df.rename(dict(zip(column_names, MEASUREMENT_COLUMNS)))
 
-    # Append the remaining original column names if any
-    updated_names.extend(column_names[len(updated_names) :])
 
-    # Set the new column names
-    df.columns = updated_names
+def _convert_and_check_df(
+    df: pl.DataFrame | pl.LazyFrame,
+) -> pl.DataFrame | pl.LazyFrame:
+    df = _rename_columns(df)
 
     df = df.with_columns(
         pl.col("statusQualityControl").str.to_lowercase().alias("statusQualityControl"),
         pl.col("censorReason").str.to_lowercase().alias("censorReason"),
     )
 
-    if df.dtypes[1] == pl.String:
+    if df.collect_schema().dtypes()[1] == pl.String:
         df = df.with_columns(pl.col("time").str.to_datetime())
 
     df = df.with_columns(
@@ -58,6 +88,430 @@ def _convert_and_check_df(df: pl.DataFrame) -> pl.DataFrame:
     return df
 
 
+def _prepare_measurements_df(
+    df: pl.DataFrame | pl.LazyFrame,
+) -> pl.DataFrame | pl.LazyFrame:
+    """Localises, sorts and formats the measurements.
+
+    The naive times are interpreted as Dutch time (Europe/Amsterdam), times
+    with a time zone (e.g. from parquet files) are converted to Dutch time.
+    Measurements without a (valid) time are dropped.
+    """
+    if df.collect_schema()["time"].time_zone is None:
+        time = pl.col("time").dt.replace_time_zone(
+            "Europe/Amsterdam", ambiguous="earliest", non_existent="null"
+        )
+    else:
+        time = pl.col("time").dt.convert_time_zone("Europe/Amsterdam")
+
+    return (
+        df.with_columns(time)
+        .drop_nulls(subset="time")
+        .sort("bro_id", "time")
+        .with_columns(
+            pl.col("time").dt.strftime("%Y-%m-%dT%H:%M:%S%:z").alias("time"),
+            pl.col("statusQualityControl")
+            .fill_null("onbekend")
+            .alias("statusQualityControl"),
+        )
+    )
+
+
+def _comma_decimal_expr(df: pl.DataFrame, column: str) -> pl.Expr:
+    """Polars version of TimeValuePair.parse_comma_decimal.
+
+    String columns like '1,32' or '-0,5' are parsed to floats; empty strings
+    and 'null' become null. Values that cannot be parsed also become null,
+    and are reported by _check_comma_decimals.
+    """
+    if column not in df.columns:
+        return pl.lit(None, dtype=pl.Float64).alias(column)
+    if df.schema[column] != pl.String:
+        return pl.col(column).cast(pl.Float64)
+
+    stripped = pl.col(column).str.strip_chars()
+    return (
+        pl.when((stripped == "") | (stripped.str.to_lowercase() == "null"))
+        .then(None)
+        .otherwise(stripped.str.replace_all(",", ".", literal=True))
+        .cast(pl.Float64, strict=False)
+        .alias(column)
+    )
+
+
+def _check_comma_decimals(df: pl.DataFrame, tvps_df: pl.DataFrame) -> None:
+    for column in ["value", "censoringLimitvalue"]:
+        if column not in df.columns or df.schema[column] != pl.String:
+            continue
+
+        original = df.get_column(column).str.strip_chars()
+        invalid = original.filter(
+            tvps_df.get_column(column).is_null()
+            & (original != "")
+            & (original.str.to_lowercase() != "null")
+        )
+        if len(invalid):
+            raise ValueError(f"Invalid numeric value: {invalid[0]!r}")
+
+
+def measurements_to_tvps(df: pl.DataFrame) -> list[dict]:
+    """Converts prepared measurements to the timeValuePairs of a GLD_Addition.
+
+    Gives the same output as TimeValuePair(**row).model_dump(by_alias=True)
+    per row, but works on whole columns instead of a pydantic model per row.
+    Set VALIDATE_BULK_TVPS to use the TimeValuePair model instead.
+    """
+    if "censorReason" in df.columns:
+        censor_reason = pl.col("censorReason").cast(pl.String)
+    else:
+        censor_reason = pl.lit(None, dtype=pl.String).alias("censorReason")
+
+    tvps_df = df.select(
+        pl.col("time"),
+        _comma_decimal_expr(df, "value"),
+        pl.col("statusQualityControl").cast(pl.String).fill_null("onbekend"),
+        censor_reason,
+        _comma_decimal_expr(df, "censoringLimitvalue"),
+    )
+    _check_comma_decimals(df, tvps_df)
+
+    return tvps_df.to_dicts()
+
+
+def _store_measurements(measurements: pl.LazyFrame, directory: str) -> pl.LazyFrame:
+    """Streams the converted and prepared measurements to a parquet file in the directory.
+
+    The uploaded file is parsed, converted and sorted by BRO-ID only once,
+    in chunks, so _measurements_per_bro_id can read the measurements of
+    each BRO-ID in one pass afterwards.
+    """
+    path = os.path.join(directory, "measurements.parquet")
+    _prepare_measurements_df(_convert_and_check_df(measurements)).drop_nulls(
+        subset="bro_id"
+    ).sink_parquet(path, row_group_size=STORED_BATCH_SIZE)
+    return pl.scan_parquet(path)
+
+
+def _measurements_per_bro_id(path: str) -> Iterator[tuple[str, pl.DataFrame]]:
+    """Yields the measurements of each BRO-ID stored by _store_measurements.
+
+    The file is sorted by BRO-ID, so the measurements of a BRO-ID are complete
+    once the next BRO-ID starts. Only the measurements of one BRO-ID and one
+    batch are in memory at a time.
+    """
+    pending: list[pl.DataFrame] = []
+    for batch in pq.ParquetFile(path).iter_batches(batch_size=STORED_BATCH_SIZE):
+        df = pl.from_arrow(batch)
+        for partition in df.partition_by("bro_id", maintain_order=True):
+            if pending and pending[0].item(0, "bro_id") != partition.item(0, "bro_id"):
+                yield pending[0].item(0, "bro_id"), pl.concat(pending)
+                pending = []
+            pending.append(partition)
+    if pending:
+        yield pending[0].item(0, "bro_id"), pl.concat(pending)
+
+
+def split_measurements(
+    df: pl.DataFrame,
+    max_measurements: int | None = None,
+    period: str | None = None,
+) -> list[pl.DataFrame]:
+    """Splits the prepared measurements of one BRO-ID into separate GLD_Additions.
+
+    The measurements are split per period (see ADDITION_PERIODS) in Dutch
+    time first, and then into chunks of at most max_measurements.
+    """
+    if df.is_empty():
+        return []
+
+    if period is None:
+        chunks = [df]
+    elif period in ADDITION_PERIODS:
+        chunks = df.with_columns(
+            pl.col("time").str.slice(0, ADDITION_PERIODS[period]).alias("_period")
+        ).partition_by("_period", maintain_order=True, include_key=False)
+    else:
+        raise ValueError(
+            f"Invalid additionPeriod '{period}', options: {', '.join(ADDITION_PERIODS)}"
+        )
+
+    if not max_measurements:
+        return chunks
+
+    return [
+        chunk.slice(offset, max_measurements)
+        for chunk in chunks
+        for offset in range(0, len(chunk), max_measurements)
+    ]
+
+
+def _delivered_expr(
+    delivered_periods: list[tuple[datetime.date, datetime.date]],
+    delivered_times: list[str] | None = None,
+    time: pl.Expr | None = None,
+) -> pl.Expr:
+    """True for the measurements that are already delivered.
+
+    The time is formatted as by _prepare_measurements_df. Of the delivered
+    periods only the measurements strictly between the (Dutch) dates count,
+    a measurement on the begin or end date may be new.
+    """
+    if time is None:
+        time = pl.col("time")
+
+    date = time.str.slice(0, 10)
+    delivered = pl.lit(False)
+    for begin_position, end_position in delivered_periods:
+        delivered = delivered | (
+            (date > pl.lit(begin_position.isoformat()))
+            & (date < pl.lit(end_position.isoformat()))
+        )
+
+    if delivered_times:
+        times = pl.Series("time", delivered_times).str.to_datetime(strict=False)
+        if times.dtype.time_zone is None:
+            times = times.dt.replace_time_zone(
+                "Europe/Amsterdam", ambiguous="earliest", non_existent="null"
+            )
+        delivered = delivered | time.str.to_datetime("%Y-%m-%dT%H:%M:%S%:z").is_in(
+            times.dt.convert_time_zone("UTC")
+        )
+
+    return delivered
+
+
+def remove_delivered_measurements(
+    df: pl.DataFrame,
+    delivered_periods: list[tuple[datetime.date, datetime.date]],
+    delivered_times: list[str] | None = None,
+) -> pl.DataFrame:
+    """Removes the measurements of one BRO-ID that are already delivered.
+
+    Expects the measurements as returned by _prepare_measurements_df. For
+    observations of which the measurements are known, pass their times: then
+    only measurements at exactly those times are removed. Observations
+    without measurements only have a begin and end date, see _delivered_expr.
+    """
+    if df.is_empty():
+        return df
+
+    return df.filter(~_delivered_expr(delivered_periods, delivered_times))
+
+
+def delivered_observations(
+    bro_ids: list[str],
+    data_owner: api_models.Organisation,
+    sourcedocument_data: dict,
+    by_period: bool = False,
+) -> dict[str, list[dict]]:
+    """Returns the known observations per BRO-ID, of the same type and status.
+
+    Without by_period, only the observations of which the measurements are
+    stored are returned, as the others can only be compared by date.
+    """
+    observations = (
+        Observation.objects.filter(
+            gld__bro_id__in=bro_ids,
+            data_owner=data_owner,
+            observation_type=sourcedocument_data.get("observationType", None),
+            validation_status=sourcedocument_data.get(
+                "validationStatus",
+                sourcedocument_data.get("statusQualityControl", None),
+            ),
+        )
+        .annotate(has_measurements=get_series_storage().exists_subquery())
+        .values(
+            "uuid",
+            "gld__bro_id",
+            "begin_position",
+            "end_position",
+            "has_measurements",
+        )
+    )
+    if not by_period:
+        observations = observations.filter(has_measurements=True)
+
+    observations_per_bro_id = {}
+    for observation in observations:
+        observations_per_bro_id.setdefault(observation["gld__bro_id"], []).append(
+            observation
+        )
+    return observations_per_bro_id
+
+
+def _delivered_periods_and_times(
+    observations: list[dict],
+) -> tuple[list[tuple[datetime.date, datetime.date]], list[str]]:
+    """The arguments of remove_delivered_measurements for the observations."""
+    delivered_periods = [
+        (observation["begin_position"], observation["end_position"])
+        for observation in observations
+        if not observation["has_measurements"]
+    ]
+    storage = get_series_storage()
+    delivered_times = [
+        time.isoformat()
+        for observation in observations
+        if observation["has_measurements"]
+        for time in storage.read(observation["uuid"]).datetimes()
+    ]
+    return delivered_periods, delivered_times
+
+
+def check_measurements(
+    df: pl.DataFrame, delivered: dict[str, list[dict]] | None = None
+) -> list[dict]:
+    """Reports the measurements that would fail, or be skipped, in the bulk upload.
+
+    Runs the checks of _convert_and_check_df, _prepare_measurements_df and
+    measurements_to_tvps on the whole file at once, without raising on the
+    first error. The measurements that are in the delivered observations (see
+    delivered_observations) are reported as skipped.
+    """
+    # _convert_and_check_df needs the columns up to censorReason
+    if df.width < 5:
+        return [
+            file_error(
+                f"Missing columns: {', '.join(MEASUREMENT_COLUMNS[df.width : 5])}"
+            )
+        ]
+    df = _rename_columns(df)
+
+    time = pl.col("time")
+    if df.schema["time"] == pl.String:
+        time = time.str.to_datetime(strict=False)
+    elif df.schema["time"] == pl.Date:
+        time = time.cast(pl.Datetime)
+    df = df.with_columns(time.alias("_time"))
+    if not isinstance(df.schema["_time"], pl.Datetime):
+        return [file_error(f"Unsupported dtype for time: {df.schema['time']}")]
+
+    if df.schema["_time"].time_zone is None:
+        local_time = pl.col("_time").dt.replace_time_zone(
+            "Europe/Amsterdam", ambiguous="earliest", non_existent="null"
+        )
+    else:
+        local_time = pl.col("_time")
+
+    errors = []
+    errors += row_errors(
+        df,
+        ~pl.col("bro_id").cast(pl.String).str.contains(r"^GLD\d{12}$").fill_null(False),
+        "bro_id",
+        "Invalid GLD BRO-ID, expected GLD followed by 12 digits.",
+    )
+    errors += row_errors(df, pl.col("time").is_null(), "time", "Missing time.")
+    errors += row_errors(
+        df,
+        pl.col("time").is_not_null() & pl.col("_time").is_null(),
+        "time",
+        "Invalid time, expected YYYY-MM-DDTHH:MM:SS with an optional time zone.",
+    )
+    errors += row_errors(
+        df,
+        pl.col("_time").is_not_null() & local_time.is_null(),
+        "time",
+        "Time does not exist in Dutch time (daylight saving time), the measurement is skipped.",
+    )
+    errors += row_errors(
+        df,
+        pl.col("_time").is_not_null() & pl.struct("bro_id", "_time").is_duplicated(),
+        "time",
+        "Duplicate time for this BRO-ID.",
+    )
+
+    if delivered:
+        prepared_time = local_time.dt.convert_time_zone("Europe/Amsterdam").dt.strftime(
+            "%Y-%m-%dT%H:%M:%S%:z"
+        )
+        skipped = pl.repeat(False, len(df), eager=True)
+        for bro_id, observations in delivered.items():
+            skipped = (
+                skipped
+                | df.select(
+                    (pl.col("bro_id").cast(pl.String) == bro_id)
+                    & _delivered_expr(
+                        *_delivered_periods_and_times(observations), time=prepared_time
+                    )
+                ).to_series()
+            )
+        errors += row_errors(
+            df.with_columns(skipped.alias("_delivered")),
+            pl.col("_delivered"),
+            "time",
+            "Already delivered in an observation, the measurement is skipped.",
+        )
+
+    for column in ["value", "censoringLimitvalue"]:
+        if column not in df.columns or df.schema[column] != pl.String:
+            continue
+        original = pl.col(column).str.strip_chars()
+        errors += row_errors(
+            df,
+            _comma_decimal_expr(df, column).is_null()
+            & (original != "")
+            & (original.str.to_lowercase() != "null"),
+            column,
+            "Invalid numeric value.",
+        )
+
+    return errors
+
+
+def check_split_options(metadata: dict) -> str | None:
+    """Returns the error of the additionPeriod and maxMeasurementsPerAddition, if any."""
+    addition_period = metadata.get("additionPeriod", None)
+    if addition_period not in [None, *ADDITION_PERIODS]:
+        return f"Invalid additionPeriod '{addition_period}', options: {', '.join(ADDITION_PERIODS)}"
+
+    max_measurements = metadata.get("maxMeasurementsPerAddition", None)
+    if max_measurements is None:
+        return None
+    try:
+        is_positive = int(max_measurements) > 0
+    except (TypeError, ValueError):
+        is_positive = False
+    if not is_positive:
+        return f"Invalid maxMeasurementsPerAddition '{max_measurements}', expected a positive number"
+    return None
+
+
+def dry_run(
+    uploaded_file: UploadedFile,
+    metadata: dict,
+    sourcedocument_data: dict,
+    data_owner: api_models.Organisation,
+) -> dict:
+    """Checks a GLD bulk upload file, without creating UploadTasks."""
+    error = check_split_options(metadata)
+    if error:
+        return dry_run_report(0, [file_error(error)])
+
+    try:
+        df = uploaded_file_to_df(uploaded_file)
+    except Exception as e:
+        return dry_run_report(0, [file_error(f"Failed to open the files: {e}")])
+
+    delivered = {}
+    if df.width >= 2 and metadata.get("skipDeliveredMeasurements", True):
+        bro_ids = (
+            _rename_columns(df)
+            .get_column("bro_id")
+            .cast(pl.String)
+            .drop_nulls()
+            .unique()
+            .to_list()
+        )
+        delivered = delivered_observations(
+            bro_ids,
+            data_owner,
+            sourcedocument_data,
+            by_period=metadata.get("skipDeliveredPeriods", False),
+        )
+
+    return dry_run_report(len(df), check_measurements(df, delivered))
+
+
 def str_to_datetime(time_value: str | datetime.datetime):
     if isinstance(time_value, datetime.datetime):
         return time_value
@@ -116,26 +570,49 @@ class GLDBulkUploader:
             api_models.UploadFile.objects.get(uuid=measurement_tvp_file_uuid)
         )
 
-    def deliver_one_addition(self, bro_id: str, current_measurements_df: pl.DataFrame):
-        uploadtask_metadata = self.bulk_upload_instance.metadata
-        uploadtask_metadata["broId"] = bro_id
-        # Convert naive datetime to Dutch timezone (Europe/Amsterdam)
-        current_measurements_df = current_measurements_df.with_columns(
-            pl.col("time").dt.replace_time_zone(
-                "Europe/Amsterdam", ambiguous="earliest", non_existent="null"
-            )
+        # The series of a BRO-ID are split into multiple GLD_Additions, the
+        # metadata is checked by _process
+        self.max_measurements = self.bulk_upload_instance.metadata.get(
+            "maxMeasurementsPerAddition", settings.GLD_ADDITION_MAX_MEASUREMENTS
         )
-        current_measurements_df = (
-            current_measurements_df.with_columns(
-                pl.col("time").dt.strftime("%Y-%m-%dT%H:%M:%S%:z").alias("time"),
-                pl.col("statusQualityControl")
-                .fill_null("onbekend")
-                .alias("statusQualityControl"),
-            )
-            .sort("time")
-            .drop_nulls(subset="time")
+        self.addition_period: str | None = self.bulk_upload_instance.metadata.get(
+            "additionPeriod"
+        )
+        # Measurements that are already in a known observation are not sent
+        # again. Observations without stored measurements only have dates,
+        # comparing on those is opt-in.
+        self.skip_delivered: bool = self.bulk_upload_instance.metadata.get(
+            "skipDeliveredMeasurements", True
+        )
+        self.skip_delivered_periods: bool = self.bulk_upload_instance.metadata.get(
+            "skipDeliveredPeriods", False
         )
 
+    def _delivered_observations(self, bro_ids: list[str]) -> dict[str, list[dict]]:
+        return delivered_observations(
+            bro_ids,
+            self.bulk_upload_instance.data_owner,
+            self.bulk_upload_instance.sourcedocument_data,
+            by_period=self.skip_delivered_periods,
+        )
+
+    def _remove_delivered(
+        self, current_measurements_df: pl.DataFrame, observations: list[dict]
+    ) -> pl.DataFrame:
+        return remove_delivered_measurements(
+            current_measurements_df, *_delivered_periods_and_times(observations)
+        )
+
+    def build_one_addition(
+        self, bro_id: str, current_measurements_df: pl.DataFrame
+    ) -> api_models.UploadTask:
+        """Builds the (unsaved) GLD_Addition UploadTask for (a chunk of) one BRO-ID.
+
+        Expects the measurements as returned by _prepare_measurements_df.
+        """
+        uploadtask_metadata = dict(self.bulk_upload_instance.metadata)
+        uploadtask_metadata["broId"] = bro_id
+
         time = current_measurements_df.select("time")
         begin_position = time.item(0, 0)
         end_position = time.item(-1, 0)
@@ -159,12 +636,17 @@ class GLDBulkUploader:
         else:
             result_time = end_position
 
-        measurement_tvps: list[dict] = [
-            TimeValuePair(**row).model_dump(by_alias=True)
-            for row in current_measurements_df.iter_rows(named=True)
-        ]
+        if settings.VALIDATE_BULK_TVPS:
+            measurement_tvps: list[dict] = [
+                TimeValuePair(**row).model_dump(by_alias=True)
+                for row in current_measurements_df.iter_rows(named=True)
+            ]
+        else:
+            measurement_tvps = measurements_to_tvps(current_measurements_df)
 
-        self.bulk_upload_instance.sourcedocument_data.update(
+        # Each addition gets its own positions, and observation ids when generated
+        sourcedocument_data = dict(self.bulk_upload_instance.sourcedocument_data)
+        sourcedocument_data.update(
             {
                 "beginPosition": begin_position.date().strftime("%Y-%m-%d"),
                 "endPosition": end_position.date().strftime("%Y-%m-%d"),
@@ -173,10 +655,10 @@ class GLDBulkUploader:
         )
 
         uploadtask_sourcedocument_dict: dict = create_gld_sourcedocs_data(
-            measurement_tvps, self.bulk_upload_instance.sourcedocument_data
+            measurement_tvps, sourcedocument_data
         )
 
-        upload_task = api_models.UploadTask.objects.create(
+        return api_models.UploadTask(
             data_owner=self.bulk_upload_instance.data_owner,
             bro_domain="GLD",
             project_number=self.bulk_upload_instance.project_number,
@@ -185,12 +667,27 @@ class GLDBulkUploader:
             metadata=uploadtask_metadata,
             sourcedocument_data=uploadtask_sourcedocument_dict,
         )
-        return upload_task
 
     def process(self) -> None:
-        # Step 1: open the files and transform to a pd df
+        with tempfile.TemporaryDirectory() as directory:
+            self._process(directory)
+
+    def _process(self, directory: str) -> None:
+        error = check_split_options(self.bulk_upload_instance.metadata)
+        if error:
+            self.bulk_upload_instance.log = error
+            self.bulk_upload_instance.status = "FAILED"
+            self.bulk_upload_instance.save()
+            return
+        self.max_measurements = int(self.max_measurements)
+
+        # Step 1: stream the file to a parquet file, converted and sorted by
+        # bro_id in one vectorised pass, without loading it in memory
         try:
-            all_measurements_df: pl.DataFrame = file_to_df(self.measurement_tvp_file)
+            with file_to_lazy_df(self.measurement_tvp_file) as lazy_measurements_df:
+                all_measurements_df = _store_measurements(
+                    lazy_measurements_df, directory
+                )
             self.bulk_upload_instance.progress = 10.00
             self.bulk_upload_instance.save()
         except Exception as e:
@@ -200,34 +697,75 @@ class GLDBulkUploader:
             return
 
         # Minimal validation / correction of the data
-        assert len(all_measurements_df) > 0, "There is no data in the file"
-
-        # Convert to standard format
-        all_measurements_df = _convert_and_check_df(all_measurements_df)
-
-        # BRO-Ids
-        bro_ids = all_measurements_df.to_series(0).unique()
-        progress = 80 / (
-            len(bro_ids)
-        )  # amount of progress per steps, per bro_id two steps.
-        self.bulk_upload_instance.progress = 20.00
-        self.bulk_upload_instance.log = f"Nr BroIds: {len(bro_ids)}, Nr of Measurements: {all_measurements_df.count().item(0, 0)}. \n"
-        self.bulk_upload_instance.save()
-        for bro_id in bro_ids:
-            # Step 2: Prepare data for uploadtask per row
-            current_measurements_df = all_measurements_df.filter(
-                pl.col("bro_id").eq(bro_id)
-            )
-
-            upload_task = self.deliver_one_addition(bro_id, current_measurements_df)
-            upload_task.refresh_from_db()
+        nr_of_measurements = all_measurements_df.select(pl.len()).collect().item()
+        assert nr_of_measurements > 0, "There is no data in the file"
+
+        bro_ids = (
+            all_measurements_df.select(pl.col("bro_id").unique().sort())
+            .collect()
+            .to_series()
+            .to_list()
+        )
+        reporter = ProgressReporter(
+            self.bulk_upload_instance, total=len(bro_ids), start=20.00
+        )
+        self.bulk_upload_instance.log = (
+            f"Nr BroIds: {len(bro_ids)}, Nr of Measurements: {nr_of_measurements}. \n"
+        )
+        reporter.flush("log")
 
-            self.bulk_upload_instance.progress += progress
+        delivered_observations = (
+            self._delivered_observations(bro_ids) if self.skip_delivered else {}
+        )
 
-        if self.bulk_upload_instance.progress >= 100:
-            self.bulk_upload_instance.status = "COMPLETED"
+        upload_tasks = []
+        nr_of_waiting_measurements = 0
+        nr_of_additions = 0
+        nr_of_skipped_measurements = 0
+        # Step 2: Read the prepared measurements per bro_id, only one bro_id is in memory
+        for bro_id, current_measurements_df in _measurements_per_bro_id(
+            os.path.join(directory, "measurements.parquet")
+        ):
+            if bro_id in delivered_observations:
+                nr_of_measurements_before = len(current_measurements_df)
+                current_measurements_df = self._remove_delivered(
+                    current_measurements_df, delivered_observations[bro_id]
+                )
+                nr_of_skipped = nr_of_measurements_before - len(current_measurements_df)
+                if nr_of_skipped:
+                    nr_of_skipped_measurements += nr_of_skipped
+                    self.bulk_upload_instance.log += f"{bro_id}: skipped {nr_of_skipped} already delivered measurements. \n"
+
+            chunks = split_measurements(
+                current_measurements_df, self.max_measurements, self.addition_period
+            )
+            for chunk in chunks:
+                upload_tasks.append(self.build_one_addition(bro_id, chunk))
+                nr_of_waiting_measurements += len(chunk)
+            nr_of_additions += len(chunks)
+            if len(chunks) > 1:
+                self.bulk_upload_instance.log += (
+                    f"{bro_id}: split into {len(chunks)} additions. \n"
+                )
+
+            # Step 3: Create the uploadtasks in batches and start their deliveries
+            if nr_of_waiting_measurements >= MAX_MEASUREMENTS_PER_BATCH:
+                bulk_create_upload_tasks(upload_tasks)
+                upload_tasks = []
+                nr_of_waiting_measurements = 0
+
+            reporter.advance()
+
+        bulk_create_upload_tasks(upload_tasks)
+        self.bulk_upload_instance.log += (
+            f"Created {nr_of_additions} GLD_Additions "
+            f"(max measurements per addition: {self.max_measurements or 'unlimited'}, "
+            f"period: {self.addition_period or 'none'}). \n"
+            f"Skipped {nr_of_skipped_measurements} already delivered measurements. \n"
+        )
 
-        self.bulk_upload_instance.save()
+        self.bulk_upload_instance.status = "COMPLETED"
+        reporter.finish("log")
 
 
 def _convert_resulttime_to_date(result_time: str) -> str:
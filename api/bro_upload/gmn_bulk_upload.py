@@ -4,8 +4,21 @@ from datetime import datetime
 from typing import TypeVar
 
 import polars as pl
+from django.core.files.uploadedfile import UploadedFile
 
 from api import models as api_models
+from api.bro_upload.utils import (
+    ARROW_EXTENSIONS,
+    bulk_create_upload_tasks,
+    dry_run_report,
+    file_error,
+    read_excel,
+    read_ipc,
+    read_parquet,
+    row_errors,
+    uploaded_file_to_df,
+)
+from api.progress import ProgressReporter
 
 logger = logging.getLogger("general")
 
@@ -65,26 +78,32 @@ def convert_eventdate_column(df: pl.DataFrame) -> pl.DataFrame:
     raise ValueError(f"Unsupported dtype for eventDate: {df['eventDate'].dtype}")
 
 
-def _convert_and_check_df(df: pl.DataFrame) -> pl.DataFrame:
-    column_names = df.columns.copy()
+# Columns 0 to 5 should have the following names
+MEASURINGPOINT_COLUMNS = [
+    "eventType",
+    "measuringPointCode",
+    "gmwBroId",
+    "tubeNumber",
+    "eventDate",
+]
 
-    # Columns 0 to 5 should have the following names
-    new_names = [
-        "eventType",
-        "measuringPointCode",
-        "gmwBroId",
-        "tubeNumber",
-        "eventDate",
-    ]
+
+def _rename_columns(df: pl.DataFrame) -> pl.DataFrame:
+    column_names = df.columns.copy()
 
     # Replace up to the number of existing columns
-    updated_names = new_names[: len(column_names)]
+    updated_names = MEASURINGPOINT_COLUMNS[: len(column_names)]
 
     # Append the remaining original column names if any
     updated_names.extend(column_names[len(updated_names) :])
 
     # Set the new column names
     df.columns = updated_names
+    return df
+
+
+def _convert_and_check_df(df: pl.DataFrame) -> pl.DataFrame:
+    df = _rename_columns(df)
 
     # Convert eventDate column
     df = convert_eventdate_column(df)
@@ -129,6 +148,80 @@ def check_date_string(date_string: str) -> str:
     return date_string
 
 
+def check_measuringpoints(df: pl.DataFrame) -> list[dict]:
+    """Reports the rows that would fail in the bulk upload.
+
+    Runs the checks of _convert_and_check_df, determine_event_type and
+    check_date_string on the whole file at once, without raising on the
+    first error.
+    """
+    if df.width < len(MEASURINGPOINT_COLUMNS):
+        return [
+            file_error(
+                f"Missing columns: {', '.join(MEASURINGPOINT_COLUMNS[df.width :])}"
+            )
+        ]
+    df = _rename_columns(df)
+
+    # The event types are repeated a lot, so only the unique values are checked
+    invalid_event_types = []
+    for event_type in df["eventType"].drop_nulls().unique():
+        try:
+            determine_event_type(str(event_type))
+        except ValueError:
+            invalid_event_types.append(event_type)
+
+    event_date = pl.col("eventDate")
+    if df.schema["eventDate"] == pl.String:
+        event_date = event_date.str.to_date(format="%Y-%m-%d", strict=False)
+
+    errors = []
+    errors += row_errors(
+        df,
+        pl.col("eventType").is_null() | pl.col("eventType").is_in(invalid_event_types),
+        "eventType",
+        "Unknown event type, expected a measuring point, tube reference or end date event.",
+    )
+    errors += row_errors(
+        df,
+        pl.col("measuringPointCode").is_null(),
+        "measuringPointCode",
+        "Missing measuringPointCode.",
+    )
+    errors += row_errors(
+        df,
+        ~pl.col("gmwBroId")
+        .cast(pl.String)
+        .str.contains(r"^GMW\d{12}$")
+        .fill_null(False),
+        "gmwBroId",
+        "Invalid GMW BRO-ID, expected GMW followed by 12 digits.",
+    )
+    errors += row_errors(
+        df,
+        ~(pl.col("tubeNumber").cast(pl.Int64, strict=False) > 0).fill_null(False),
+        "tubeNumber",
+        "Invalid tubeNumber, expected a positive integer.",
+    )
+    errors += row_errors(
+        df,
+        event_date.is_null(),
+        "eventDate",
+        "Invalid eventDate, expected YYYY-MM-DD.",
+    )
+    return errors
+
+
+def dry_run(uploaded_file: UploadedFile) -> dict:
+    """Checks a GMN bulk upload file, without creating UploadTasks."""
+    try:
+        df = uploaded_file_to_df(uploaded_file)
+    except Exception as e:
+        return dry_run_report(0, [file_error(f"Failed to open the files: {e}")])
+
+    return dry_run_report(len(df), check_measuringpoints(df))
+
+
 class GMNBulkUploader:
     """Handles the upload process for bulk GMN data.
 
@@ -153,16 +246,16 @@ class GMNBulkUploader:
             api_models.UploadFile.objects.get(uuid=measuringpoint_file_uuid)
         )
 
-    def deliver_one_uploadtask(
+    def build_one_uploadtask(
         self,
         event_type: str,
         measuring_point_code: str,
         gmw_bro_id: str,
         tube_number: int,
         event_date: str,
-    ):
+    ) -> api_models.UploadTask:
         registration_type = determine_event_type(event_type)
-        uploadtask_metadata = self.bulk_upload_instance.metadata
+        uploadtask_metadata = dict(self.bulk_upload_instance.metadata)
         uploadtask_metadata["requestReference"] = (
             f"{event_type}_{measuring_point_code}_{event_date}"  # Maybe still change this
         )
@@ -174,7 +267,7 @@ class GMNBulkUploader:
             "tubeNumber": tube_number,
         }
 
-        upload_task = api_models.UploadTask.objects.create(
+        return api_models.UploadTask(
             data_owner=self.bulk_upload_instance.data_owner,
             bro_domain="GMN",
             project_number=self.bulk_upload_instance.project_number,
@@ -183,7 +276,6 @@ class GMNBulkUploader:
             metadata=uploadtask_metadata,
             sourcedocument_data=uploadtask_sourcedocument_dict,
         )
-        return upload_task
 
     def process(self) -> None:
         # Step 1: open the files and transform to a pd df
@@ -206,14 +298,13 @@ class GMNBulkUploader:
         monitoringnet_adjustments_df = _convert_and_check_df(
             monitoringnet_adjustments_df
         )
-        self.bulk_upload_instance.progress = 20.00
-        self.bulk_upload_instance.save()
+        reporter = ProgressReporter(
+            self.bulk_upload_instance,
+            total=len(monitoringnet_adjustments_df),
+            start=20.00,
+        )
+        reporter.flush()
         print(monitoringnet_adjustments_df)
-        # BRO-Ids
-        nr_of_rows = len(monitoringnet_adjustments_df.rows())
-        progress = (
-            80 / nr_of_rows
-        )  # amount of progress per steps, per bro_id two steps.
 
         upload_tasks = []
 
@@ -225,7 +316,7 @@ class GMNBulkUploader:
                 if isinstance(row["eventDate"], str)
                 else row["eventDate"].isoformat()
             )
-            upload_task = self.deliver_one_uploadtask(
+            upload_task = self.build_one_uploadtask(
                 event_type=row["eventType"],
                 measuring_point_code=row["measuringPointCode"],
                 gmw_bro_id=row["gmwBroId"],
@@ -233,12 +324,13 @@ class GMNBulkUploader:
                 event_date=event_date,  # Should accept multiple formats and convert this to YYYY-MM-DD
             )
             upload_tasks.append(upload_task)
-            self.bulk_upload_instance.progress += progress / 2
-            self.bulk_upload_instance.log = f"Created {len(upload_tasks)} upload tasks."
-            self.bulk_upload_instance.save()
+            reporter.advance()
 
+        # Create all uploadtasks at once and start their deliveries
+        bulk_create_upload_tasks(upload_tasks)
+        self.bulk_upload_instance.log = f"Created {len(upload_tasks)} upload tasks."
         self.bulk_upload_instance.status = "COMPLETED"
-        self.bulk_upload_instance.save()
+        reporter.finish("log")
 
 
 def file_to_df(file_instance: T) -> pl.DataFrame:
@@ -253,10 +345,11 @@ def file_to_df(file_instance: T) -> pl.DataFrame:
             truncate_ragged_lines=True,
         )
     elif filetype in ["xls", "xlsx"]:
-        df = pl.read_excel(
-            file_instance.file.path,
-            has_header=True,
-        )
+        df = read_excel(file_instance)
+    elif filetype == "parquet":
+        df = read_parquet(file_instance)
+    elif filetype in ARROW_EXTENSIONS:
+        df = read_ipc(file_instance)
     elif filetype == "zip":
         with zipfile.ZipFile(file_instance.file) as z:
             csv_files = [f for f in z.namelist() if f.lower().endswith(".csv")]
@@ -292,7 +385,7 @@ def file_to_df(file_instance: T) -> pl.DataFrame:
             df = pl.concat(dfs)
     else:
         raise ValueError(
-            "Unsupported file type. Only CSV and Excel, or ZIP files are supported."
+            "Unsupported file type. Only CSV, Excel, Parquet and Arrow, or ZIP files are supported."
         )
     return df
 
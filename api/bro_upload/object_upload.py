@@ -2,7 +2,8 @@ import logging
 from typing import Any
 
 from django.template.exceptions import TemplateDoesNotExist
-from django.template.loader import render_to_string
+
+from api.bro_upload.template_registry import registry, template_name
 
 logger = logging.getLogger("general")
 
@@ -37,14 +38,14 @@ class XMLGenerator:
     ) -> None:
         self.metadata = metadata
         self.sourcedocs_data = sourcedocs_data
-        self.template_filepath = f"{request_type}_{registration_type}.html"
+        self.template_filepath = template_name(request_type, registration_type)
         self.status = "PENDING"
         self.error_message = ""
 
     def create_xml_file(self) -> str:
         """Fills in the provided data into the templates"""
         try:
-            rendered_xml = render_to_string(
+            rendered_xml = registry.render(
                 self.template_filepath,
                 {
                     "metadata": self.metadata,
@@ -0,0 +1,81 @@
+import logging
+import os
+from typing import Any
+
+from django.core.exceptions import ImproperlyConfigured
+from django.template import TemplateSyntaxError, engines
+from django.template.exceptions import TemplateDoesNotExist
+
+logger = logging.getLogger("general")
+
+
+TEMPLATE_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), "templates")
+
+# Templates the bulk uploaders depend on. When one of these is missing,
+# the worker should not start at all instead of failing during delivery.
+REQUIRED_TEMPLATES = [
+    "registration_GAR.html",
+    "registration_GLD_Addition.html",
+    "registration_GMN_MeasuringPoint.html",
+    "registration_GMN_MeasuringPointEndDate.html",
+    "registration_GMN_TubeReference.html",
+]
+
+
+def template_name(request_type: str, registration_type: str) -> str:
+    return f"{request_type}_{registration_type}.html"
+
+
+class TemplateRegistry:
+    """Holds the compiled upload templates, keyed by template name.
+
+    All templates in the bro_upload template directory are compiled once,
+    through load(), when the api app is ready. Rendering afterwards is a
+    dict lookup, instead of a walk through the template loaders per call.
+    """
+
+    def __init__(self, template_dir: str = TEMPLATE_DIR) -> None:
+        self.template_dir = template_dir
+        self.templates: dict[str, Any] = {}
+        self.loaded = False
+
+    def load(self) -> None:
+        """Compiles all templates, and raises ImproperlyConfigured on errors."""
+        engine = engines["django"]
+        templates = {}
+        errors = []
+
+        for filename in sorted(os.listdir(self.template_dir)):
+            if not filename.endswith(".html"):
+                continue
+            try:
+                templates[filename] = engine.get_template(filename)
+            except (TemplateSyntaxError, TemplateDoesNotExist) as e:
+                errors.append(f"{filename}: {e}")
+
+        missing = [name for name in REQUIRED_TEMPLATES if name not in templates]
+        if missing:
+            errors.append(f"Missing required templates: {', '.join(missing)}")
+
+        if errors:
+            raise ImproperlyConfigured(
+                "Failed to load the upload templates:\n" + "\n".join(errors)
+            )
+
+        self.templates = templates
+        self.loaded = True
+        logger.info(f"Loaded {len(templates)} upload templates.")
+
+    def get(self, name: str) -> Any:
+        if not self.loaded:
+            self.load()
+        try:
+            return self.templates[name]
+        except KeyError:
+            raise TemplateDoesNotExist(name)
+
+    def render(self, name: str, context: dict[str, Any]) -> str:
+        return self.get(name).render(context)
+
+
+registry = TemplateRegistry()
@@ -68,6 +68,7 @@ class GLDBulkUploadMetadata(CamelModel):
     quality_regime: QualityRegimeOptions
     delivery_accountable_party: str | None = None
     bro_id: str
+    max_measurements_per_addition: int | None = Field(default=None, gt=0)
 
 
 class GMNBulkUploadMetadata(CamelModel):
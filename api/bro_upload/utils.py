@@ -1,14 +1,24 @@
 import csv
 import datetime
+import hashlib
 import json
 import logging
+import os
+import shutil
+import tempfile
+import uuid
 import zipfile
+from collections.abc import Iterator
+from contextlib import contextmanager
 from io import BytesIO
-from typing import Any, TypeVar
+from typing import Any, BinaryIO, TypeVar
 
 import polars as pl
+import polars.selectors as cs
 import requests
 from django.conf import settings
+from django.core.files.uploadedfile import UploadedFile
+from django.db import transaction
 from requests.adapters import HTTPAdapter
 from urllib3.util.retry import Retry
 
@@ -27,6 +37,15 @@ adapter = HTTPAdapter(max_retries=retry_strategy)
 
 T = TypeVar("T", bound="api_models.UploadFile")
 
+# Arrow IPC files, feather (v2) is the same format
+ARROW_EXTENSIONS = ["arrow", "feather"]
+
+# Max number of row errors in the response of a bulk upload dry run
+MAX_DRY_RUN_ERRORS = 1000
+
+# Directory in MEDIA_ROOT with the Parquet copies of the spreadsheets
+EXCEL_CACHE_DIRECTORY = "excel_cache"
+
 
 def simplify_validation_errors(errors: list[str]) -> dict[str, str]:
     """Transforms the verbose pydantic errors to a readable format"""
@@ -86,12 +105,118 @@ def read_csv(file: T | bytes) -> pl.DataFrame:
     raise TypeError("Unsupported file type passed to read_csv.")
 
 
-def read_excel(file: T | bytes) -> pl.DataFrame:
+def _read_workbook(source: str | bytes | BinaryIO) -> pl.DataFrame:
+    """Reads a spreadsheet with calamine, with the dates as datetimes like pandas."""
+    df = pl.read_excel(source=source, engine="calamine")
+    return df.with_columns(cs.date().cast(pl.Datetime("us")))
+
+
+def _file_hash(source: str | bytes) -> str:
+    digest = hashlib.sha256()
+    if isinstance(source, bytes):
+        digest.update(source)
+        return digest.hexdigest()
+
+    with open(source, "rb") as f:
+        for chunk in iter(lambda: f.read(1024 * 1024), b""):
+            digest.update(chunk)
+    return digest.hexdigest()
+
+
+def excel_cache_directory() -> str:
+    return os.path.join(settings.MEDIA_ROOT, EXCEL_CACHE_DIRECTORY)
+
+
+def prune_excel_cache(max_age: float | None = None) -> int:
+    """Removes the Parquet copies that were not read for max_age seconds.
+
+    Defaults to EXCEL_CACHE_MAX_AGE. Returns the number of removed files.
+    """
+    if max_age is None:
+        max_age = settings.EXCEL_CACHE_MAX_AGE
+    oldest = datetime.datetime.now().timestamp() - max_age
+
+    nr_of_removed = 0
+    try:
+        entries = list(os.scandir(excel_cache_directory()))
+    except FileNotFoundError:
+        return 0
+    for entry in entries:
+        try:
+            if entry.stat().st_mtime < oldest:
+                os.remove(entry.path)
+                nr_of_removed += 1
+        except FileNotFoundError:
+            # Removed by a parallel prune
+            pass
+    return nr_of_removed
+
+
+def excel_to_parquet(source: str | bytes) -> str:
+    """Converts a spreadsheet once to a Parquet copy, and returns its path.
+
+    Parsing Excel is by far the slowest way to read a bulk upload. The copies
+    are keyed by the hash of the file, in one directory shared by all
+    uploads, so a dry run, the upload after it, retries and re-uploads of the
+    same workbook only convert it once. Copies that are not read for
+    EXCEL_CACHE_MAX_AGE seconds are removed when a new copy is stored.
+    """
+    directory = excel_cache_directory()
+    path = os.path.join(directory, f"{_file_hash(source)}.parquet")
+    if os.path.exists(path):
+        # Marks the copy as used, see prune_excel_cache
+        os.utime(path)
+        return path
+
+    df = _read_workbook(source)
+    # Written under a temporary name, so a parallel read never sees half a file
+    os.makedirs(directory, exist_ok=True)
+    temporary_path = f"{path}.{uuid.uuid4().hex}.tmp"
+    df.write_parquet(temporary_path)
+    os.replace(temporary_path, path)
+    prune_excel_cache()
+    return path
+
+
+def read_excel(file: T | bytes | BinaryIO) -> pl.DataFrame:
+    """Reads a spreadsheet from its Parquet copy, see excel_to_parquet."""
     if isinstance(file, api_models.UploadFile):
-        return pl.read_excel(
+        source = file.file.path
+    elif hasattr(file, "read"):
+        source = file.read()
+    else:
+        source = file
+
+    try:
+        return pl.read_parquet(excel_to_parquet(source), memory_map=True)
+    except OSError as e:
+        logger.warning(f"Failed to store a Parquet copy of the spreadsheet: {e}")
+        return _read_workbook(source)
+
+
+def read_parquet(file: T | bytes) -> pl.DataFrame:
+    if isinstance(file, api_models.UploadFile):
+        return pl.read_parquet(
             source=file.file.path,
+            memory_map=True,
         )
-    return pl.read_excel(
+    if isinstance(file, bytes):
+        file = BytesIO(file)
+    return pl.read_parquet(
+        source=file,
+    )
+
+
+def read_ipc(file: T | bytes) -> pl.DataFrame:
+    if isinstance(file, api_models.UploadFile):
+        # Memory-mapped, the columns are not copied until they are used
+        return pl.read_ipc(
+            source=file.file.path,
+            memory_map=True,
+        )
+    if isinstance(file, bytes):
+        file = BytesIO(file)
+    return pl.read_ipc(
         source=file,
     )
 
@@ -139,15 +264,167 @@ def file_to_df(file_instance: T) -> pl.DataFrame:
         df = read_csv(file_instance)
     elif filetype in ["xls", "xlsx"]:
         df = read_excel(file_instance)
+    elif filetype == "parquet":
+        df = read_parquet(file_instance)
+    elif filetype in ARROW_EXTENSIONS:
+        df = read_ipc(file_instance)
     elif filetype == "zip":
         df = read_zip(file_instance)
     else:
         raise ValueError(
-            "Unsupported file type. Only CSV and Excel, or ZIP files are supported."
+            "Unsupported file type. Only CSV, Excel, Parquet and Arrow, or ZIP files are supported."
         )
     return df
 
 
+def scan_csv(path: str) -> pl.LazyFrame:
+    """Lazy variant of read_csv, the file is only read when the frame is collected."""
+    with open(path, encoding="utf-8", errors="ignore") as f:
+        sample = f.read(2048)
+    delimiter = detect_delimiter_from_content(sample)
+    return pl.scan_csv(
+        path,
+        has_header=True,
+        ignore_errors=False,
+        truncate_ragged_lines=True,
+        separator=delimiter,
+    )
+
+
+def scan_zip(file_instance: T, directory: str) -> pl.LazyFrame:
+    """Lazy variant of read_zip.
+
+    scan_csv cannot read from the archive, so the CSV files are extracted to
+    the directory first. This is done in chunks, so a file is never fully in
+    memory. Excel files are read in full.
+    """
+    frames = []
+    with zipfile.ZipFile(file_instance.file) as z:
+        for index, name in enumerate(z.namelist()):
+            file_type = name.split(".")[-1]
+            if file_type == "csv":
+                path = os.path.join(directory, f"{index}.csv")
+                with z.open(name) as source, open(path, "wb") as target:
+                    shutil.copyfileobj(source, target)
+                frames.append(scan_csv(path))
+            elif file_type in ["xls", "xlsx"]:
+                with z.open(name) as file:
+                    frames.append(read_excel(file.read()).lazy())
+
+    if not frames:
+        raise ValueError("No CSV and no Excel files found in the zip archive.")
+
+    return pl.concat(frames)
+
+
+@contextmanager
+def file_to_lazy_df(file_instance: T) -> Iterator[pl.LazyFrame]:
+    """Lazy variant of file_to_df, for files that might not fit in memory.
+
+    Use as a context manager: the extracted files of a zip archive are
+    removed afterwards.
+    """
+    filetype = file_instance.file.name.split(".")[-1].lower()
+    with tempfile.TemporaryDirectory() as directory:
+        if filetype == "csv":
+            yield scan_csv(file_instance.file.path)
+        elif filetype in ["xls", "xlsx"]:
+            yield read_excel(file_instance).lazy()
+        elif filetype == "parquet":
+            yield pl.scan_parquet(file_instance.file.path)
+        elif filetype in ARROW_EXTENSIONS:
+            yield pl.scan_ipc(file_instance.file.path, memory_map=True)
+        elif filetype == "zip":
+            yield scan_zip(file_instance, directory)
+        else:
+            raise ValueError(
+                "Unsupported file type. Only CSV, Excel, Parquet and Arrow, or ZIP files are supported."
+            )
+
+
+def uploaded_file_to_df(uploaded_file: UploadedFile) -> pl.DataFrame:
+    """Variant of file_to_df for a file of a request, that is not stored on disk."""
+    filetype = uploaded_file.name.split(".")[-1].lower()
+    if filetype == "zip":
+        return read_zip(uploaded_file)
+
+    content = uploaded_file.read()
+    if filetype == "csv":
+        return read_csv(content)
+    elif filetype in ["xls", "xlsx"]:
+        return read_excel(content)
+    elif filetype == "parquet":
+        return read_parquet(content)
+    elif filetype in ARROW_EXTENSIONS:
+        return read_ipc(content)
+    raise ValueError(
+        "Unsupported file type. Only CSV, Excel, Parquet and Arrow, or ZIP files are supported."
+    )
+
+
+def file_error(error: str) -> dict[str, Any]:
+    """Reports an error that is not about a single row of the file."""
+    return {"row": None, "column": None, "value": None, "error": error}
+
+
+def row_errors(
+    df: pl.DataFrame, invalid: pl.Expr, column: str, error: str
+) -> list[dict[str, Any]]:
+    """Reports the rows of the file for which the invalid expression is true.
+
+    The row numbers are those of a spreadsheet: the header is row 1.
+    """
+    return (
+        df.with_row_index("row", offset=2)
+        .filter(invalid.fill_null(False))
+        .select(
+            pl.col("row"),
+            pl.lit(column).alias("column"),
+            pl.col(column).cast(pl.String).alias("value"),
+            pl.lit(error).alias("error"),
+        )
+        .to_dicts()
+    )
+
+
+def dry_run_report(nr_of_rows: int, errors: list[dict[str, Any]]) -> dict[str, Any]:
+    """The response of a bulk upload with dry_run, with at most MAX_DRY_RUN_ERRORS errors."""
+    errors = sorted(errors, key=lambda error: error["row"] or 0)
+    return {
+        "dry_run": True,
+        "valid": not errors,
+        "nr_of_rows": nr_of_rows,
+        "nr_of_errors": len(errors),
+        "errors": errors[:MAX_DRY_RUN_ERRORS],
+    }
+
+
+def bulk_create_upload_tasks(
+    upload_tasks: list[api_models.UploadTask],
+) -> list[api_models.UploadTask]:
+    """Inserts the upload tasks with one query and starts their upload workflows.
+
+    bulk_create does not send the pre_save and post_save signals of the
+    UploadTask. The status change of post_save_upload_task is therefore done
+    here, and the workflows are started as one celery group after the commit.
+    """
+    from api.tasks import dispatch_upload_tasks
+
+    pending_upload_tasks = [
+        upload_task
+        for upload_task in upload_tasks
+        if upload_task.status == "PENDING" and upload_task.data_owner
+    ]
+    for upload_task in pending_upload_tasks:
+        upload_task.status = "PROCESSING"
+        upload_task.progress = 10
+        upload_task.log = "Upload task started."
+
+    upload_tasks = api_models.UploadTask.objects.bulk_create(upload_tasks)
+    transaction.on_commit(lambda: dispatch_upload_tasks(pending_upload_tasks))
+    return upload_tasks
+
+
 def validate_xml_file(
     xml_file: str, bro_username: str, bro_password: str, project_number: str
 ) -> dict[str, Any]:
@@ -0,0 +1,158 @@
+import multiprocessing
+import os
+import resource
+import tempfile
+import threading
+import time
+
+import numpy as np
+import polars as pl
+from django.core.management.base import BaseCommand
+
+from api.bro_upload.gld_bulk_upload import (
+    _convert_and_check_df,
+    _measurements_per_bro_id,
+    _prepare_measurements_df,
+    _store_measurements,
+)
+from api.bro_upload.utils import read_csv, scan_csv
+
+
+def _write_measurements_csv(path: str, rows: int, wells: int) -> None:
+    """Writes a synthetic GLD bulk upload file, with 15 minute measurements per well."""
+    rows_per_well = rows // wells
+    start = np.datetime64("2015-01-01T00:00:00")
+    times = start + np.arange(rows_per_well) * np.timedelta64(15, "m")
+    df = pl.DataFrame(
+        {
+            "GLD": np.repeat(
+                [f"GLD{index:012d}" for index in range(wells)], rows_per_well
+            ),
+            "tijd": np.tile(times.astype("datetime64[s]").astype(str), wells),
+            "waarde": np.random.default_rng(0)
+            .normal(size=rows_per_well * wells)
+            .round(3),
+        }
+    ).with_columns(
+        pl.col("tijd").str.replace("T", " "),
+        pl.lit("goedgekeurd").alias("status"),
+        pl.lit(None, dtype=pl.String).alias("censuur"),
+        pl.lit(None, dtype=pl.String).alias("limiet"),
+    )
+    df.write_csv(path)
+
+
+def _ingest_eager(path: str, directory: str) -> int:
+    """The ingestion as it was: the whole file in one dataframe."""
+    df = _prepare_measurements_df(_convert_and_check_df(read_csv(path)))
+    partitions = df.partition_by("bro_id", as_dict=True, maintain_order=True)
+    return sum(len(partition) for partition in partitions.values())
+
+
+def _ingest_lazy(path: str, directory: str) -> int:
+    """The ingestion of the GLDBulkUploader: streamed, one BRO-ID at a time."""
+    _store_measurements(scan_csv(path), directory)
+    return sum(
+        len(df)
+        for _, df in _measurements_per_bro_id(
+            os.path.join(directory, "measurements.parquet")
+        )
+    )
+
+
+def _anonymous_memory() -> int:
+    """Returns the resident anonymous memory of this process in MB (Linux only).
+
+    polars memory-maps the files it reads. Those pages count in the peak
+    resident memory (ru_maxrss), but are page cache that the kernel can
+    reclaim, so they are left out here.
+    """
+    with open("/proc/self/status") as status:
+        for line in status:
+            if line.startswith("RssAnon:"):
+                return int(line.split()[1]) // 1024
+    return 0
+
+
+def _run(ingest, path: str, directory: str, results) -> None:
+    peak = _anonymous_memory()
+    done = threading.Event()
+
+    def sample():
+        nonlocal peak
+        while not done.wait(0.01):
+            peak = max(peak, _anonymous_memory())
+
+    sampler = threading.Thread(target=sample)
+    sampler.start()
+    start = time.perf_counter()
+    nr_of_measurements = ingest(path, directory)
+    duration = time.perf_counter() - start
+    done.set()
+    sampler.join()
+
+    results.put(
+        (
+            nr_of_measurements,
+            duration,
+            peak,
+            # Linux reports the peak resident memory in KB
+            resource.getrusage(resource.RUSAGE_SELF).ru_maxrss // 1024,
+        )
+    )
+
+
+INGESTIONS = {
+    "eager": _ingest_eager,
+    "lazy": _ingest_lazy,
+}
+
+
+class Command(BaseCommand):
+    """Reports the duration and peak memory of the GLD bulk upload ingestion."""
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "--rows",
+            type=int,
+            default=5_000_000,
+            help="Number of measurements in the synthetic file.",
+        )
+        parser.add_argument(
+            "--wells",
+            type=int,
+            default=50,
+            help="Number of BRO-IDs in the synthetic file.",
+        )
+        return super().add_arguments(parser)
+
+    def handle(self, *args, **options):
+        # Each ingestion runs in its own process, so the peak memory is its own
+        context = multiprocessing.get_context("fork")
+
+        with tempfile.TemporaryDirectory() as directory:
+            path = os.path.join(directory, "measurements.csv")
+            writer = context.Process(
+                target=_write_measurements_csv,
+                args=(path, options["rows"], options["wells"]),
+            )
+            writer.start()
+            writer.join()
+            self.stdout.write(
+                f"Wrote {options['rows']} measurements ({os.path.getsize(path) / 1024**2:.0f} MB)"
+            )
+
+            self.stdout.write(
+                f"{'mode':>6}  {'measurements':>12}  {'s':>6}  {'heap MB':>8}  {'rss MB':>8}"
+            )
+            for mode, ingest in INGESTIONS.items():
+                results = context.Queue()
+                process = context.Process(
+                    target=_run, args=(ingest, path, directory, results)
+                )
+                process.start()
+                nr_of_measurements, duration, peak, rss = results.get()
+                process.join()
+                self.stdout.write(
+                    f"{mode:>6}  {nr_of_measurements:>12}  {duration:>6.1f}  {peak:>8}  {rss:>8}"
+                )
@@ -0,0 +1,202 @@
+import datetime
+import random
+import time
+
+from django.core.management.base import BaseCommand
+from django.db import connection, transaction
+
+FIRST_MEASUREMENT = datetime.datetime(2015, 1, 1, tzinfo=datetime.UTC)
+INTERVAL = datetime.timedelta(minutes=15)
+
+# The measurement table before gld migration 0011
+OLD_SCHEMA = """
+CREATE TEMPORARY TABLE benchmark_tvp_old (
+    uuid uuid PRIMARY KEY,
+    observation_id uuid NOT NULL,
+    time varchar(100) NOT NULL,
+    value double precision,
+    status_quality_control varchar(100),
+    censoring_reason varchar(100),
+    censoring_limit varchar(100),
+    created timestamptz NOT NULL,
+    updated timestamptz NOT NULL,
+    data_owner_id uuid NOT NULL
+);
+CREATE INDEX ON benchmark_tvp_old (observation_id);
+CREATE INDEX ON benchmark_tvp_old (data_owner_id);
+CREATE INDEX ON benchmark_tvp_old (data_owner_id, created, uuid);
+"""
+
+NEW_SCHEMA = """
+CREATE TEMPORARY TABLE benchmark_tvp_new (
+    id bigint GENERATED BY DEFAULT AS IDENTITY PRIMARY KEY,
+    observation_id uuid NOT NULL,
+    time timestamptz NOT NULL,
+    value double precision,
+    status_quality_control varchar(100),
+    censoring_reason varchar(100),
+    censoring_limit varchar(100)
+);
+CREATE INDEX ON benchmark_tvp_new (observation_id, time);
+CREATE INDEX ON benchmark_tvp_new USING brin (time);
+"""
+
+OBSERVATIONS = """
+CREATE TEMPORARY TABLE benchmark_observations AS
+SELECT gen_random_uuid() AS uuid FROM generate_series(1, %(observations)s);
+"""
+
+# 15 minute measurements from 2015 onwards, per observation
+FILL_OLD = """
+INSERT INTO benchmark_tvp_old
+SELECT
+    gen_random_uuid(),
+    observation.uuid,
+    to_char(moment AT TIME ZONE 'UTC', 'YYYY-MM-DD"T"HH24:MI:SS"Z"'),
+    random(),
+    'goedgekeurd',
+    NULL,
+    NULL,
+    now(),
+    now(),
+    %(data_owner)s
+FROM benchmark_observations observation,
+    generate_series(
+        timestamptz '2015-01-01 00:00Z',
+        timestamptz '2015-01-01 00:00Z' + (%(per_observation)s - 1) * interval '15 minutes',
+        interval '15 minutes'
+    ) moment;
+"""
+
+FILL_NEW = """
+INSERT INTO benchmark_tvp_new
+    (observation_id, time, value, status_quality_control)
+SELECT
+    observation_id,
+    time::timestamptz,
+    value,
+    status_quality_control
+FROM benchmark_tvp_old
+ORDER BY observation_id, time;
+"""
+
+RANGE_QUERIES = {
+    "old": (
+        "SELECT time, value FROM benchmark_tvp_old "
+        "WHERE observation_id = %s AND time >= %s AND time < %s ORDER BY time"
+    ),
+    "new": (
+        "SELECT time, value FROM benchmark_tvp_new "
+        "WHERE observation_id = %s AND time >= %s AND time < %s ORDER BY time"
+    ),
+}
+
+
+class Command(BaseCommand):
+    """Compares the table size and time range query latency of the old and new measurement schema.
+
+    Both schemas are filled with the same synthetic measurements, in
+    temporary tables that are dropped afterwards.
+    """
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "--observations",
+            type=int,
+            default=20,
+            help="Number of observations in the synthetic data.",
+        )
+        parser.add_argument(
+            "--measurements",
+            type=int,
+            default=35040,
+            help="Number of 15 minute measurements per observation (35040 is a year).",
+        )
+        parser.add_argument(
+            "--repeat",
+            type=int,
+            default=50,
+            help="Number of range queries per schema.",
+        )
+        return super().add_arguments(parser)
+
+    def handle(self, *args, **options):
+        observations = options["observations"]
+        per_observation = options["measurements"]
+        repeat = options["repeat"]
+
+        with transaction.atomic(), connection.cursor() as cursor:
+            cursor.execute(OLD_SCHEMA)
+            cursor.execute(NEW_SCHEMA)
+            cursor.execute(OBSERVATIONS, {"observations": observations})
+
+            start = time.perf_counter()
+            cursor.execute(
+                FILL_OLD,
+                {
+                    "per_observation": per_observation,
+                    "data_owner": "00000000-0000-0000-0000-000000000000",
+                },
+            )
+            cursor.execute(FILL_NEW)
+            cursor.execute("ANALYZE benchmark_tvp_old")
+            cursor.execute("ANALYZE benchmark_tvp_new")
+            self.stdout.write(
+                f"Generated {observations * per_observation} measurements per schema "
+                f"in {time.perf_counter() - start:.1f} s"
+            )
+
+            cursor.execute("SELECT uuid FROM benchmark_observations")
+            observation_ids = [row[0] for row in cursor.fetchall()]
+            windows = [self._window(per_observation) for _ in range(repeat)]
+
+            self.stdout.write(
+                f"{'schema':>6}  {'table MB':>9}  {'index MB':>9}  {'ms/query':>9}"
+            )
+            for schema, query in RANGE_QUERIES.items():
+                table_mb, index_mb = self._size(cursor, f"benchmark_tvp_{schema}")
+                duration = self._time_queries(
+                    cursor, query, schema, observation_ids, windows
+                )
+                self.stdout.write(
+                    f"{schema:>6}  {table_mb:>9.1f}  {index_mb:>9.1f}  {duration * 1000:>9.2f}"
+                )
+
+            transaction.set_rollback(True)
+
+    def _window(self, per_observation: int) -> tuple[int, int]:
+        """A random window of about a month, as offsets in 15 minute steps."""
+        length = min(per_observation, 30 * 96)
+        begin = random.randint(0, per_observation - length)
+        return begin, begin + length
+
+    def _size(self, cursor, table: str) -> tuple[float, float]:
+        cursor.execute(
+            "SELECT pg_table_size(%s::regclass), pg_indexes_size(%s::regclass)",
+            [table, table],
+        )
+        table_size, index_size = cursor.fetchone()
+        return table_size / 1024**2, index_size / 1024**2
+
+    def _time_queries(
+        self,
+        cursor,
+        query: str,
+        schema: str,
+        observation_ids: list,
+        windows: list[tuple[int, int]],
+    ) -> float:
+        parameters = []
+        for begin, end in windows:
+            begin_time = FIRST_MEASUREMENT + begin * INTERVAL
+            end_time = FIRST_MEASUREMENT + end * INTERVAL
+            if schema == "old":
+                begin_time = begin_time.strftime("%Y-%m-%dT%H:%M:%SZ")
+                end_time = end_time.strftime("%Y-%m-%dT%H:%M:%SZ")
+            parameters.append((random.choice(observation_ids), begin_time, end_time))
+
+        start = time.perf_counter()
+        for parameter in parameters:
+            cursor.execute(query, parameter)
+            cursor.fetchall()
+        return (time.perf_counter() - start) / len(parameters)
@@ -0,0 +1,119 @@
+import logging
+import time
+
+from django.core.management.base import BaseCommand
+
+from api.bro_upload.template_registry import registry
+
+logger = logging.getLogger("general")
+
+
+def _gld_addition_payload(size: int) -> dict:
+    return {
+        "observationId": "_benchmark",
+        "observationProcessId": "_benchmark_process",
+        "measurementTimeseriesId": "_benchmark_timeseries",
+        "validationStatus": "voorlopig",
+        "investigatorKvk": "12345678",
+        "observationType": "reguliereMeting",
+        "evaluationProcedure": "oordeelDeskundige",
+        "measurementInstrumentType": "druksensor",
+        "beginPosition": "2024-01-01",
+        "endPosition": "2024-12-31",
+        "resultTime": "2025-01-01T00:00:00+01:00",
+        "timeValuePairs": [
+            {
+                "time": f"2024-01-01T00:{index % 60:02d}:00+01:00",
+                "value": 1.234,
+                "statusQualityControl": "goedgekeurd",
+                "censorReason": None,
+                "censoringLimitvalue": None,
+            }
+            for index in range(size)
+        ],
+    }
+
+
+def _gmn_startregistration_payload(size: int) -> dict:
+    return {
+        "objectIdAccountableParty": "benchmark",
+        "name": "benchmark",
+        "deliveryContext": "kaderrichtlijnWater",
+        "monitoringPurpose": "strategischBeheerKwaliteitRegionaal",
+        "groundwaterAspect": "kwantiteit",
+        "startDateMonitoring": "2024-01-01",
+        "measuringPoints": [
+            {
+                "measuringPointCode": f"GMW{index:012d}",
+                "broId": f"GMW{index:012d}",
+                "tubeNumber": "1",
+            }
+            for index in range(size)
+        ],
+    }
+
+
+# Registration types with a list in the sourcedocument that scales with the delivery
+SAMPLE_PAYLOADS = {
+    "registration_GLD_Addition.html": _gld_addition_payload,
+    "registration_GMN_StartRegistration.html": _gmn_startregistration_payload,
+}
+
+METADATA = {
+    "requestReference": "benchmark",
+    "deliveryAccountableParty": "12345678",
+    "broId": "GMW000000000001",
+    "qualityRegime": "IMBRO",
+}
+
+
+class Command(BaseCommand):
+    """Reports the render time of the upload templates, per registration type and payload size."""
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "--sizes",
+            type=str,
+            default="1,100,10000,100000",
+            help="Comma separated list of payload sizes for the scaling registration types.",
+        )
+        parser.add_argument(
+            "--repeat",
+            type=int,
+            default=5,
+            help="Number of renders per template and payload size.",
+        )
+        return super().add_arguments(parser)
+
+    def handle(self, *args, **options):
+        sizes = sorted(int(size) for size in options["sizes"].split(","))
+        repeat = options["repeat"]
+
+        start = time.perf_counter()
+        registry.load()
+        self.stdout.write(
+            f"Compiled {len(registry.templates)} templates in {(time.perf_counter() - start) * 1000:.1f} ms"
+        )
+
+        results = []
+        for name in registry.templates:
+            payload_factory = SAMPLE_PAYLOADS.get(name)
+            if payload_factory is None:
+                results.append((0, name, self._time_render(name, {}, repeat)))
+                continue
+
+            for size in sizes:
+                results.append(
+                    (size, name, self._time_render(name, payload_factory(size), repeat))
+                )
+
+        self.stdout.write(f"{'points':>8}  {'ms/render':>10}  template")
+        for size, name, duration in sorted(results):
+            self.stdout.write(f"{size:>8}  {duration * 1000:>10.3f}  {name}")
+
+    def _time_render(self, name: str, sourcedocs_data: dict, repeat: int) -> float:
+        context = {"metadata": METADATA, "sourcedocs_data": sourcedocs_data}
+        start = time.perf_counter()
+        for _ in range(repeat):
+            registry.render(name, context)
+        return (time.perf_counter() - start) / repeat
@@ -0,0 +1,51 @@
+from django.conf import settings
+from django.core.management.base import BaseCommand
+
+from gld.models import Observation
+from gld.series import STORAGES, get_series_storage
+
+
+class Command(BaseCommand):
+    """Copies the GLD measurements from one storage to the other.
+
+    Run it before changing GLD_SERIES_STORAGE, with the new storage as
+    --to. The measurements in the old storage are kept, so the setting can
+    be changed back.
+    """
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "--to",
+            choices=list(STORAGES),
+            required=True,
+            help="The storage to copy the measurements to.",
+        )
+        parser.add_argument(
+            "--from",
+            dest="source",
+            choices=list(STORAGES),
+            help="The storage to copy from, defaults to GLD_SERIES_STORAGE.",
+        )
+        return super().add_arguments(parser)
+
+    def handle(self, *args, **options):
+        source = get_series_storage(options["source"] or settings.GLD_SERIES_STORAGE)
+        target = get_series_storage(options["to"])
+        if source.name == target.name:
+            self.stderr.write(f"Both storages are {source.name!r}, nothing to copy")
+            return
+
+        observations = Observation.objects.filter(source.exists_subquery()).values_list(
+            "uuid", flat=True
+        )
+        copied = total = 0
+        for observation in observations.iterator():
+            series = source.read(observation)
+            target.write(observation, series)
+            copied += 1
+            total += len(series)
+
+        self.stdout.write(
+            f"Copied {total} measurements of {copied} observations "
+            f"from {source.name} to {target.name}"
+        )
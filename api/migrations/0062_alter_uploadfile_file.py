@@ -0,0 +1,32 @@
+# Generated by Django 5.2.7 on 2026-10-19 09:12
+
+import django.core.validators
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+    dependencies = [
+        ("api", "0061_alter_uploadtask_registration_type"),
+    ]
+
+    operations = [
+        migrations.AlterField(
+            model_name="uploadfile",
+            name="file",
+            field=models.FileField(
+                upload_to="bulk_uploads/",
+                validators=[
+                    django.core.validators.FileExtensionValidator(
+                        allowed_extensions=[
+                            "csv",
+                            "xls",
+                            "xlsx",
+                            "parquet",
+                            "arrow",
+                            "feather",
+                        ]
+                    )
+                ],
+            ),
+        ),
+    ]
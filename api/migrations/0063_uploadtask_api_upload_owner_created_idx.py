@@ -0,0 +1,19 @@
+# Generated by Django 5.2.7 on 2026-10-19 12:20
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+    dependencies = [
+        ("api", "0062_alter_uploadfile_file"),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name="uploadtask",
+            index=models.Index(
+                fields=["data_owner", "created", "uuid"],
+                name="api_upload_owner_created_idx",
+            ),
+        ),
+    ]
@@ -0,0 +1,33 @@
+# Generated by Django 5.2.7 on 2026-10-19 13:41
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+    dependencies = [
+        ("api", "0063_uploadtask_api_upload_owner_created_idx"),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name="importtask",
+            index=models.Index(
+                fields=["data_owner", "updated"],
+                name="api_import_owner_updated_idx",
+            ),
+        ),
+        migrations.AddIndex(
+            model_name="uploadtask",
+            index=models.Index(
+                fields=["data_owner", "updated"],
+                name="api_upload_owner_updated_idx",
+            ),
+        ),
+        migrations.AddIndex(
+            model_name="bulkupload",
+            index=models.Index(
+                fields=["data_owner", "updated"],
+                name="api_bulk_owner_updated_idx",
+            ),
+        ),
+    ]
@@ -1,11 +1,18 @@
+import hashlib
 from typing import Any
 
-from django.db.models import QuerySet
+from django.db.models import Count, JSONField, Max, Model, QuerySet, TextField
 from django.http import HttpRequest, HttpResponse
+from django.utils.http import parse_etags, quote_etag
 from django_filters import rest_framework as filters
+from rest_framework import status
+from rest_framework.permissions import SAFE_METHODS
+from rest_framework.request import Request
+from rest_framework.response import Response
 from rest_framework.reverse import reverse
 
 from api import models as api_models
+from api.progress import get_cached_progress
 
 
 class UserOrganizationMixin:
@@ -20,6 +27,167 @@ class UserOrganizationMixin:
         return queryset.filter(data_owner=user_organization)
 
 
+class SparseFieldsMixin:
+    """
+    Mixin for list and detail views to return a subset of the fields.
+
+    With ?fields=a,b only those fields are returned, with ?omit=c,d all
+    fields except those. The dropped fields are removed from the serializer,
+    so their SerializerMethodFields do not run, and the JSON and text columns
+    that are not serialized are deferred, so they are not fetched at all.
+    """
+
+    request: Any
+    fields_query_param = "fields"
+    omit_query_param = "omit"
+
+    def _query_param_list(self, name: str) -> set[str]:
+        value = self.request.query_params.get(name, "")
+        return {field.strip() for field in value.split(",") if field.strip()}
+
+    def is_sparse_request(self) -> bool:
+        return (
+            self.request is not None
+            and self.request.method in SAFE_METHODS
+            and bool(
+                self._query_param_list(self.fields_query_param)
+                or self._query_param_list(self.omit_query_param)
+            )
+        )
+
+    def get_sparse_field_names(self, field_names: Any) -> set[str]:
+        """Returns the names of the serializer fields to keep."""
+        keep = set(field_names)
+        fields = self._query_param_list(self.fields_query_param)
+        if fields:
+            keep &= fields
+        return keep - self._query_param_list(self.omit_query_param)
+
+    def get_serializer(self, *args: Any, **kwargs: Any) -> Any:
+        serializer = super().get_serializer(*args, **kwargs)  # type: ignore
+        if not self.is_sparse_request():
+            return serializer
+
+        target = getattr(serializer, "child", serializer)
+        keep = self.get_sparse_field_names(target.fields)
+        for name in list(target.fields):
+            if name not in keep:
+                target.fields.pop(name)
+        return serializer
+
+    def get_queryset(self) -> QuerySet:
+        queryset = super().get_queryset()  # type: ignore
+        if not self.is_sparse_request():
+            return queryset
+
+        serializer_fields = self.get_serializer_class()().fields  # type: ignore
+        keep = self.get_sparse_field_names(serializer_fields)
+        # A SerializerMethodField has "*" as source, it reads the model field
+        # with its own name, like GLDSerializer.get_linked_gmns
+        sources = {
+            name if field.source == "*" else field.source.split(".")[0]
+            for name, field in serializer_fields.items()
+            if name in keep
+        }
+        deferred = [
+            field.name
+            for field in queryset.model._meta.concrete_fields
+            if isinstance(field, (JSONField, TextField)) and field.name not in sources
+        ]
+        return queryset.defer(*deferred) if deferred else queryset
+
+
+class ConditionalGetMixin:
+    """
+    Mixin for list and detail views to answer If-None-Match with a 304.
+
+    The ETag of a list is derived from the number of objects and the last
+    `updated` of the filtered queryset, the ETag of a detail view from the
+    `updated` of the object. Both are checked with one small query, before
+    anything is serialized.
+
+    Changes to related objects do not touch `updated`, like a new tube of a
+    GMW. Views that show related data, e.g. as annotated counts, list those
+    models in etag_related_models: the last `updated` and the number of rows
+    of each of those tables are part of the ETag too, one query per model.
+    """
+
+    etag_field = "updated"
+    etag_related_models: tuple[type[Model], ...] = ()
+
+    def get_related_validators(self) -> list[Any]:
+        parts = []
+        for model in self.etag_related_models:
+            validator = model.objects.order_by().aggregate(
+                last_updated=Max(self.etag_field), count=Count("pk")
+            )
+            parts += [validator["last_updated"], validator["count"]]
+        return parts
+
+    def make_etag(self, request: Request, *parts: Any) -> str:
+        key = "|".join(
+            str(part)
+            for part in (
+                request.get_full_path(),
+                request.META.get("HTTP_ACCEPT", ""),
+                request.user.pk,
+                *parts,
+            )
+        )
+        return quote_etag(hashlib.md5(key.encode()).hexdigest())
+
+    def get_list_etag(self, request: Request) -> str:
+        queryset = self.filter_queryset(self.get_queryset())  # type: ignore
+        validator = queryset.order_by().aggregate(
+            last_updated=Max(self.etag_field), count=Count("pk")
+        )
+        return self.make_etag(
+            request,
+            validator["last_updated"],
+            validator["count"],
+            *self.get_related_validators(),
+        )
+
+    def get_detail_etag(self, request: Request, **kwargs: Any) -> str | None:
+        queryset = self.filter_queryset(self.get_queryset())  # type: ignore
+        lookup_url_kwarg = self.lookup_url_kwarg or self.lookup_field  # type: ignore
+        lookup = {self.lookup_field: kwargs[lookup_url_kwarg]}  # type: ignore
+        row = queryset.filter(**lookup).values_list("pk", self.etag_field).first()
+        if row is None:
+            # Let the view answer with its 404
+            return None
+
+        pk, updated = row
+        parts = [updated, *self.get_related_validators()]
+        if issubclass(self.get_serializer_class(), CachedProgressMixin):  # type: ignore
+            # The progress of a running task is only updated in the cache
+            parts.append(get_cached_progress(queryset.model(pk=pk)))
+        return self.make_etag(request, *parts)
+
+    def not_modified(self, request: Request, etag: str | None) -> bool:
+        if etag is None:
+            return False
+        etags = parse_etags(request.headers.get("If-None-Match", ""))
+        return "*" in etags or etag in etags
+
+    def list(self, request: Request, *args: Any, **kwargs: Any) -> Response:
+        etag = self.get_list_etag(request)
+        if self.not_modified(request, etag):
+            return Response(status=status.HTTP_304_NOT_MODIFIED, headers={"ETag": etag})
+        response = super().list(request, *args, **kwargs)  # type: ignore
+        response["ETag"] = etag
+        return response
+
+    def retrieve(self, request: Request, *args: Any, **kwargs: Any) -> Response:
+        etag = self.get_detail_etag(request, **kwargs)
+        if self.not_modified(request, etag):
+            return Response(status=status.HTTP_304_NOT_MODIFIED, headers={"ETag": etag})
+        response = super().retrieve(request, *args, **kwargs)  # type: ignore
+        if etag is not None:
+            response["ETag"] = etag
+        return response
+
+
 class UrlFieldMixin:
     """
     Mixin to add a URL field to serialized data.
@@ -58,6 +226,28 @@ class UrlFieldMixin:
         return data
 
 
+class CachedProgressMixin:
+    """
+    Mixin to show the live progress of a running task on its detail endpoint.
+
+    The workers publish their progress to the cache on every step, and only
+    write it to the database once in a while.
+    """
+
+    context: dict[str, Any]
+
+    def to_representation(self, instance: Any) -> dict[str, Any]:
+        data = super().to_representation(instance)  # type: ignore
+
+        view = self.context.get("view", None)
+        is_detail_view = hasattr(view, "action") and view.action == "retrieve"
+        if is_detail_view and instance.status == "PROCESSING":
+            cached_progress = get_cached_progress(instance)
+            if cached_progress:
+                data["progress"] = cached_progress["progress"]
+        return data
+
+
 class RequiredFieldsMixin:
     fields: Any
 
@@ -211,6 +211,15 @@ class ImportTask(models.Model):
     def __str__(self) -> str:
         return f"{self.bro_domain} import - {self.data_owner}"
 
+    class Meta:
+        indexes = [
+            # Validator for the ETag of the list
+            models.Index(
+                fields=["data_owner", "updated"],
+                name="api_import_owner_updated_idx",
+            ),
+        ]
+
 
 class UploadTask(models.Model):
     uuid = models.UUIDField(primary_key=True, default=uuid.uuid4, editable=False)
@@ -243,6 +252,20 @@ class UploadTask(models.Model):
     def __str__(self) -> str:
         return f"{self.data_owner}: {self.registration_type} ({self.request_type})"
 
+    class Meta:
+        indexes = [
+            # Keyset for ?pagination=cursor
+            models.Index(
+                fields=["data_owner", "created", "uuid"],
+                name="api_upload_owner_created_idx",
+            ),
+            # Validator for the ETag of the list
+            models.Index(
+                fields=["data_owner", "updated"],
+                name="api_upload_owner_updated_idx",
+            ),
+        ]
+
 
 class BulkUpload(models.Model):
     uuid = models.UUIDField(primary_key=True, default=uuid.uuid4, editable=False)
@@ -281,6 +304,15 @@ class BulkUpload(models.Model):
     def __str__(self) -> str:
         return f"{self.data_owner}: Bulk upload {self.bulk_upload_type}"
 
+    class Meta:
+        indexes = [
+            # Validator for the ETag of the list
+            models.Index(
+                fields=["data_owner", "updated"],
+                name="api_bulk_owner_updated_idx",
+            ),
+        ]
+
 
 class UploadFile(models.Model):
     uuid = models.UUIDField(primary_key=True, default=uuid.uuid4, editable=False)
@@ -291,7 +323,11 @@ class UploadFile(models.Model):
     bulk_upload = models.ForeignKey(BulkUpload, on_delete=models.CASCADE, blank=True)
     file = models.FileField(
         upload_to="bulk_uploads/",
-        validators=[FileExtensionValidator(allowed_extensions=["csv", "xls", "xlsx"])],
+        validators=[
+            FileExtensionValidator(
+                allowed_extensions=["csv", "xls", "xlsx", "parquet", "arrow", "feather"]
+            )
+        ],
     )
 
     def __str__(self) -> str:
@@ -0,0 +1,84 @@
+from typing import Any
+
+from django.db.models import QuerySet
+from rest_framework.exceptions import ValidationError
+from rest_framework.pagination import CursorPagination, PageNumberPagination
+from rest_framework.request import Request
+from rest_framework.response import Response
+
+
+class CreatedCursorPagination(CursorPagination):
+    """Cursor pagination on the creation time.
+
+    Pages are fetched with a WHERE on the creation time of the previous page
+    instead of an OFFSET, and without a COUNT(*), so deep pages are as fast
+    as the first one. New objects end up on the last page. The cursor only
+    holds the creation time: objects created at the same time are skipped
+    with an offset, for which the uuid keeps their order stable.
+    """
+
+    ordering = ("created", "uuid")
+    # The fields of ordering, that the model of the list needs
+    required_fields = {"created", "uuid"}
+
+    @classmethod
+    def supports(cls, model: Any) -> bool:
+        return cls.required_fields <= {field.name for field in model._meta.fields}
+
+
+class BrostarPagination(PageNumberPagination):
+    """Page number pagination, or cursor pagination with ?pagination=cursor.
+
+    The default stays page numbers, for clients that need a count or jump to
+    a page. Sync scripts that walk through a whole endpoint should use the
+    cursor, and follow the next links. The cursor is only offered on the
+    lists of models with the fields of the cursor pagination class.
+    """
+
+    pagination_query_param = "pagination"
+    cursor_pagination_class = CreatedCursorPagination
+
+    def __init__(self) -> None:
+        super().__init__()
+        self.cursor_paginator: CursorPagination | None = None
+
+    def paginate_queryset(
+        self, queryset: QuerySet, request: Request, view: Any = None
+    ) -> list | None:
+        if request.query_params.get(self.pagination_query_param) == "cursor":
+            if not self.cursor_pagination_class.supports(queryset.model):
+                raise ValidationError(
+                    {
+                        self.pagination_query_param: "Cursor pagination is not supported here."
+                    }
+                )
+            self.cursor_paginator = self.cursor_pagination_class()
+            return self.cursor_paginator.paginate_queryset(queryset, request, view)
+        return super().paginate_queryset(queryset, request, view)
+
+    def get_paginated_response(self, data: Any) -> Response:
+        if self.cursor_paginator is not None:
+            return self.cursor_paginator.get_paginated_response(data)
+        return super().get_paginated_response(data)
+
+    def get_schema_operation_parameters(self, view: Any) -> list[dict[str, Any]]:
+        parameters = super().get_schema_operation_parameters(view)
+        queryset = getattr(view, "queryset", None)
+        if queryset is None or not self.cursor_pagination_class.supports(
+            queryset.model
+        ):
+            return parameters
+
+        parameters.append(
+            {
+                "name": self.pagination_query_param,
+                "required": False,
+                "in": "query",
+                "description": "Set to 'cursor' for cursor based pagination.",
+                "schema": {"type": "string", "enum": ["cursor"]},
+            }
+        )
+        parameters.extend(
+            self.cursor_pagination_class().get_schema_operation_parameters(view)
+        )
+        return parameters
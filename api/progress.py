@@ -0,0 +1,112 @@
+import logging
+import time
+from typing import Any
+
+from django.conf import settings
+from django.core.cache import cache
+from django.db import models
+
+logger = logging.getLogger("general")
+
+# Cached progress expires on its own when a worker dies halfway through a task
+PROGRESS_CACHE_TIMEOUT = 60 * 60 * 24
+
+
+def progress_cache_key(instance: models.Model) -> str:
+    return f"progress:{instance._meta.label_lower}:{instance.pk}"
+
+
+def get_cached_progress(instance: models.Model) -> dict[str, Any] | None:
+    """Returns the progress published for a running task, if present."""
+    try:
+        return cache.get(progress_cache_key(instance))
+    except Exception as e:
+        logger.warning(f"Failed to read the progress of {instance.pk}: {e}")
+        return None
+
+
+class ProgressReporter:
+    """Reports the progress of a BulkUpload or ImportTask while it runs.
+
+    The uploaders and importers used to save the task once per row, which
+    means thousands of UPDATEs on a row that the frontend is polling. This
+    keeps the counters in memory instead: every step is published to the
+    cache, and the database is only written when the progress moved at
+    least `flush_step` percent, or `flush_interval` seconds passed since
+    the previous write.
+
+    The progress runs from `start` to `end` in `total` steps.
+    """
+
+    def __init__(
+        self,
+        instance: models.Model,
+        total: int,
+        start: float = 0.0,
+        end: float = 100.0,
+        flush_interval: float | None = None,
+        flush_step: float | None = None,
+    ) -> None:
+        self.instance = instance
+        self.total = max(total, 1)
+        self.start = start
+        self.end = end
+        self.flush_interval = (
+            settings.PROGRESS_FLUSH_INTERVAL
+            if flush_interval is None
+            else flush_interval
+        )
+        self.flush_step = (
+            settings.PROGRESS_FLUSH_STEP if flush_step is None else flush_step
+        )
+
+        self.done = 0
+        self.instance.progress = start
+        self.flushed_progress = start
+        self.flushed_at = time.monotonic()
+
+    @property
+    def progress(self) -> float:
+        return round(self.start + (self.end - self.start) * self.done / self.total, 2)
+
+    def advance(self, steps: int = 1) -> None:
+        """Counts finished steps, and publishes or flushes when needed."""
+        self.done = min(self.done + steps, self.total)
+        self.instance.progress = self.progress
+        self.publish()
+
+        if (
+            self.instance.progress - self.flushed_progress >= self.flush_step
+            or time.monotonic() - self.flushed_at >= self.flush_interval
+        ):
+            self.flush()
+
+    def publish(self) -> None:
+        """Writes the current progress to the cache, for cheap reads by the API."""
+        try:
+            cache.set(
+                progress_cache_key(self.instance),
+                {
+                    "status": self.instance.status,
+                    "progress": self.instance.progress,
+                },
+                PROGRESS_CACHE_TIMEOUT,
+            )
+        except Exception as e:
+            # The database stays the source of truth, so this is not fatal
+            logger.warning(f"Failed to publish the progress of {self.instance.pk}: {e}")
+
+    def flush(self, *fields: str) -> None:
+        """Saves the progress, and any other given fields, to the database."""
+        self.instance.save(update_fields=["progress", "updated", *fields])
+        self.flushed_progress = self.instance.progress
+        self.flushed_at = time.monotonic()
+        logger.info(f"At {self.instance.progress}% of {self.instance.pk}.")
+
+    def finish(self, *fields: str) -> None:
+        """Saves the final state, after which the database is leading again."""
+        self.instance.save(update_fields=["progress", "status", "updated", *fields])
+        try:
+            cache.delete(progress_cache_key(self.instance))
+        except Exception as e:
+            logger.warning(f"Failed to clear the progress of {self.instance.pk}: {e}")
@@ -3,7 +3,7 @@ from rest_framework import serializers
 
 from api import models as api_models
 
-from .mixins import UrlFieldMixin
+from .mixins import CachedProgressMixin, UrlFieldMixin
 
 
 class UserSerializer(serializers.ModelSerializer):
@@ -49,7 +49,9 @@ class UserLoggedInSerializer(serializers.Serializer):
     bro_credentials_set = serializers.BooleanField()
 
 
-class ImportTaskSerializer(UrlFieldMixin, serializers.ModelSerializer):
+class ImportTaskSerializer(
+    CachedProgressMixin, UrlFieldMixin, serializers.ModelSerializer
+):
     class Meta:
         model = api_models.ImportTask
         fields = "__all__"
@@ -120,7 +122,9 @@ class UploadTaskOverviewSerializer(UrlFieldMixin, serializers.ModelSerializer):
         ]
 
 
-class BulkUploadSerializer(UrlFieldMixin, serializers.ModelSerializer):
+class BulkUploadSerializer(
+    CachedProgressMixin, UrlFieldMixin, serializers.ModelSerializer
+):
     fieldwork_file = serializers.FileField(write_only=True, required=False)
     lab_file = serializers.FileField(write_only=True, required=False)
     measurement_tvp_file = serializers.FileField(write_only=True, required=False)
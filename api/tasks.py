@@ -1,7 +1,7 @@
 import logging
 from logging import getLogger
 
-from celery import chain, shared_task
+from celery import chain, group, shared_task
 
 import api.models as api_models
 from api.bro_import import bulk_import
@@ -12,6 +12,7 @@ from api.bro_upload.gmn_bulk_upload import GMNBulkUploader
 from api.bro_upload.object_upload import (
     XMLGenerator,
 )
+from gmw import geojson
 
 logger = logging.getLogger("general")
 
@@ -242,6 +243,16 @@ def import_bro_data_task(import_task_instance_uuid: str) -> None:
         logger.info(f"Error during bulk-import: {e}")
 
 
+@shared_task(queue="default")
+def rebuild_gmw_geojson_task(organisation_uuid: str) -> None:
+    """Rebuilds the cached GMW GeoJSON of an organisation after its GMWs changed.
+
+    Scheduled by gmw.geojson.invalidate_geojson, so no user request has to
+    wait for the collection after an import or upload.
+    """
+    geojson.rebuild_geojson(organisation_uuid)
+
+
 def convert_error_to_bro_error(error_message: str):
     if error_message.__contains__("404 Client Error"):
         return "Projectnummer klopt waarschijnlijk niet. Controleer deze."
@@ -282,6 +293,26 @@ def handle_task_error(request, exc, traceback, upload_task_instance_uuid, step_n
     return None
 
 
+def upload_workflow(
+    upload_task_instance_uuid: str,
+    bro_username: str,
+    bro_password: str,
+) -> chain:
+    """Celery chain that validates, delivers and checks the delivery of one upload task."""
+    # Add error handling to each task using .on_error()
+    return chain(
+        validate_xml_file_task.s(upload_task_instance_uuid, bro_username, bro_password)
+        .set(queue="upload")
+        .on_error(handle_task_error.s(upload_task_instance_uuid, "validate_xml")),
+        deliver_xml_file_task.s()
+        .set(queue="upload")
+        .on_error(handle_task_error.s(upload_task_instance_uuid, "deliver_xml")),
+        check_delivery_status_task.s()
+        .set(queue="upload")
+        .on_error(handle_task_error.s(upload_task_instance_uuid, "check_delivery")),
+    )
+
+
 def upload_task(
     upload_task_instance_uuid: str,
     bro_username: str,
@@ -302,21 +333,29 @@ def upload_task(
     task.log = "Upload task started."
     task.save(update_fields=["progress", "log"])
 
-    # Add error handling to each task using .on_error()
-    workflow = chain(
-        validate_xml_file_task.s(upload_task_instance_uuid, bro_username, bro_password)
-        .set(queue="upload")
-        .on_error(handle_task_error.s(upload_task_instance_uuid, "validate_xml")),
-        deliver_xml_file_task.s()
-        .set(queue="upload")
-        .on_error(handle_task_error.s(upload_task_instance_uuid, "deliver_xml")),
-        check_delivery_status_task.s()
-        .set(queue="upload")
-        .on_error(handle_task_error.s(upload_task_instance_uuid, "check_delivery")),
-    )
+    workflow = upload_workflow(upload_task_instance_uuid, bro_username, bro_password)
     workflow.apply_async(queue="upload")
 
 
+def dispatch_upload_tasks(upload_tasks: list[api_models.UploadTask]) -> None:
+    """Starts the upload workflows of multiple upload tasks as one celery group.
+
+    Used for upload tasks that are created with bulk_create, which does not
+    send the post_save signal that normally starts the upload_task.
+    """
+    workflows = [
+        upload_workflow(
+            upload_task.uuid,
+            upload_task.data_owner.bro_user_token,
+            upload_task.data_owner.bro_user_password,
+        )
+        for upload_task in upload_tasks
+        if upload_task.data_owner
+    ]
+    if workflows:
+        group(workflows).apply_async(queue="upload")
+
+
 @shared_task(queue="upload")
 def gar_bulk_upload_task(
     bulk_upload_instance_uuid: str,
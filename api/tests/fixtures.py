@@ -106,16 +106,16 @@ def tube(organisation, gmw):
         data_owner=organisation,
         gmw=gmw,
         tube_number="1",
-        tube_top_diameter="50",
+        tube_top_diameter=50,
         sediment_sump_present="nee",
         artesian_well_cap_present="ja",
         tube_type="standaardbuis",
         tube_status="gebruiksklaar",
-        tube_top_position="1.5",
+        tube_top_position=1.5,
         tube_top_positioning_method="AHN4",
-        screen_top_position="-10.0",
-        screen_bottom_position="-11.0",
-        plain_tube_part_length="12.5",
+        screen_top_position=-10.0,
+        screen_bottom_position=-11.0,
+        plain_tube_part_length=12.5,
         glue="geen",
         geo_ohm_cables=[],
         sock_material="nylon",
@@ -1,4 +1,7 @@
-from api.bro_upload import object_upload, utils
+import pytest
+from django.core.exceptions import ImproperlyConfigured
+
+from api.bro_upload import object_upload, template_registry, utils
 
 
 def test_xml_generator1():
@@ -81,6 +84,23 @@ def test_xml_generator3():
     assert generator.status == "COMPLETED"
 
 
+def test_template_registry_compiles_all_templates():
+    template_registry.registry.load()
+
+    assert "registration_GLD_Addition.html" in template_registry.registry.templates
+    assert all(
+        name in template_registry.registry.templates
+        for name in template_registry.REQUIRED_TEMPLATES
+    )
+
+
+def test_template_registry_fails_on_missing_templates(tmp_path):
+    registry = template_registry.TemplateRegistry(template_dir=str(tmp_path))
+
+    with pytest.raises(ImproperlyConfigured):
+        registry.load()
+
+
 def test_simplify_validation_errors():
     input_data = [
         {
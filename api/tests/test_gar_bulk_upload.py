@@ -10,6 +10,7 @@ from openpyxl import Workbook
 from rest_framework.test import APIClient
 
 from api.bro_upload.gar_bulk_upload import (
+    GARColumnPlan,
     create_analysis_process,
     create_gar_field_measurements,
     csv_or_excel_to_df,
@@ -197,6 +198,24 @@ class TestCsvOrExcelToDf:
         assert df.iloc[0]["name"] == "Alice"
         assert df.iloc[0]["age"] == 30
 
+    def test_excel_mixed_lab_column_keeps_numbers(self):
+        """Numbers in a column with "<" values are read as numbers."""
+        output = io.BytesIO()
+        workbook = Workbook()
+        sheet = workbook.active
+        sheet.append(["Cl (mg/l)_lab", "Analysedatum Cl (mg/l)_lab"])
+        sheet.append([1.5, "2018-10-25"])
+        sheet.append(["<", "2018-10-25"])
+        workbook.save(output)
+        output.seek(0)
+        output.name = "lab.xlsx"
+
+        df = csv_or_excel_to_df(self.create_mock_upload_file("lab.xlsx", output))
+
+        assert df["Cl (mg/l)_lab"].tolist() == [1.5, "<"]
+        analysis_processes = GARColumnPlan(df.columns.tolist()).analysis_processes(df)
+        assert [len(processes) for processes in analysis_processes] == [1, 1]
+
     def test_excel_xls_extension(self):
         """Test that .xls extension is handled (reads as Excel)."""
         output = io.BytesIO()
@@ -831,3 +850,47 @@ def test_create_analysis_process_ignores_field_only_lab_measurement_columns():
     analysis_processes = create_analysis_process(row)
 
     assert analysis_processes == []
+
+
+def test_gar_column_plan_creates_measurements_per_row():
+    df = pd.DataFrame(
+        {
+            "bro_id": ["GMW1234567890", "GMW1234567890", "GMW1234567891"],
+            "pH_field": [7.2, "niet bepaald", 6.9],
+            "Zuurstof (mg/l)_field": [8.5, 8.1, None],
+            "Cl (mg/l)_lab": [0.1, "<", 0.3],
+            "Rapportagegrens Cl (mg/l)_lab": [1, 1, 1],
+            "Analysedatum Cl (mg/l)_lab": ["2018-10-25", "2018-10-26", ""],
+            "NO3 (mg/l)_lab": [0.2, 0.4, 0.5],
+            "Rapportagegrens NO3 (mg/l)_lab": [2, 2, 2],
+            "Analysedatum NO3 (mg/l)_lab": ["2018-10-24", "2018-10-24", "2018-10-27"],
+        }
+    )
+
+    plan = GARColumnPlan(df.columns.tolist())
+    field_measurements = plan.field_measurements(df)
+    analysis_processes = plan.analysis_processes(df)
+
+    # The plan gives the same result as the row functions
+    for position, (_, row) in enumerate(df.iterrows()):
+        assert [
+            FieldMeasurement(**field_measurement)
+            for field_measurement in field_measurements[position]
+        ] == create_gar_field_measurements(row)
+        assert [process["analyses"] for process in analysis_processes[position]] == [
+            [
+                analysis.model_dump(by_alias=True, exclude_unset=True)
+                for analysis in process.analyses
+            ]
+            for process in create_analysis_process(row)
+        ]
+
+    assert [len(measurements) for measurements in field_measurements] == [2, 1, 1]
+
+    # Cl and NO3 share a process, dated by the first analysis
+    assert analysis_processes[0][0]["date"] == "2018-10-25"
+    assert len(analysis_processes[0][0]["analyses"]) == 2
+    assert analysis_processes[1][0]["analyses"][0]["limitSymbol"] == "LT"
+    # Cl has no analysis date in the last row
+    assert analysis_processes[2][0]["date"] == "2018-10-27"
+    assert len(analysis_processes[2][0]["analyses"]) == 1
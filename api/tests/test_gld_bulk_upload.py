@@ -5,6 +5,7 @@ import pandas as pd
 import pytest
 from rest_framework.test import APIClient
 
+from api import models as api_models
 from api.tests import fixtures
 
 user = fixtures.user
@@ -91,3 +92,70 @@ def test_gld_bulk_upload_valid_input(
 
     assert mock_task.called
     assert r.status_code == 201
+
+
+@pytest.mark.django_db
+def test_gld_bulk_upload_dry_run(api_client, organisation, user, userprofile, tmp_path):
+    """Testing that a dry run reports the row errors, without creating anything."""
+    api_client.force_authenticate(user=user)
+    url = "/api/bulkuploads/?dry_run=true"
+
+    file_path = tmp_path / "test.csv"
+    csv_data = {
+        "bro_id": ["GLD000000076375", "GLD000000076375"],
+        "time": ["2024-01-01T00:00:00", "2024-01-02T00:00:00"],
+        "value": ["1,5", "abc"],
+        "statusQualityControl": ["goedgekeurd", "goedgekeurd"],
+        "censorReason": ["", ""],
+    }
+    pd.DataFrame(csv_data).to_csv(file_path, index=False)
+
+    metadata_json = json.dumps(
+        {
+            "broId": "GLD000000076375",
+            "projectNumber": "1889",
+            "qualityRegime": "IMBRO",
+            "requestReference": "test_request",
+            "deliveryAccountableParty": "17278718",
+        }
+    )
+
+    sourcedocument_json = json.dumps(
+        {
+            "investigatorKvk": "17278718",
+            "observationType": "reguliereMeting",
+            "processReference": "NEN5120v1991",
+            "evaluationProcedure": "brabantWater2013",
+            "statusQualityControl": "volledigBeoordeeld",
+            "measurementInstrumentType": "druksensor",
+            "airPressureCompensationType": "KNMImeting",
+        }
+    )
+
+    with file_path.open("rb") as fp:
+        data = {
+            "bulk_upload_type": "GLD",
+            "project_number": 1,
+            "metadata": metadata_json,
+            "sourcedocument_data": sourcedocument_json,
+            "measurement_tvp_file": fp,
+        }
+        with patch("api.tasks.gld_bulk_upload_task.delay") as mock_task:
+            r = api_client.post(url, data, format="multipart")
+
+    assert r.status_code == 200
+    assert not mock_task.called
+    assert not api_models.BulkUpload.objects.exists()
+    assert not api_models.UploadFile.objects.exists()
+
+    report = r.json()
+    assert report["valid"] is False
+    assert report["nr_of_rows"] == 2
+    assert report["errors"] == [
+        {
+            "row": 3,
+            "column": "value",
+            "value": "abc",
+            "error": "Invalid numeric value.",
+        }
+    ]
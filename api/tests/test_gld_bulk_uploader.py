@@ -1,16 +1,36 @@
+import datetime
 import uuid
 
+import polars as pl
 import pytest
 from django.core.exceptions import ValidationError
 from rest_framework.test import APIClient
 
 from api import models as api_models
-from api.bro_upload.gld_bulk_upload import GLDBulkUploader
+from api.bro_upload import gld_bulk_upload
+from api.bro_upload.gld_bulk_upload import (
+    GLDBulkUploader,
+    _convert_and_check_df,
+    _measurements_per_bro_id,
+    _prepare_measurements_df,
+    _store_measurements,
+    check_measurements,
+    check_split_options,
+    measurements_to_tvps,
+    remove_delivered_measurements,
+    split_measurements,
+)
+from api.bro_upload.upload_datamodels import TimeValuePair
 from api.tests import fixtures
+from gld.models import MeasurementTvp
+from gld.series import Series, get_series_storage
 
 user = fixtures.user
 organisation = fixtures.organisation  # imported, even though not used in this file, because required for userprofile fixture
 userprofile = fixtures.userprofile
+gld = fixtures.gld
+observation = fixtures.observation
+bulk_upload = fixtures.bulk_upload
 
 
 @pytest.fixture
@@ -32,3 +52,439 @@ def test_gld_bulk_uploader_invalid_init():
             bulk_upload_instance_uuid=uuid.uuid4(),
             measurement_tvp_file_uuid=uuid.uuid4(),
         )
+
+
+def test_prepare_measurements_df_partitions_per_bro_id():
+    """All BRO-IDs are localised, sorted and formatted in one pass."""
+    df = pl.DataFrame(
+        {
+            "GLD": ["GLD2", "GLD1", "GLD2", "GLD1"],
+            "tijd": [
+                "2024-06-01 00:00:00",
+                "2024-01-02 00:00:00",
+                "2024-01-01 00:00:00",
+                "2024-01-01 00:00:00",
+            ],
+            "waarde": [1.0, 2.0, 3.0, 4.0],
+            "status": [None, "Goedgekeurd", None, None],
+            "censuur": [None, None, None, None],
+            "limiet": [None, None, None, None],
+        },
+        schema_overrides={"censuur": pl.String, "limiet": pl.String},
+    )
+
+    df = _prepare_measurements_df(_convert_and_check_df(df))
+    partitions = df.partition_by("bro_id", as_dict=True, maintain_order=True)
+
+    assert list(partitions.keys()) == [("GLD1",), ("GLD2",)]
+    assert partitions[("GLD1",)]["time"].to_list() == [
+        "2024-01-01T00:00:00+01:00",
+        "2024-01-02T00:00:00+01:00",
+    ]
+    assert partitions[("GLD2",)]["time"].to_list() == [
+        "2024-01-01T00:00:00+01:00",
+        "2024-06-01T00:00:00+02:00",
+    ]
+    assert partitions[("GLD1",)]["statusQualityControl"].to_list() == [
+        "onbekend",
+        "goedgekeurd",
+    ]
+
+
+def test_prepare_measurements_df_converts_time_zones():
+    """Times with a time zone, e.g. from parquet files, are converted to Dutch time."""
+    df = pl.DataFrame(
+        {
+            "bro_id": ["GLD1", "GLD1"],
+            "time": pl.Series(
+                ["2024-01-01 12:00:00", "2024-07-01 12:00:00"]
+            ).str.to_datetime(time_zone="UTC"),
+            "value": [1.0, 2.0],
+            "statusQualityControl": ["goedgekeurd", None],
+        }
+    )
+
+    df = _prepare_measurements_df(df)
+
+    assert df["time"].to_list() == [
+        "2024-01-01T13:00:00+01:00",
+        "2024-07-01T14:00:00+02:00",
+    ]
+
+
+def _pydantic_tvps(df: pl.DataFrame) -> list[dict]:
+    return [
+        TimeValuePair(**row).model_dump(by_alias=True)
+        for row in df.iter_rows(named=True)
+    ]
+
+
+@pytest.mark.parametrize(
+    "columns",
+    [
+        # Numeric values, as read from excel
+        {
+            "value": [1.5, None, -0.25],
+            "censoringLimitvalue": [None, 0.1, None],
+        },
+        # Integer values
+        {
+            "value": [1, 2, None],
+            "censoringLimitvalue": [None, None, 3],
+        },
+        # Comma decimals, empty strings and nulls, as read from csv
+        {
+            "value": ["1,32", " -0,5 ", ""],
+            "censoringLimitvalue": ["null", None, "0.1"],
+        },
+        # Without a censoringLimitvalue column and with an extra column
+        {
+            "value": ["1,0", "NULL", "2"],
+            "extra": ["a", "b", "c"],
+        },
+    ],
+)
+def test_measurements_to_tvps_parity(columns):
+    """The columnar serialisation gives the same tvps as the TimeValuePair model."""
+    df = pl.DataFrame(
+        {
+            "bro_id": ["GLD1", "GLD1", "GLD1"],
+            "time": [
+                "2024-01-01T00:00:00+01:00",
+                "2024-01-01T01:00:00+01:00",
+                "2024-01-01T02:00:00+01:00",
+            ],
+            "statusQualityControl": ["goedgekeurd", "onbekend", "afgekeurd"],
+            "censorReason": [None, "kleinerDanLimietwaarde", None],
+            **columns,
+        }
+    )
+
+    assert measurements_to_tvps(df) == _pydantic_tvps(df)
+
+
+def test_measurements_to_tvps_invalid_value():
+    df = pl.DataFrame(
+        {
+            "bro_id": ["GLD1", "GLD1"],
+            "time": ["2024-01-01T00:00:00+01:00", "2024-01-01T01:00:00+01:00"],
+            "value": ["1,0", "abc"],
+            "statusQualityControl": ["goedgekeurd", "goedgekeurd"],
+            "censorReason": [None, None],
+        },
+        schema_overrides={"censorReason": pl.String},
+    )
+
+    with pytest.raises(ValueError, match="Invalid numeric value: 'abc'"):
+        measurements_to_tvps(df)
+
+
+def test_store_measurements(tmp_path):
+    """The measurements are stored prepared, sorted by BRO-ID and time."""
+    lazy_df = pl.LazyFrame(
+        {
+            "GLD": ["GLD2", "GLD1", "GLD1"],
+            "tijd": [
+                "2024-01-01 00:00:00",
+                "2024-01-01 01:00:00",
+                "2024-01-01 00:00:00",
+            ],
+            "waarde": [1.0, 2.0, 3.0],
+            "status": ["goedgekeurd", "goedgekeurd", None],
+            "censuur": ["", "", ""],
+            "limiet": ["", "", ""],
+            "opmerking": ["a", "b", "c"],
+        }
+    )
+
+    stored = _store_measurements(lazy_df, str(tmp_path))
+
+    assert (tmp_path / "measurements.parquet").exists()
+    assert stored.collect_schema().names() == [
+        "bro_id",
+        "time",
+        "value",
+        "statusQualityControl",
+        "censorReason",
+        "censoringLimitvalue",
+        "opmerking",
+    ]
+    df = stored.collect()
+    assert df["bro_id"].to_list() == ["GLD1", "GLD1", "GLD2"]
+    assert df["time"].to_list()[:2] == [
+        "2024-01-01T00:00:00+01:00",
+        "2024-01-01T01:00:00+01:00",
+    ]
+    assert df["statusQualityControl"].to_list()[0] == "onbekend"
+
+
+def test_measurements_per_bro_id_spans_batches(tmp_path, monkeypatch):
+    """A BRO-ID that is spread over multiple batches is yielded once."""
+    monkeypatch.setattr(gld_bulk_upload, "STORED_BATCH_SIZE", 2)
+    lazy_df = pl.LazyFrame(
+        {
+            "GLD": ["GLD2", "GLD1", "GLD1", "GLD1", "GLD3"],
+            "tijd": [f"2024-01-01 0{hour}:00:00" for hour in range(5)],
+            "waarde": [1.0, 2.0, 3.0, 4.0, 5.0],
+            "status": ["goedgekeurd"] * 5,
+            "censuur": [""] * 5,
+            "limiet": [""] * 5,
+        }
+    )
+    _store_measurements(lazy_df, str(tmp_path))
+
+    measurements = {
+        bro_id: df["value"].to_list()
+        for bro_id, df in _measurements_per_bro_id(
+            str(tmp_path / "measurements.parquet")
+        )
+    }
+
+    assert measurements == {"GLD1": [2.0, 3.0, 4.0], "GLD2": [1.0], "GLD3": [5.0]}
+
+
+@pytest.fixture
+def prepared_measurements():
+    return pl.DataFrame(
+        {
+            "bro_id": ["GLD1"] * 5,
+            "time": [
+                "2023-12-31T23:00:00+01:00",
+                "2024-01-01T00:00:00+01:00",
+                "2024-01-01T01:00:00+01:00",
+                "2024-02-01T00:00:00+01:00",
+                "2024-02-01T01:00:00+01:00",
+            ],
+            "value": [1.0, 2.0, 3.0, 4.0, 5.0],
+        }
+    )
+
+
+def test_split_measurements_by_count(prepared_measurements):
+    chunks = split_measurements(prepared_measurements, max_measurements=2)
+
+    assert [chunk["value"].to_list() for chunk in chunks] == [
+        [1.0, 2.0],
+        [3.0, 4.0],
+        [5.0],
+    ]
+
+
+def test_split_measurements_by_period(prepared_measurements):
+    chunks = split_measurements(prepared_measurements, period="month")
+
+    assert [chunk["value"].to_list() for chunk in chunks] == [
+        [1.0],
+        [2.0, 3.0],
+        [4.0, 5.0],
+    ]
+    assert chunks[0].columns == prepared_measurements.columns
+
+
+def test_split_measurements_by_period_and_count(prepared_measurements):
+    chunks = split_measurements(
+        prepared_measurements, max_measurements=1, period="year"
+    )
+
+    assert len(chunks) == 5
+    assert split_measurements(prepared_measurements) == [prepared_measurements]
+    assert split_measurements(prepared_measurements.clear(), max_measurements=2) == []
+
+
+def test_split_measurements_invalid_period(prepared_measurements):
+    with pytest.raises(ValueError, match="Invalid additionPeriod"):
+        split_measurements(prepared_measurements, period="week")
+
+
+@pytest.mark.parametrize(
+    "metadata, error",
+    [
+        ({}, None),
+        ({"additionPeriod": "month", "maxMeasurementsPerAddition": "500"}, None),
+        ({"additionPeriod": "week"}, "Invalid additionPeriod"),
+        ({"maxMeasurementsPerAddition": "abc"}, "Invalid maxMeasurementsPerAddition"),
+        ({"maxMeasurementsPerAddition": 0}, "Invalid maxMeasurementsPerAddition"),
+        ({"maxMeasurementsPerAddition": -5}, "Invalid maxMeasurementsPerAddition"),
+    ],
+)
+def test_check_split_options(metadata, error):
+    result = check_split_options(metadata)
+    if error is None:
+        assert result is None
+    else:
+        assert result.startswith(error)
+
+
+@pytest.mark.django_db
+def test_gld_bulk_uploader_fails_on_invalid_max_measurements(bulk_upload, tmp_path):
+    bulk_upload.metadata = {"maxMeasurementsPerAddition": "abc"}
+    bulk_upload.save()
+    uploader = GLDBulkUploader.__new__(GLDBulkUploader)
+    uploader.bulk_upload_instance = bulk_upload
+    uploader.max_measurements = "abc"
+    uploader.addition_period = None
+
+    uploader._process(str(tmp_path))
+
+    bulk_upload.refresh_from_db()
+    assert bulk_upload.status == "FAILED"
+    assert "maxMeasurementsPerAddition" in bulk_upload.log
+
+
+def test_remove_delivered_measurements_by_period(prepared_measurements):
+    remaining = remove_delivered_measurements(
+        prepared_measurements,
+        [(datetime.date(2023, 12, 31), datetime.date(2024, 2, 1))],
+    )
+
+    # The measurements on the begin and end dates may be new
+    assert remaining["value"].to_list() == [1.0, 4.0, 5.0]
+
+
+def test_remove_delivered_measurements_by_time(prepared_measurements):
+    remaining = remove_delivered_measurements(
+        prepared_measurements,
+        [],
+        ["2023-12-31T22:00:00Z", "2024-02-01T00:00:00+01:00"],
+    )
+
+    assert remaining["value"].to_list() == [2.0, 3.0, 5.0]
+    assert remove_delivered_measurements(prepared_measurements, []).equals(
+        prepared_measurements
+    )
+
+
+@pytest.mark.django_db
+def test_gld_bulk_uploader_delivered_observations(gld, observation, bulk_upload):
+    bulk_upload.sourcedocument_data = {"observationType": "reguliereMeting"}
+    uploader = GLDBulkUploader.__new__(GLDBulkUploader)
+    uploader.bulk_upload_instance = bulk_upload
+    uploader.skip_delivered_periods = False
+
+    # Without stored measurements the observation only has dates
+    assert uploader._delivered_observations([gld.bro_id]) == {}
+
+    uploader.skip_delivered_periods = True
+    observations = uploader._delivered_observations([gld.bro_id, "GLD000000000000"])
+
+    assert list(observations) == [gld.bro_id]
+    assert observations[gld.bro_id][0]["begin_position"] == datetime.date(2024, 1, 1)
+    assert observations[gld.bro_id][0]["has_measurements"] is False
+
+    bulk_upload.sourcedocument_data = {"observationType": "controlemeting"}
+    assert uploader._delivered_observations([gld.bro_id]) == {}
+
+
+@pytest.mark.django_db
+def test_gld_bulk_uploader_removes_stored_measurements(
+    prepared_measurements, observation
+):
+    MeasurementTvp.objects.create(
+        observation=observation,
+        time=datetime.datetime(2024, 1, 1, 0, 0, tzinfo=datetime.UTC),
+        value=3.0,
+    )
+    uploader = GLDBulkUploader.__new__(GLDBulkUploader)
+
+    remaining = uploader._remove_delivered(
+        prepared_measurements,
+        [{"uuid": observation.uuid, "has_measurements": True}],
+    )
+
+    # 01:00 in Dutch winter time is midnight UTC
+    assert remaining["value"].to_list() == [1.0, 2.0, 4.0, 5.0]
+
+
+@pytest.mark.django_db
+def test_gld_bulk_uploader_removes_stored_chunk_measurements(
+    prepared_measurements, observation, settings
+):
+    settings.GLD_SERIES_STORAGE = "chunks"
+    get_series_storage().write(
+        observation,
+        Series.from_columns(
+            [datetime.datetime(2024, 1, 1, 0, 0, tzinfo=datetime.UTC)],
+            [3.0],
+            ["goedgekeurd"],
+            [None],
+            [None],
+        ),
+    )
+    uploader = GLDBulkUploader.__new__(GLDBulkUploader)
+
+    remaining = uploader._remove_delivered(
+        prepared_measurements,
+        [{"uuid": observation.uuid, "has_measurements": True}],
+    )
+
+    assert remaining["value"].to_list() == [1.0, 2.0, 4.0, 5.0]
+
+
+def test_check_measurements_reports_rows():
+    df = pl.DataFrame(
+        {
+            "bro_id": [
+                "GLD000000012345",
+                "GLD000000012345",
+                "GLD123",
+                "GLD000000012345",
+            ],
+            "time": [
+                "2024-01-01T00:00:00",
+                "2024-01-01T00:00:00",
+                "2024-03-31T02:30:00",
+                "2024-13-45T00:00:00",
+            ],
+            "value": ["1,5", "1.2", "abc", "1"],
+            "statusQualityControl": ["goedgekeurd"] * 4,
+            "censorReason": [None] * 4,
+        },
+        schema_overrides={"censorReason": pl.String},
+    )
+
+    errors = check_measurements(df)
+
+    assert {(error["row"], error["column"]) for error in errors} == {
+        (2, "time"),  # duplicate
+        (3, "time"),  # duplicate
+        (4, "bro_id"),
+        (4, "time"),  # daylight saving time
+        (4, "value"),
+        (5, "time"),  # invalid date
+    }
+
+
+def test_check_measurements_missing_columns():
+    errors = check_measurements(pl.DataFrame({"bro_id": ["GLD000000012345"]}))
+
+    assert len(errors) == 1
+    assert errors[0]["row"] is None
+    assert "statusQualityControl" in errors[0]["error"]
+
+
+def test_check_measurements_reports_delivered_rows():
+    df = pl.DataFrame(
+        {
+            "bro_id": ["GLD000000012345"] * 3,
+            "time": [
+                "2024-01-01T12:00:00",
+                "2024-01-15T00:00:00",
+                "2024-02-01T12:00:00",
+            ],
+            "value": ["1", "2", "3"],
+            "statusQualityControl": ["goedgekeurd"] * 3,
+            "censorReason": [None] * 3,
+        },
+        schema_overrides={"censorReason": pl.String},
+    )
+    observation = {
+        "uuid": uuid.uuid4(),
+        "begin_position": datetime.date(2024, 1, 1),
+        "end_position": datetime.date(2024, 2, 1),
+        "has_measurements": False,
+    }
+
+    errors = check_measurements(df, {"GLD000000012345": [observation]})
+
+    assert [(error["row"], error["column"]) for error in errors] == [(3, "time")]
+    assert "skipped" in errors[0]["error"]
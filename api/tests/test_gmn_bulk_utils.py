@@ -4,6 +4,7 @@ import pytest
 from api.bro_upload.gmn_bulk_upload import (
     _convert_and_check_df,
     check_date_string,
+    check_measuringpoints,
     determine_event_type,
 )
 
@@ -62,3 +63,25 @@ def test_check_date_string():
     assert check_date_string("1900-01") == "1900-01"
     assert check_date_string("1900") == "1900"
     assert check_date_string("") == ""
+
+
+def test_check_measuringpoints():
+    df = pl.DataFrame(
+        {
+            "event": ["toevoegen", "verplaatsen", "eind"],
+            "meetpuntcode": ["MP1", "MP2", None],
+            "broid": ["GMW000000012345", "GMW000000012345", "GMW1"],
+            "buis_nr": ["1", "0", "1"],
+            "datum": ["2025-01-01", "2025-01-01", "01-01-2025"],
+        }
+    )
+
+    errors = check_measuringpoints(df)
+
+    assert {(error["row"], error["column"]) for error in errors} == {
+        (3, "eventType"),
+        (3, "tubeNumber"),
+        (4, "measuringPointCode"),
+        (4, "gmwBroId"),
+        (4, "eventDate"),
+    }
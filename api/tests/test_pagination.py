@@ -0,0 +1,63 @@
+import pytest
+from django.urls import reverse
+from rest_framework.test import APIClient
+
+from api.pagination import CreatedCursorPagination
+from api.tests import fixtures
+from gld.models import GLD
+
+user = fixtures.user
+organisation = fixtures.organisation
+userprofile = fixtures.userprofile
+
+
+@pytest.fixture
+def api_client(user, userprofile):
+    api_client = APIClient()
+    api_client.force_authenticate(user=user)
+    return api_client
+
+
+@pytest.fixture
+def glds(organisation):
+    return [
+        GLD.objects.create(data_owner=organisation, bro_id=f"GLD00000000000{index}")
+        for index in range(5)
+    ]
+
+
+@pytest.mark.django_db
+def test_page_number_pagination_is_the_default(api_client, glds):
+    response = api_client.get(reverse("api:gld:gld-list"))
+
+    assert response.status_code == 200
+    assert response.json()["count"] == 5
+
+
+@pytest.mark.django_db
+def test_cursor_pagination_walks_all_pages(api_client, glds, monkeypatch):
+    monkeypatch.setattr(CreatedCursorPagination, "page_size", 2)
+
+    url = reverse("api:gld:gld-list") + "?pagination=cursor"
+    bro_ids = []
+    nr_of_pages = 0
+    while url:
+        response = api_client.get(url)
+        assert response.status_code == 200
+        assert "count" not in response.json()
+        bro_ids += [result["bro_id"] for result in response.json()["results"]]
+        url = response.json()["next"]
+        nr_of_pages += 1
+
+    assert nr_of_pages == 3
+    # Oldest first, so objects created while paging are not skipped
+    assert bro_ids == [gld.bro_id for gld in glds]
+
+
+@pytest.mark.django_db
+def test_cursor_pagination_needs_created_and_uuid(api_client):
+    # Users have no creation time to put in the cursor
+    response = api_client.get(reverse("api:user-list") + "?pagination=cursor")
+
+    assert response.status_code == 400
+    assert "pagination" in response.json()
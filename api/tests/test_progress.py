@@ -0,0 +1,83 @@
+import pytest
+from django.urls import reverse
+from rest_framework.test import APIClient
+
+from api.progress import ProgressReporter, get_cached_progress
+from api.tests import fixtures
+
+user = fixtures.user
+organisation = fixtures.organisation
+userprofile = fixtures.userprofile
+bulk_upload = fixtures.bulk_upload
+
+
+@pytest.fixture
+def local_cache(settings):
+    settings.CACHES = {
+        "default": {"BACKEND": "django.core.cache.backends.locmem.LocMemCache"}
+    }
+
+
+@pytest.mark.django_db
+def test_progress_reporter_throttles_database_writes(
+    local_cache, bulk_upload, django_assert_num_queries
+):
+    reporter = ProgressReporter(
+        bulk_upload, total=100, start=20.0, flush_interval=3600, flush_step=40
+    )
+
+    # 50 steps move the progress 40%, so only the last step writes
+    with django_assert_num_queries(1):
+        for _ in range(50):
+            reporter.advance()
+
+    bulk_upload.refresh_from_db()
+    assert bulk_upload.progress == 60.0
+    assert reporter.flushed_progress == 60.0
+
+
+@pytest.mark.django_db
+def test_progress_reporter_publishes_every_step(local_cache, bulk_upload):
+    reporter = ProgressReporter(
+        bulk_upload, total=4, start=20.0, flush_interval=3600, flush_step=100
+    )
+    reporter.advance()
+
+    assert get_cached_progress(bulk_upload) == {
+        "status": "PROCESSING",
+        "progress": 40.0,
+    }
+    bulk_upload.refresh_from_db()
+    assert bulk_upload.progress == 20.0
+
+
+@pytest.mark.django_db
+def test_progress_reporter_finish_clears_cache(local_cache, bulk_upload):
+    reporter = ProgressReporter(bulk_upload, total=2)
+    reporter.advance(2)
+    bulk_upload.status = "COMPLETED"
+    reporter.finish()
+
+    assert get_cached_progress(bulk_upload) is None
+    bulk_upload.refresh_from_db()
+    assert bulk_upload.status == "COMPLETED"
+    assert bulk_upload.progress == 100.0
+
+
+@pytest.mark.django_db
+def test_bulk_upload_detail_reads_cached_progress(
+    local_cache, user, userprofile, bulk_upload
+):
+    reporter = ProgressReporter(
+        bulk_upload, total=10, start=20.0, flush_interval=3600, flush_step=100
+    )
+    reporter.advance(5)
+
+    api_client = APIClient()
+    api_client.force_authenticate(user=user)
+    response = api_client.get(
+        reverse("api:bulkupload-detail", kwargs={"uuid": bulk_upload.uuid})
+    )
+
+    assert response.status_code == 200
+    assert response.json()["progress"] == 60.0
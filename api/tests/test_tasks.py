@@ -3,6 +3,7 @@ from unittest import mock
 from api.tasks import (
     check_delivery_status_task,
     deliver_xml_file_task,
+    dispatch_upload_tasks,
     validate_xml_file_task,
 )
 
@@ -150,3 +151,22 @@ def test_check_delivery_status_task_delivered(mock_get, mock_check_status):
 #     assert mock_instance.status == "UNFINISHED"
 #     assert mock_instance.progress == 95.0
 #     assert mock_instance.save.called
+
+
+@mock.patch("api.tasks.group")
+def test_dispatch_upload_tasks(mock_group):
+    with_owner = mock.Mock()
+    without_owner = mock.Mock(data_owner=None)
+
+    dispatch_upload_tasks([with_owner, without_owner])
+
+    workflows = mock_group.call_args.args[0]
+    assert len(workflows) == 1
+    mock_group.return_value.apply_async.assert_called_once_with(queue="upload")
+
+
+@mock.patch("api.tasks.group")
+def test_dispatch_upload_tasks_empty(mock_group):
+    dispatch_upload_tasks([])
+
+    mock_group.assert_not_called()
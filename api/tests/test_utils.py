@@ -1,7 +1,10 @@
+import datetime
 import io
+import os
 import zipfile
 from unittest import mock
 
+import pandas as pd
 import polars as pl
 import pytest
 import requests
@@ -10,20 +13,26 @@ from django.core.files.uploadedfile import SimpleUploadedFile
 from api.bro_upload.utils import (
     T,
     add_xml_to_upload,
+    bulk_create_upload_tasks,
     check_delivery_status,
     create_delivery,
     create_upload_url,
     detect_delimiter_from_content,
+    excel_cache_directory,
+    excel_to_parquet,
     file_to_df,
+    file_to_lazy_df,
     include_delivery_responsible_party,
+    prune_excel_cache,
     read_csv,
+    read_excel,
     read_zip,
     simplify_validation_errors,
     validate_xml_file,
 )
-from api.models import Organisation, UploadFile
+from api.models import Organisation, UploadFile, UploadTask
 from api.tests.fixtures import bulk_upload, organisation
-from api.utils import drop_empty_strings, strip_whitespace
+from api.utils import drop_empty_strings, strip_whitespace, to_float
 
 organisation
 bulk_upload
@@ -463,6 +472,28 @@ def test_file_to_df_zip(monkeypatch, bulk_upload):
     assert df.shape == (1, 2)
 
 
+@pytest.mark.django_db
+@pytest.mark.parametrize(
+    "filename, write",
+    [
+        ("data.parquet", pl.DataFrame.write_parquet),
+        ("data.arrow", pl.DataFrame.write_ipc),
+        ("data.feather", pl.DataFrame.write_ipc),
+    ],
+)
+def test_file_to_df_columnar(bulk_upload, filename, write):
+    expected = pl.DataFrame({"a": [1, 3], "b": ["2", "4"]})
+    buffer = io.BytesIO()
+    write(expected, buffer)
+
+    file = SimpleUploadedFile(filename, buffer.getvalue())
+    upload = UploadFile.objects.create(bulk_upload=bulk_upload, file=file)
+
+    assert file_to_df(upload).equals(expected)
+    with file_to_lazy_df(upload) as lazy_df:
+        assert lazy_df.collect().equals(expected)
+
+
 @pytest.mark.django_db
 def test_file_to_df_invalid_extension(bulk_upload):
     file = SimpleUploadedFile("note.txt", b"not a csv", content_type="text/plain")
@@ -471,6 +502,90 @@ def test_file_to_df_invalid_extension(bulk_upload):
         file_to_df(upload)
 
 
+@pytest.mark.django_db
+def test_file_to_lazy_df_csv(bulk_upload):
+    file = SimpleUploadedFile("data.csv", b"a;b\n1;2\n3;4", content_type="text/csv")
+    upload = UploadFile.objects.create(bulk_upload=bulk_upload, file=file)
+    with file_to_lazy_df(upload) as lazy_df:
+        assert isinstance(lazy_df, pl.LazyFrame)
+        df = lazy_df.collect()
+    assert df.shape == (2, 2)
+    assert df.columns == ["a", "b"]
+
+
+@pytest.mark.django_db
+def test_file_to_lazy_df_zip(bulk_upload):
+    buffer = io.BytesIO()
+    with zipfile.ZipFile(buffer, "w") as zip_file:
+        zip_file.writestr("first.csv", b"a,b\n1,2")
+        zip_file.writestr("second.csv", b"a,b\n3,4\n5,6")
+        zip_file.writestr("readme.txt", b"This is a readme file.")
+    buffer.seek(0)
+
+    file = SimpleUploadedFile(
+        "archive.zip", buffer.read(), content_type="application/zip"
+    )
+    upload = UploadFile.objects.create(bulk_upload=bulk_upload, file=file)
+
+    with file_to_lazy_df(upload) as lazy_df:
+        df = lazy_df.collect()
+    assert df["a"].to_list() == [1, 3, 5]
+
+
+@pytest.mark.django_db
+def test_file_to_lazy_df_invalid_extension(bulk_upload):
+    file = SimpleUploadedFile("note.txt", b"not a csv", content_type="text/plain")
+    upload = UploadFile.objects.create(bulk_upload=bulk_upload, file=file)
+    with pytest.raises(ValueError, match="Unsupported file type"):
+        with file_to_lazy_df(upload):
+            pass
+
+
+def test_excel_to_parquet_reuses_copy(tmp_path, settings, monkeypatch):
+    settings.MEDIA_ROOT = str(tmp_path)
+    excel_path = tmp_path / "sheet.xlsx"
+    pd.DataFrame(
+        {
+            "bro_id": ["GLD000000012345", "GLD000000012345"],
+            "date": [datetime.date(2024, 1, 1), datetime.date(2024, 1, 2)],
+            "value": [1.5, 2.5],
+        }
+    ).to_excel(excel_path, index=False)
+
+    path = excel_to_parquet(str(excel_path))
+    assert os.path.dirname(path) == excel_cache_directory()
+    df = pl.read_parquet(path)
+    assert df["value"].to_list() == [1.5, 2.5]
+    assert isinstance(df.schema["date"], pl.Datetime)
+
+    # The same workbook, e.g. of a dry run and the upload after it, uses the copy
+    monkeypatch.setattr(
+        "api.bro_upload.utils.pl.read_excel",
+        lambda *args, **kwargs: pytest.fail("read the workbook again"),
+    )
+    assert excel_to_parquet(excel_path.read_bytes()) == path
+    assert read_excel(excel_path.read_bytes())["value"].to_list() == [1.5, 2.5]
+
+
+def test_prune_excel_cache(tmp_path, settings):
+    settings.MEDIA_ROOT = str(tmp_path)
+    settings.EXCEL_CACHE_MAX_AGE = 60
+    assert prune_excel_cache() == 0
+
+    contents = []
+    for value in [1.5, 2.5]:
+        content = io.BytesIO()
+        pd.DataFrame({"value": [value]}).to_excel(content, index=False)
+        contents.append(content.getvalue())
+    old_path = excel_to_parquet(contents[0])
+    os.utime(old_path, (0, 0))
+
+    # Storing a new copy removes the copies that were not read recently
+    new_path = excel_to_parquet(contents[1])
+    assert not os.path.exists(old_path)
+    assert os.path.exists(new_path)
+
+
 ### For read Excel, but needs xlsxwriter dependency which is not yet added
 # class MockUploadFile:
 #     """Mock UploadFile class for testing"""
@@ -710,3 +825,52 @@ def test_drop_empty_strings():
         "hobbies": ["Reading", 123],
     }
     assert drop_empty_strings(data) == expected
+
+
+@pytest.mark.django_db(transaction=True)
+def test_bulk_create_upload_tasks(organisation):
+    upload_tasks = [
+        UploadTask(
+            data_owner=organisation,
+            bro_domain="GLD",
+            project_number="1",
+            registration_type="GLD_Addition",
+            request_type="registration",
+            metadata={"broId": f"GLD00000000000{index}"},
+            sourcedocument_data={},
+        )
+        for index in range(3)
+    ]
+
+    with (
+        mock.patch("api.tasks.dispatch_upload_tasks") as mock_dispatch,
+        mock.patch("api.tasks.upload_task") as mock_upload_task,
+    ):
+        bulk_create_upload_tasks(upload_tasks)
+
+    # The post_save signal does not start the upload per task
+    mock_upload_task.assert_not_called()
+    mock_dispatch.assert_called_once_with(upload_tasks)
+
+    assert UploadTask.objects.filter(status="PROCESSING").count() == 3
+
+
+@pytest.mark.parametrize(
+    "value, expected",
+    [
+        ("1.5", 1.5),
+        (" -10.000 ", -10.0),
+        ("0,25", 0.25),
+        (32, 32.0),
+        (None, None),
+        ("", None),
+        ("onbekend", None),
+        # Not finite, like migration 0026 rejects them
+        ("nan", None),
+        ("-Infinity", None),
+        ("1e400", None),
+        (float("nan"), None),
+    ],
+)
+def test_to_float(value, expected):
+    assert to_float(value) == expected
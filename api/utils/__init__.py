@@ -48,9 +48,11 @@ from .gmw_utils import (
 from .gpd_utils import create_gpd, create_gpd_report
 from .guf_utils import create_guf
 from .helpers import (
+    count_subquery,
     drop_empty_strings,
     empty_strings_to_none,
     strip_whitespace,
+    to_float,
     transformer,
 )
 
@@ -60,6 +62,8 @@ __all__ = [
     "empty_strings_to_none",
     "strip_whitespace",
     "drop_empty_strings",
+    "count_subquery",
+    "to_float",
     # GMW
     "create_gmw",
     "create_gmw_event",
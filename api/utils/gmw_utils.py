@@ -2,10 +2,13 @@ import logging
 
 from gmw.models import GMW, Event, MonitoringTube
 
-from .helpers import transformer
+from .helpers import to_float, transformer
 
 logger = logging.getLogger(__name__)
 
+# GMW fields that are stored as numbers, the sourcedocuments may have strings
+NUMERIC_GMW_FIELDS = {"offset", "ground_level_position"}
+
 
 def create_gmw(
     bro_id: str, metadata: dict, sourcedocument_data: dict, data_owner: str
@@ -45,9 +48,11 @@ def create_gmw(
             "local_vertical_reference_point": sourcedocument_data.get(
                 "localVerticalReferencePoint"
             ),
-            "offset": sourcedocument_data.get("offset"),
+            "offset": to_float(sourcedocument_data.get("offset")),
             "vertical_datum": sourcedocument_data.get("verticalDatum"),
-            "ground_level_position": sourcedocument_data.get("groundLevelPosition"),
+            "ground_level_position": to_float(
+                sourcedocument_data.get("groundLevelPosition")
+            ),
             "ground_level_positioning_method": sourcedocument_data.get(
                 "groundLevelPositioningMethod"
             ),
@@ -57,18 +62,17 @@ def create_gmw(
         },
     )[0]
     for tube in sourcedocument_data.get("monitoringTubes", []):
-        position_tube_top = tube.get("tubeTopPosition")
-        plain_tube_length = tube.get("plainTubePartLength")
+        position_tube_top = to_float(tube.get("tubeTopPosition"))
+        plain_tube_length = to_float(tube.get("plainTubePartLength"))
+        screen_length = to_float(tube.get("screenLength"))
         screen_top_position = (
-            float(position_tube_top) - float(plain_tube_length)
+            position_tube_top - plain_tube_length
             if (plain_tube_length is not None and position_tube_top is not None)
             else None
         )
         screen_bottom_position = (
-            float(screen_top_position) - float(tube.get("screenLength"))
-            if (
-                screen_top_position is not None and tube.get("screenLength") is not None
-            )
+            screen_top_position - screen_length
+            if (screen_top_position is not None and screen_length is not None)
             else None
         )
         geo_ohm_cables = tube.get("geoOhmCables", [])
@@ -83,7 +87,7 @@ def create_gmw(
                 "sediment_sump_length": tube.get("sedimentSumpLength"),
                 "number_of_geo_ohm_cables": tube.get("numberOfGeoOhmCables", 0),
                 "geo_ohm_cables": geo_ohm_cables if geo_ohm_cables else [],
-                "tube_top_diameter": tube.get("tubeTopDiameter"),
+                "tube_top_diameter": to_float(tube.get("tubeTopDiameter")),
                 "variable_diameter": tube.get("variableDiameter"),
                 "tube_status": tube.get("tubeStatus"),
                 "tube_top_position": position_tube_top,
@@ -93,7 +97,7 @@ def create_gmw(
                 "tube_packing_material": tube.get("tubePackingMaterial"),
                 "tube_material": tube.get("tubeMaterial"),
                 "glue": tube.get("glue"),
-                "screen_length": tube.get("screenLength"),
+                "screen_length": screen_length,
                 "screen_protection": tube.get("screenProtection"),
                 "sock_material": tube.get("sockMaterial"),
                 "screen_top_position": screen_top_position,
@@ -220,6 +224,8 @@ def update_gmw(
         for field, key in source_field_map.items()
         if key in sourcedocument_data
     }
+    for field in NUMERIC_GMW_FIELDS.intersection(updates):
+        updates[field] = to_float(updates[field])
     updates.update(
         {
             field: metadata[key]
@@ -257,20 +263,20 @@ def update_gmw(
                 "sediment_sump_length": tube.get("sedimentSumpLength"),
                 "number_of_geo_ohm_cables": tube.get("numberOfGeoOhmCables", 0),
                 "geo_ohm_cables": tube.get("geoOhmCables", []),
-                "tube_top_diameter": tube.get("tubeTopDiameter"),
+                "tube_top_diameter": to_float(tube.get("tubeTopDiameter")),
                 "variable_diameter": tube.get("variableDiameter"),
                 "tube_status": tube.get("tubeStatus"),
-                "tube_top_position": tube.get("tubeTopPosition"),
+                "tube_top_position": to_float(tube.get("tubeTopPosition")),
                 "tube_top_positioning_method": tube.get("tubeTopPositioningMethod"),
                 "tube_part_inserted": tube.get("tubePartInserted"),
                 "tube_in_use": tube.get("tubeInUse"),
                 "tube_packing_material": tube.get("tubePackingMaterial"),
                 "tube_material": tube.get("tubeMaterial"),
                 "glue": tube.get("glue"),
-                "screen_length": tube.get("screenLength"),
+                "screen_length": to_float(tube.get("screenLength")),
                 "screen_protection": tube.get("screenProtection"),
                 "sock_material": tube.get("sockMaterial"),
-                "plain_tube_part_length": tube.get("plainTubePartLength"),
+                "plain_tube_part_length": to_float(tube.get("plainTubePartLength")),
             },
         )
 
@@ -1,5 +1,8 @@
 import logging
+import math
 
+from django.db.models import Count, OuterRef, QuerySet, Subquery
+from django.db.models.functions import Coalesce
 from pyproj import Transformer
 
 logger = logging.getLogger(__name__)
@@ -59,3 +62,41 @@ def drop_empty_strings(d: dict) -> dict:  # noqa: C901
         else:
             cleaned[key] = value
     return cleaned
+
+
+def to_float(value) -> float | None:
+    """Parses a number from the BRO or a sourcedocument, None if it isn't one.
+
+    NaN and infinity are no numbers here, they can't be serialized to JSON.
+    """
+    if value is None:
+        return None
+    try:
+        number = (
+            value
+            if isinstance(value, float)
+            else float(str(value).strip().replace(",", "."))
+        )
+    except ValueError:
+        number = math.nan
+    if not math.isfinite(number):
+        logger.info(f"Expected a number, got: {value!r}")
+        return None
+    return number
+
+
+def count_subquery(queryset: QuerySet, field: str) -> Coalesce:
+    """Counts the rows of queryset that point to the outer row through field.
+
+    Meant for annotating list querysets. Unlike Count() over a join, this
+    does not group the whole table, is only evaluated for the rows of the
+    requested page, and multiple counts do not multiply each other.
+    """
+    counts = (
+        queryset.filter(**{field: OuterRef("pk")})
+        .order_by()
+        .values(field)
+        .annotate(count=Count("pk"))
+        .values("count")
+    )
+    return Coalesce(Subquery(counts), 0)
@@ -18,7 +18,12 @@ from rest_framework.reverse import reverse
 from rest_framework.views import APIView
 
 from api import filters, mixins, models, serializers, tasks
-from api.bro_upload import utils
+from api.bro_upload import (
+    gar_bulk_upload,
+    gld_bulk_upload,
+    gmn_bulk_upload,
+    utils,
+)
 from api.bro_upload.object_upload import XMLGenerator
 from api.bro_upload.upload_datamodels import (
     GARBulkUploadMetadata,
@@ -253,7 +258,12 @@ class OrganisationViewSet(viewsets.ModelViewSet):
         )
 
 
-class ImportTaskViewSet(mixins.UserOrganizationMixin, viewsets.ModelViewSet):
+class ImportTaskViewSet(
+    mixins.UserOrganizationMixin,
+    mixins.SparseFieldsMixin,
+    mixins.ConditionalGetMixin,
+    viewsets.ModelViewSet,
+):
     """
     This endpoint handles the import of data from the BRO.
     As input, it takes one of the four possible BRO Objects (GMN, GMW, GLD, FRD).
@@ -297,7 +307,12 @@ class ImportTaskViewSet(mixins.UserOrganizationMixin, viewsets.ModelViewSet):
         )
 
 
-class UploadTaskViewSet(mixins.UserOrganizationMixin, viewsets.ModelViewSet):
+class UploadTaskViewSet(
+    mixins.UserOrganizationMixin,
+    mixins.SparseFieldsMixin,
+    mixins.ConditionalGetMixin,
+    viewsets.ModelViewSet,
+):
     """This endpoint handles the upload of data to the BRO.
 
     It takes the registration type, request type, and the sourcedocument data as input.
@@ -552,7 +567,12 @@ class UploadTaskViewSet(mixins.UserOrganizationMixin, viewsets.ModelViewSet):
         return HttpResponse(xml_str, content_type="application/xml")
 
 
-class UploadTaskOverviewList(mixins.UserOrganizationMixin, generics.ListAPIView):
+class UploadTaskOverviewList(
+    mixins.UserOrganizationMixin,
+    mixins.SparseFieldsMixin,
+    mixins.ConditionalGetMixin,
+    generics.ListAPIView,
+):
     """
     API endpoint that provides a filtered, paginated list of upload tasks with summary information.
 
@@ -574,7 +594,12 @@ class UploadTaskOverviewList(mixins.UserOrganizationMixin, generics.ListAPIView)
     filterset_fields = "__all__"
 
 
-class BulkUploadViewSet(mixins.UserOrganizationMixin, viewsets.ModelViewSet):
+class BulkUploadViewSet(
+    mixins.UserOrganizationMixin,
+    mixins.SparseFieldsMixin,
+    mixins.ConditionalGetMixin,
+    viewsets.ModelViewSet,
+):
     """Endpoint that handles the bulk uploads of files and related data.
 
     This endpoint interfaces with the BulkUpload model and supports the following POST parameters:
@@ -586,7 +611,7 @@ class BulkUploadViewSet(mixins.UserOrganizationMixin, viewsets.ModelViewSet):
         json (*optional*): Open json field that can be filled in with information that cannot be provided through the upload files
 
     `files`:
-        file (*required*): Accepts one or more files in either Excel or CSV format.
+        file (*required*): Accepts one or more files in Excel, CSV, Parquet or Arrow (.arrow/.feather) format.
 
 
 
@@ -597,6 +622,10 @@ class BulkUploadViewSet(mixins.UserOrganizationMixin, viewsets.ModelViewSet):
         When the bulk_upload_type is GLD or GMN, this 1 file is required:
             - measurement_tvp_file
 
+    `dry_run`:
+        bool (*optional*): Query parameter, e.g. `?dry_run=true`. Checks the files and returns a report with the errors per row,
+        without creating the bulk upload or any upload tasks.
+
     """
 
     model = models.BulkUpload
@@ -692,9 +721,10 @@ class BulkUploadViewSet(mixins.UserOrganizationMixin, viewsets.ModelViewSet):
 
         return serializer
 
-    def create(self, request):
+    def create(self, request):  # noqa: C901
         serializer = self.get_serializer(data=request.data)
         serializer.is_valid(raise_exception=True)
+        dry_run = request.query_params.get("dry_run", "false").lower() == "true"
 
         # Fill up missing data
         user_profile = models.UserProfile.objects.get(user=request.user)
@@ -720,6 +750,14 @@ class BulkUploadViewSet(mixins.UserOrganizationMixin, viewsets.ModelViewSet):
                     },
                     status=status.HTTP_400_BAD_REQUEST,
                 )
+            if dry_run:
+                return Response(
+                    gar_bulk_upload.dry_run(
+                        fieldwork_file,
+                        lab_file,
+                        serializer.validated_data["metadata"],
+                    )
+                )
             self._create_gar(serializer, data_owner, fieldwork_file, lab_file)
 
         elif serializer.validated_data["bulk_upload_type"] == "GLD":
@@ -742,6 +780,15 @@ class BulkUploadViewSet(mixins.UserOrganizationMixin, viewsets.ModelViewSet):
                     },
                     status=status.HTTP_400_BAD_REQUEST,
                 )
+            if dry_run:
+                return Response(
+                    gld_bulk_upload.dry_run(
+                        measurement_tvp_file,
+                        serializer.validated_data["metadata"],
+                        serializer.validated_data["sourcedocument_data"],
+                        data_owner,
+                    )
+                )
             self._create_gld(serializer, data_owner, measurement_tvp_file)
 
         elif serializer.validated_data["bulk_upload_type"] == "GMN":
@@ -761,6 +808,8 @@ class BulkUploadViewSet(mixins.UserOrganizationMixin, viewsets.ModelViewSet):
                     },
                     status=status.HTTP_400_BAD_REQUEST,
                 )
+            if dry_run:
+                return Response(gmn_bulk_upload.dry_run(measurement_tvp_file))
             self._create_gmn(serializer, data_owner, measurement_tvp_file)
 
         headers = self.get_success_headers(serializer.data)
@@ -26,10 +26,30 @@ DATABASE_USER = os.getenv("DATABASE_USER", "brostar")
 DATABASE_PASSWORD = os.getenv("DATABASE_PASSWORD", "brostar")
 SENTRY_DSN = os.getenv("SENTRY_DSN")  # Not required, only used in staging/production.
 _use_bro_production_env = os.getenv("USE_BRO_PRODUCTION", default="false")
+_validate_bulk_tvps_env = os.getenv("VALIDATE_BULK_TVPS", default="false")
+_gld_addition_max_measurements_env = os.getenv(
+    "GLD_ADDITION_MAX_MEASUREMENTS", default="20000"
+)
+_progress_flush_interval_env = os.getenv("PROGRESS_FLUSH_INTERVAL", default="10")
+_progress_flush_step_env = os.getenv("PROGRESS_FLUSH_STEP", default="10")
+_gld_series_storage_env = os.getenv("GLD_SERIES_STORAGE", default="rows")
+_excel_cache_max_age_env = os.getenv("EXCEL_CACHE_MAX_AGE", default="604800")
 
 # Convert string-based environment variables to booleans.
 DEBUG = _debug_env.lower() == "true"  # default: True
 USE_BRO_PRODUCTION = _use_bro_production_env.lower() == "true"  # Default: False
+# Validate every GLD bulk measurement with the TimeValuePair model (slow, for debugging)
+VALIDATE_BULK_TVPS = _validate_bulk_tvps_env.lower() == "true"  # Default: False
+# Max number of measurements per GLD_Addition of a GLD bulk upload, 0 to not split
+GLD_ADDITION_MAX_MEASUREMENTS = int(_gld_addition_max_measurements_env)
+# Bulk uploads and imports save their progress at most every N seconds or N percent
+PROGRESS_FLUSH_INTERVAL = float(_progress_flush_interval_env)
+PROGRESS_FLUSH_STEP = float(_progress_flush_step_env)
+# Where GLD measurements are stored: "rows" (a MeasurementTvp per measurement)
+# or "chunks" (a MeasurementChunk per month), see gld.series
+GLD_SERIES_STORAGE = _gld_series_storage_env.lower()
+# Parquet copies of uploaded spreadsheets that are not read for N seconds are removed
+EXCEL_CACHE_MAX_AGE = float(_excel_cache_max_age_env)  # Default: a week
 
 
 TIME_ZONE = "CET"
@@ -275,7 +295,7 @@ DEFAULT_AUTO_FIELD = "django.db.models.BigAutoField"
 
 # DRF configuration
 REST_FRAMEWORK = {
-    "DEFAULT_PAGINATION_CLASS": "rest_framework.pagination.PageNumberPagination",
+    "DEFAULT_PAGINATION_CLASS": "api.pagination.BrostarPagination",
     "PAGE_SIZE": 100,
     "DEFAULT_FILTER_BACKENDS": ["django_filters.rest_framework.DjangoFilterBackend"],
     "DEFAULT_AUTHENTICATION_CLASSES": [
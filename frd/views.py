@@ -7,7 +7,12 @@ from . import filters, serializers
 from . import models as frd_models
 
 
-class FRDListView(mixins.UserOrganizationMixin, generics.ListAPIView):
+class FRDListView(
+    mixins.UserOrganizationMixin,
+    mixins.SparseFieldsMixin,
+    mixins.ConditionalGetMixin,
+    generics.ListAPIView,
+):
     """
     API view to retrieve a list of FRD objects for the user's organization.
 
@@ -23,7 +28,12 @@ class FRDListView(mixins.UserOrganizationMixin, generics.ListAPIView):
     ordering = ["id"]
 
 
-class FRDIdsList(mixins.UserOrganizationMixin, generics.ListAPIView):
+class FRDIdsList(
+    mixins.UserOrganizationMixin,
+    mixins.SparseFieldsMixin,
+    mixins.ConditionalGetMixin,
+    generics.ListAPIView,
+):
     """
     API view to retrieve a list of FRD IDs for the user's organization.
 
@@ -39,7 +49,12 @@ class FRDIdsList(mixins.UserOrganizationMixin, generics.ListAPIView):
     ordering = ["id"]
 
 
-class FRDDetailView(mixins.UserOrganizationMixin, generics.RetrieveAPIView):
+class FRDDetailView(
+    mixins.UserOrganizationMixin,
+    mixins.SparseFieldsMixin,
+    mixins.ConditionalGetMixin,
+    generics.RetrieveAPIView,
+):
     """
     API view to retrieve the details of a single FRD object by UUID.
 
@@ -127,7 +142,12 @@ class GeoElectricMeasurementDetailView(
     lookup_field = "uuid"
 
 
-class GeoElectricMeasureListView(mixins.UserOrganizationMixin, generics.ListAPIView):
+class GeoElectricMeasureListView(
+    mixins.UserOrganizationMixin,
+    mixins.SparseFieldsMixin,
+    mixins.ConditionalGetMixin,
+    generics.ListAPIView,
+):
     """
     API view to retrieve a list of GeoElectricMeasure objects for the user's organization.
 
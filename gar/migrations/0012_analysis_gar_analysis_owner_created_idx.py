@@ -0,0 +1,19 @@
+# Generated by Django 5.2.7 on 2026-10-19 12:20
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+    dependencies = [
+        ("gar", "0011_gar_colour_strength_gar_primary_colour_and_more"),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name="analysis",
+            index=models.Index(
+                fields=["data_owner", "created", "uuid"],
+                name="gar_analysis_owner_created_idx",
+            ),
+        ),
+    ]
@@ -181,6 +181,13 @@ class Analysis(models.Model):
 
     class Meta:
         verbose_name_plural = "Laboratory analyses"
+        indexes = [
+            # Keyset for ?pagination=cursor
+            models.Index(
+                fields=["data_owner", "created", "uuid"],
+                name="gar_analysis_owner_created_idx",
+            ),
+        ]
 
     def __str__(self) -> str:
         return f"{self.parameter} analysis for {self.analysis_process.laboratory_research.gar.bro_id}"
@@ -7,7 +7,12 @@ from . import filters, serializers
 from . import models as gar_models
 
 
-class GARViewSet(mixins.UserOrganizationMixin, generics.ListAPIView):
+class GARViewSet(
+    mixins.UserOrganizationMixin,
+    mixins.SparseFieldsMixin,
+    mixins.ConditionalGetMixin,
+    generics.ListAPIView,
+):
     """
     API view to retrieve a list of GAR objects for the user's organization.
 
@@ -24,7 +29,12 @@ class GARViewSet(mixins.UserOrganizationMixin, generics.ListAPIView):
     ordering = ["id"]
 
 
-class GARIdsList(mixins.UserOrganizationMixin, generics.ListAPIView):
+class GARIdsList(
+    mixins.UserOrganizationMixin,
+    mixins.SparseFieldsMixin,
+    mixins.ConditionalGetMixin,
+    generics.ListAPIView,
+):
     """
     API view to retrieve a list of GAR IDs for the user's organization.
 
@@ -40,7 +50,12 @@ class GARIdsList(mixins.UserOrganizationMixin, generics.ListAPIView):
     ordering = ["id"]
 
 
-class GARDetailView(mixins.UserOrganizationMixin, generics.RetrieveAPIView):
+class GARDetailView(
+    mixins.UserOrganizationMixin,
+    mixins.SparseFieldsMixin,
+    mixins.ConditionalGetMixin,
+    generics.RetrieveAPIView,
+):
     """
     API view to retrieve the details of a single GAR object by UUID.
 
@@ -56,7 +71,12 @@ class GARDetailView(mixins.UserOrganizationMixin, generics.RetrieveAPIView):
     lookup_field = "uuid"
 
 
-class FieldMeasurementListView(mixins.UserOrganizationMixin, generics.ListAPIView):
+class FieldMeasurementListView(
+    mixins.UserOrganizationMixin,
+    mixins.SparseFieldsMixin,
+    mixins.ConditionalGetMixin,
+    generics.ListAPIView,
+):
     """
     API view to retrieve a list of FieldMeasurement objects for the user's organization.
 
@@ -91,7 +111,12 @@ class FieldMeasurementDetailView(
     lookup_field = "uuid"
 
 
-class LaboratoryResearchListView(mixins.UserOrganizationMixin, generics.ListAPIView):
+class LaboratoryResearchListView(
+    mixins.UserOrganizationMixin,
+    mixins.SparseFieldsMixin,
+    mixins.ConditionalGetMixin,
+    generics.ListAPIView,
+):
     """
     API view to retrieve a list of LaboratoryResearch objects for the user's organization.
 
@@ -126,7 +151,12 @@ class LaboratoryResearchDetailView(
     lookup_field = "uuid"
 
 
-class AnalysisProcessListView(mixins.UserOrganizationMixin, generics.ListAPIView):
+class AnalysisProcessListView(
+    mixins.UserOrganizationMixin,
+    mixins.SparseFieldsMixin,
+    mixins.ConditionalGetMixin,
+    generics.ListAPIView,
+):
     """
     API view to retrieve a list of AnalysisProcess objects for the user's organization.
 
@@ -143,7 +173,12 @@ class AnalysisProcessListView(mixins.UserOrganizationMixin, generics.ListAPIView
     ordering = ["id"]
 
 
-class AnalysisProcessDetailView(mixins.UserOrganizationMixin, generics.RetrieveAPIView):
+class AnalysisProcessDetailView(
+    mixins.UserOrganizationMixin,
+    mixins.SparseFieldsMixin,
+    mixins.ConditionalGetMixin,
+    generics.RetrieveAPIView,
+):
     """
     API view to retrieve the details of a single AnalysisProcess object by UUID.
 
@@ -159,7 +194,12 @@ class AnalysisProcessDetailView(mixins.UserOrganizationMixin, generics.RetrieveA
     lookup_field = "uuid"
 
 
-class AnalysisListView(mixins.UserOrganizationMixin, generics.ListAPIView):
+class AnalysisListView(
+    mixins.UserOrganizationMixin,
+    mixins.SparseFieldsMixin,
+    mixins.ConditionalGetMixin,
+    generics.ListAPIView,
+):
     """
     API view to retrieve a list of Analysis objects for the user's organization.
 
@@ -176,7 +216,12 @@ class AnalysisListView(mixins.UserOrganizationMixin, generics.ListAPIView):
     ordering = ["id"]
 
 
-class AnalysisDetailView(mixins.UserOrganizationMixin, generics.RetrieveAPIView):
+class AnalysisDetailView(
+    mixins.UserOrganizationMixin,
+    mixins.SparseFieldsMixin,
+    mixins.ConditionalGetMixin,
+    generics.RetrieveAPIView,
+):
     """
     API view to retrieve the details of a single Analysis object by UUID.
 
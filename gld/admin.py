@@ -35,15 +35,35 @@ class MeasurementTvpAdmin(admin.ModelAdmin):
     model = gld_models.MeasurementTvp
     list_display = (
         "observation",
-        "data_owner",
+        "time",
+        "value",
     )
 
-    list_filter = (
-        "data_owner",
+    list_filter = ("observation__data_owner",)
+    raw_id_fields = ("observation",)
+
+
+class MeasurementChunkAdmin(admin.ModelAdmin):
+    model = gld_models.MeasurementChunk
+    list_display = (
         "observation",
+        "period",
+        "count",
+    )
+
+    list_filter = ("observation__data_owner",)
+    raw_id_fields = ("observation",)
+    # The packed arrays are not editable by hand
+    exclude = (
+        "time_deltas",
+        "values",
+        "status_quality_control",
+        "censoring_reason",
+        "censoring_limit",
     )
 
 
 admin.site.register(gld_models.GLD, GLDAdmin)
 admin.site.register(gld_models.Observation, ObservationAdmin)
 admin.site.register(gld_models.MeasurementTvp, MeasurementTvpAdmin)
+admin.site.register(gld_models.MeasurementChunk, MeasurementChunkAdmin)
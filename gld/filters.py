@@ -1,5 +1,3 @@
-import datetime
-
 import django_filters
 from django.db.models import ForeignKey, JSONField
 from django_filters import CharFilter, DateFilter, FilterSet
@@ -10,21 +8,6 @@ from api.mixins import DateTimeFilterMixin
 from . import models as gld_models
 
 
-class DateTimeStringFilter(filters.Filter):
-    def filter(self, qs, value):
-        if value in (None, ""):
-            return qs
-        try:
-            # Ensure the value is in the correct format
-            datetime.datetime.strptime(value, "%Y-%m-%dT%H:%M:%SZ")
-            field_name = (
-                self.field_name if self.field_name else "error: field name not set"
-            )
-            return qs.filter(**{field_name: value})
-        except ValueError:
-            return qs.none()
-
-
 class GldFilter(DateTimeFilterMixin, FilterSet):
     bro_id__icontains = filters.CharFilter(field_name="bro_id", lookup_expr="icontains")
     research_first_date__gt = DateFilter(
@@ -64,8 +47,9 @@ class ObservationFilter(DateTimeFilterMixin, FilterSet):
         fields = "__all__"
 
 
-class MeasurementTvpFilter(DateTimeFilterMixin, FilterSet):
-    time = DateTimeStringFilter(field_name="time")
+class MeasurementTvpFilter(FilterSet):
+    time__gte = filters.IsoDateTimeFilter(field_name="time", lookup_expr="gte")
+    time__lt = filters.IsoDateTimeFilter(field_name="time", lookup_expr="lt")
 
     class Meta:
         model = gld_models.MeasurementTvp
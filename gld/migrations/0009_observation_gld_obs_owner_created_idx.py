@@ -0,0 +1,23 @@
+# Generated by Django 5.2.7 on 2026-10-19 12:20
+
+from django.contrib.postgres.operations import AddIndexConcurrently
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+    # Built concurrently, so uploads can keep adding observations meanwhile
+    atomic = False
+
+    dependencies = [
+        ("gld", "0008_gld_monitoring_tube"),
+    ]
+
+    operations = [
+        AddIndexConcurrently(
+            model_name="observation",
+            index=models.Index(
+                fields=["data_owner", "created", "uuid"],
+                name="gld_obs_owner_created_idx",
+            ),
+        ),
+    ]
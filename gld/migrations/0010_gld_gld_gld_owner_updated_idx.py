@@ -0,0 +1,19 @@
+# Generated by Django 5.2.7 on 2026-10-19 13:41
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+    dependencies = [
+        ("gld", "0009_observation_gld_obs_owner_created_idx"),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name="gld",
+            index=models.Index(
+                fields=["data_owner", "updated"],
+                name="gld_gld_owner_updated_idx",
+            ),
+        ),
+    ]
@@ -0,0 +1,133 @@
+# Generated by Django 5.2.7 on 2026-10-19 17:05
+
+import django.contrib.postgres.indexes
+import django.db.models.deletion
+from django.db import migrations, models
+
+# A measurement without a valid time can't be placed in its series, and would
+# abort the conversion below. Accepted are a date, a date and time, and a
+# date and time with an offset. The day is checked against the length of the
+# month, the CASE makes sure that only happens for values that match.
+IS_VALID_TIME = r"""
+CASE
+    WHEN "time" ~ '^[1-9][0-9]{3}-(0[1-9]|1[0-2])-(0[1-9]|[12][0-9]|3[01])([T ]([01][0-9]|2[0-3]):[0-5][0-9](:[0-5][0-9](\.[0-9]+)?)?(Z|[+-](0[0-9]|1[0-4])(:?[0-5][0-9])?)?)?$'
+    THEN substring("time" from 9 for 2)::int <= extract(
+        day from make_date(
+            substring("time" from 1 for 4)::int,
+            substring("time" from 6 for 2)::int,
+            1
+        ) + interval '1 month - 1 day'
+    )
+    ELSE false
+END
+"""
+
+DELETE_INVALID_TIME = f"""
+DELETE FROM gld_measurementtvp WHERE NOT {IS_VALID_TIME};
+"""
+
+# Times without an offset are Dutch time, like in the GLD bulk upload. Only
+# an offset after a time counts, the "-01" of a date alone is not one.
+TIME_AS_TIMESTAMPTZ = r"""
+CASE
+    WHEN "time" ~ '[T ][0-9:.]+(Z|[+-][0-9]{2}(:?[0-9]{2})?)$'
+    THEN "time"::timestamptz
+    ELSE "time"::timestamp AT TIME ZONE 'Europe/Amsterdam'
+END
+"""
+
+TIME_TO_TIMESTAMPTZ = f"""
+ALTER TABLE gld_measurementtvp ALTER COLUMN "time" TYPE timestamptz USING
+{TIME_AS_TIMESTAMPTZ};
+"""
+
+TIMESTAMPTZ_TO_TIME = r"""
+ALTER TABLE gld_measurementtvp ALTER COLUMN "time" TYPE varchar(100) USING
+    to_char("time" AT TIME ZONE 'UTC', 'YYYY-MM-DD"T"HH24:MI:SS"Z"');
+"""
+
+UUID_TO_BIGINT_KEY = """
+ALTER TABLE gld_measurementtvp DROP COLUMN uuid;
+ALTER TABLE gld_measurementtvp
+    ADD COLUMN id bigint GENERATED BY DEFAULT AS IDENTITY PRIMARY KEY;
+"""
+
+BIGINT_TO_UUID_KEY = """
+ALTER TABLE gld_measurementtvp DROP COLUMN id;
+ALTER TABLE gld_measurementtvp
+    ADD COLUMN uuid uuid NOT NULL DEFAULT gen_random_uuid() PRIMARY KEY;
+ALTER TABLE gld_measurementtvp ALTER COLUMN uuid DROP DEFAULT;
+"""
+
+
+class Migration(migrations.Migration):
+    dependencies = [
+        ("gld", "0010_gld_gld_gld_owner_updated_idx"),
+    ]
+
+    operations = [
+        migrations.RemoveField(
+            model_name="measurementtvp",
+            name="created",
+        ),
+        migrations.RemoveField(
+            model_name="measurementtvp",
+            name="updated",
+        ),
+        migrations.RemoveField(
+            model_name="measurementtvp",
+            name="data_owner",
+        ),
+        migrations.RunSQL(DELETE_INVALID_TIME, reverse_sql=migrations.RunSQL.noop),
+        migrations.SeparateDatabaseAndState(
+            database_operations=[
+                migrations.RunSQL(TIME_TO_TIMESTAMPTZ, reverse_sql=TIMESTAMPTZ_TO_TIME),
+            ],
+            state_operations=[
+                migrations.AlterField(
+                    model_name="measurementtvp",
+                    name="time",
+                    field=models.DateTimeField(),
+                ),
+            ],
+        ),
+        migrations.SeparateDatabaseAndState(
+            database_operations=[
+                migrations.RunSQL(UUID_TO_BIGINT_KEY, reverse_sql=BIGINT_TO_UUID_KEY),
+            ],
+            state_operations=[
+                migrations.RemoveField(
+                    model_name="measurementtvp",
+                    name="uuid",
+                ),
+                migrations.AddField(
+                    model_name="measurementtvp",
+                    name="id",
+                    field=models.BigAutoField(primary_key=True, serialize=False),
+                ),
+            ],
+        ),
+        migrations.AlterField(
+            model_name="measurementtvp",
+            name="observation",
+            field=models.ForeignKey(
+                db_index=False,
+                on_delete=django.db.models.deletion.CASCADE,
+                related_name="measurements",
+                to="gld.observation",
+            ),
+        ),
+        migrations.AddIndex(
+            model_name="measurementtvp",
+            index=models.Index(
+                fields=["observation", "time"],
+                name="gld_tvp_observation_time_idx",
+            ),
+        ),
+        migrations.AddIndex(
+            model_name="measurementtvp",
+            index=django.contrib.postgres.indexes.BrinIndex(
+                fields=["time"], name="gld_tvp_time_brin"
+            ),
+        ),
+    ]
@@ -0,0 +1,51 @@
+# Generated by Django 5.2.7 on 2026-10-19 18:10
+
+import django.db.models.deletion
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+    dependencies = [
+        ("gld", "0011_measurementtvp_compact_schema"),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name="MeasurementChunk",
+            fields=[
+                ("id", models.BigAutoField(primary_key=True, serialize=False)),
+                (
+                    "period",
+                    models.DateField(help_text="First day of the month (UTC)."),
+                ),
+                ("begin_time", models.DateTimeField()),
+                ("end_time", models.DateTimeField()),
+                ("count", models.PositiveIntegerField()),
+                ("time_deltas", models.BinaryField()),
+                ("values", models.BinaryField()),
+                ("status_quality_control", models.BinaryField()),
+                ("status_quality_control_labels", models.JSONField(default=list)),
+                ("censoring_reason", models.BinaryField()),
+                ("censoring_reason_labels", models.JSONField(default=list)),
+                ("censoring_limit", models.BinaryField()),
+                (
+                    "observation",
+                    models.ForeignKey(
+                        db_index=False,
+                        on_delete=django.db.models.deletion.CASCADE,
+                        related_name="measurement_chunks",
+                        to="gld.observation",
+                    ),
+                ),
+            ],
+            options={
+                "verbose_name_plural": "Measurement chunks",
+                "constraints": [
+                    models.UniqueConstraint(
+                        fields=("observation", "period"),
+                        name="gld_chunk_observation_period_uniq",
+                    )
+                ],
+            },
+        ),
+    ]
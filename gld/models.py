@@ -1,5 +1,6 @@
 import uuid
 
+from django.contrib.postgres.indexes import BrinIndex
 from django.db import models
 from django.db.models import JSONField, Manager
 
@@ -48,6 +49,13 @@ class GLD(models.Model):
 
     class Meta:
         verbose_name_plural = "GLD's"
+        indexes = [
+            # Validator for the ETag of the list
+            models.Index(
+                fields=["data_owner", "updated"],
+                name="gld_gld_owner_updated_idx",
+            ),
+        ]
 
     @property
     def nr_of_observations(self) -> int:
@@ -83,30 +91,95 @@ class Observation(models.Model):
 
     class Meta:
         verbose_name_plural = "Observations"
+        indexes = [
+            # Keyset for ?pagination=cursor
+            models.Index(
+                fields=["data_owner", "created", "uuid"],
+                name="gld_obs_owner_created_idx",
+            ),
+        ]
 
     @property
     def nr_of_measurements(self) -> int:
-        return self.measurements.count()
+        from .series import get_series_storage
+
+        return get_series_storage().count(self)
 
 
 class MeasurementTvp(models.Model):
     """Measurement Time-Value Pair
 
     A single event / measurement on a observation.
+
+    There can be millions of these, so they are kept small: a bigint key,
+    and the data owner and timestamps of their observation instead of
+    their own.
     """
 
-    uuid = models.UUIDField(primary_key=True, default=uuid.uuid4, editable=False)
+    id = models.BigAutoField(primary_key=True)
     observation = models.ForeignKey(
-        Observation, on_delete=models.CASCADE, null=False, related_name="measurements"
+        Observation,
+        on_delete=models.CASCADE,
+        null=False,
+        related_name="measurements",
+        # Covered by the (observation, time) index
+        db_index=False,
     )
-    time = models.CharField(max_length=100)
+    time = models.DateTimeField()
     value = models.FloatField(null=True, blank=True)
     status_quality_control = models.CharField(max_length=100, null=True)
     censoring_reason = models.CharField(max_length=100, null=True, blank=True)
     censoring_limit = models.CharField(max_length=100, null=True, blank=True)
-    created = models.DateTimeField(auto_now_add=True)
-    updated = models.DateTimeField(auto_now=True)
-    data_owner = models.ForeignKey("api.Organisation", on_delete=models.CASCADE)
 
     class Meta:
         verbose_name_plural = "Measurement time-value pairs"
+        indexes = [
+            # The series of an observation, or a window of it
+            models.Index(
+                fields=["observation", "time"],
+                name="gld_tvp_observation_time_idx",
+            ),
+            # Time ranges over all observations, a fraction of the btree size
+            BrinIndex(fields=["time"], name="gld_tvp_time_brin"),
+        ]
+
+
+class MeasurementChunk(models.Model):
+    """The measurements of an observation in one month, as packed arrays.
+
+    The alternative to one MeasurementTvp per measurement, selected with the
+    GLD_SERIES_STORAGE setting (see gld.series). The times are int64
+    milliseconds since the epoch, stored as differences to the previous
+    time, which compresses well for regular series. The values and
+    censoring limits are float64, with NaN for missing values. The quality
+    and censoring reason are uint8 indexes into the labels of the chunk.
+    """
+
+    id = models.BigAutoField(primary_key=True)
+    observation = models.ForeignKey(
+        Observation,
+        on_delete=models.CASCADE,
+        related_name="measurement_chunks",
+        # Covered by the unique (observation, period) constraint
+        db_index=False,
+    )
+    period = models.DateField(help_text="First day of the month (UTC).")
+    begin_time = models.DateTimeField()
+    end_time = models.DateTimeField()
+    count = models.PositiveIntegerField()
+    time_deltas = models.BinaryField()
+    values = models.BinaryField()
+    status_quality_control = models.BinaryField()
+    status_quality_control_labels = JSONField(default=list)
+    censoring_reason = models.BinaryField()
+    censoring_reason_labels = JSONField(default=list)
+    censoring_limit = models.BinaryField()
+
+    class Meta:
+        verbose_name_plural = "Measurement chunks"
+        constraints = [
+            models.UniqueConstraint(
+                fields=["observation", "period"],
+                name="gld_chunk_observation_period_uniq",
+            ),
+        ]
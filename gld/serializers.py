@@ -19,7 +19,9 @@ class GLDSerializer(UrlFieldMixin, RequiredFieldsMixin, serializers.ModelSeriali
         return list(linked_gmns)
 
     def get_nr_of_observations(self, obj: GLD) -> int:
-        return obj.nr_of_observations
+        # Annotated by the list and detail views
+        count = getattr(obj, "observation_count", None)
+        return obj.nr_of_observations if count is None else count
 
 
 class GLDIdsSerializer(serializers.ModelSerializer):
@@ -75,11 +77,13 @@ class ObservationSerializer(
         fields = "__all__"
 
     def get_nr_of_measurements(self, obj: Observation) -> int:
-        return obj.nr_of_measurements
+        # Annotated by the list and detail views
+        count = getattr(obj, "measurement_count", None)
+        return obj.nr_of_measurements if count is None else count
 
     def get_gld_bro_id(self, obj: Observation) -> str | None:
         try:
-            return GLD.objects.get(uuid=obj.gld.uuid).bro_id
+            return obj.gld.bro_id
         except ObjectDoesNotExist:
             return None
 
@@ -90,3 +94,34 @@ class MeasurementTvpSerializer(
     class Meta:
         model = MeasurementTvp
         fields = "__all__"
+
+
+class ObservationSeriesQuerySerializer(serializers.Serializer):
+    """Query parameters of the measurement series of an observation."""
+
+    start = serializers.DateTimeField(
+        required=False, help_text="First time to include (ISO 8601)."
+    )
+    end = serializers.DateTimeField(
+        required=False, help_text="Time to stop before (ISO 8601)."
+    )
+    max_points = serializers.IntegerField(
+        min_value=3,
+        max_value=20000,
+        default=2000,
+        help_text="Downsample to at most this many measurements.",
+    )
+    method = serializers.ChoiceField(
+        choices=["lttb", "minmax"],
+        default="lttb",
+        help_text=(
+            "lttb keeps the shape of the series, minmax the lowest and highest "
+            "measurement per time span."
+        ),
+    )
+
+    def validate(self, attrs):
+        start, end = attrs.get("start"), attrs.get("end")
+        if start and end and start >= end:
+            raise serializers.ValidationError({"end": "Must be after start."})
+        return attrs
@@ -0,0 +1,439 @@
+"""The measurements of an observation as NumPy arrays, and where they are stored.
+
+A deployment stores measurements either as one MeasurementTvp row per
+measurement ("rows", the default) or as MeasurementChunk rows with the
+packed arrays of a month ("chunks"), chosen with the GLD_SERIES_STORAGE
+setting. The chunks take a fraction of the space of the rows and read a
+month of 15 minute measurements as one row instead of ~3000. Code that
+reads or writes measurements goes through get_series_storage(), and gets
+a Series either way.
+"""
+
+import dataclasses
+import datetime
+import uuid
+
+import numpy as np
+from django.conf import settings
+from django.core.exceptions import ImproperlyConfigured
+from django.db import transaction
+from django.db.models import Exists, OuterRef, Subquery, Sum
+from django.db.models.functions import Coalesce
+
+from api.utils import count_subquery, to_float
+
+from .models import MeasurementChunk, MeasurementTvp, Observation
+
+# Milliseconds since the epoch, the resolution of the BRO
+TIME_UNIT = "ms"
+# A code of 0 is a missing label, the labels of a chunk start at 1
+MAX_LABELS = np.iinfo(np.uint8).max
+BULK_BATCH_SIZE = 5000
+
+
+def to_epoch_ms(moment: datetime.datetime) -> int:
+    return int(moment.timestamp() * 1000)
+
+
+def from_epoch_ms(epoch_ms: int) -> datetime.datetime:
+    return datetime.datetime.fromtimestamp(epoch_ms / 1000, tz=datetime.UTC)
+
+
+@dataclasses.dataclass
+class Series:
+    """Measurements ordered by time, one array per column.
+
+    Missing values and censoring limits are NaN, missing labels None.
+    """
+
+    times: np.ndarray  # int64, milliseconds since the epoch
+    values: np.ndarray  # float64
+    status_quality_control: np.ndarray  # object
+    censoring_reason: np.ndarray  # object
+    censoring_limit: np.ndarray  # float64
+
+    @classmethod
+    def empty(cls) -> "Series":
+        return cls.from_columns([], [], [], [], [])
+
+    @classmethod
+    def from_columns(
+        cls,
+        times,
+        values,
+        status_quality_control,
+        censoring_reason,
+        censoring_limit,
+    ) -> "Series":
+        """Builds a series from sequences of datetimes or epoch ms, and the other columns."""
+        times = [
+            to_epoch_ms(moment) if isinstance(moment, datetime.datetime) else moment
+            for moment in times
+        ]
+        series = cls(
+            times=np.asarray(times, dtype=np.int64),
+            values=np.asarray(
+                [np.nan if value is None else value for value in values],
+                dtype=np.float64,
+            ),
+            status_quality_control=np.asarray(status_quality_control, dtype=object),
+            censoring_reason=np.asarray(censoring_reason, dtype=object),
+            censoring_limit=np.asarray(
+                [to_float(limit) for limit in censoring_limit], dtype=np.float64
+            ),
+        )
+        return series.sorted()
+
+    @classmethod
+    def concatenate(cls, parts: list["Series"]) -> "Series":
+        if not parts:
+            return cls.empty()
+        return cls(
+            **{
+                field.name: np.concatenate(
+                    [getattr(part, field.name) for part in parts]
+                )
+                for field in dataclasses.fields(cls)
+            }
+        )
+
+    def __len__(self) -> int:
+        return len(self.times)
+
+    def _take(self, index) -> "Series":
+        return Series(
+            **{
+                field.name: getattr(self, field.name)[index]
+                for field in dataclasses.fields(self)
+            }
+        )
+
+    def sorted(self) -> "Series":
+        if np.all(self.times[1:] >= self.times[:-1]):
+            return self
+        return self._take(np.argsort(self.times, kind="stable"))
+
+    def window(
+        self,
+        start: datetime.datetime | None = None,
+        end: datetime.datetime | None = None,
+    ) -> "Series":
+        """The measurements from start up to, but not including, end."""
+        first = 0 if start is None else np.searchsorted(self.times, to_epoch_ms(start))
+        last = (
+            len(self) if end is None else np.searchsorted(self.times, to_epoch_ms(end))
+        )
+        return self._take(slice(first, last))
+
+    def resample(self, interval: datetime.timedelta) -> "Series":
+        """The mean value per interval, at the start of the interval.
+
+        The labels and censoring of a mean are unknown, so they are left out.
+        """
+        step = int(interval.total_seconds() * 1000)
+        if step <= 0:
+            raise ValueError("The interval must be positive")
+        if not len(self):
+            return self
+
+        bins, index = np.unique(self.times // step, return_inverse=True)
+        present = ~np.isnan(self.values)
+        sums = np.bincount(index, weights=np.where(present, self.values, 0))
+        counts = np.bincount(index, weights=present)
+        with np.errstate(invalid="ignore", divide="ignore"):
+            means = sums / counts
+        return Series(
+            times=bins * step,
+            values=means,
+            status_quality_control=np.full(len(bins), None, dtype=object),
+            censoring_reason=np.full(len(bins), None, dtype=object),
+            censoring_limit=np.full(len(bins), np.nan),
+        )
+
+    def min_max(self, max_points: int) -> "Series":
+        """The lowest and highest measurement of each of max_points / 2 equal time spans.
+
+        Keeps the peaks, which is what a chart of a long series needs to show.
+        """
+        if len(self) <= max_points:
+            return self
+
+        spans = max(max_points // 2, 1)
+        edges = np.linspace(self.times[0], self.times[-1] + 1, spans + 1)
+        span = np.searchsorted(edges, self.times, side="right") - 1
+        starts = np.flatnonzero(np.r_[True, span[1:] != span[:-1]])
+        ends = np.r_[starts[1:], len(self)] - 1
+        # Sorted by span, then value: the first of a span is its minimum, the
+        # last its maximum. Missing values sort last and first respectively.
+        lowest = np.lexsort(
+            (np.where(np.isnan(self.values), np.inf, self.values), span)
+        )
+        highest = np.lexsort(
+            (np.where(np.isnan(self.values), -np.inf, self.values), span)
+        )
+        return self._take(np.union1d(lowest[starts], highest[ends]))
+
+    def lttb(self, max_points: int) -> "Series":
+        """At most max_points measurements, picked with Largest-Triangle-Three-Buckets.
+
+        Keeps the first and last measurement, and from each bucket in between
+        the one that makes the largest triangle with the previously picked
+        measurement and the mean of the next bucket. Measurements without a
+        value are left out.
+        """
+        if max_points < 3:
+            raise ValueError("LTTB needs at least 3 points")
+        present = np.flatnonzero(~np.isnan(self.values))
+        if len(present) <= max_points:
+            return self._take(present)
+
+        x = (self.times[present] - self.times[present[0]]).astype(np.float64)
+        y = self.values[present]
+        last = len(x) - 1
+        edges = np.linspace(1, last, max_points - 1).astype(np.int64)
+        picked = np.empty(max_points, dtype=np.int64)
+        picked[0], picked[-1] = 0, last
+        previous = 0
+        for bucket in range(max_points - 2):
+            low, high = edges[bucket], edges[bucket + 1]
+            if bucket + 2 < len(edges):
+                next_low, next_high = edges[bucket + 1], edges[bucket + 2]
+            else:
+                next_low, next_high = last, last + 1
+            mean_x = x[next_low:next_high].mean()
+            mean_y = y[next_low:next_high].mean()
+            areas = np.abs(
+                (x[previous] - mean_x) * (y[low:high] - y[previous])
+                - (x[previous] - x[low:high]) * (mean_y - y[previous])
+            )
+            previous = low + int(np.argmax(areas))
+            picked[bucket + 1] = previous
+        return self._take(present[picked])
+
+    def datetimes(self) -> list[datetime.datetime]:
+        return [from_epoch_ms(int(epoch_ms)) for epoch_ms in self.times]
+
+    def to_tvps(self) -> list[dict]:
+        """The measurements as time-value pairs, like in a GLD addition."""
+        return [
+            {
+                "time": moment.isoformat(),
+                "value": None if np.isnan(value) else float(value),
+                "statusQualityControl": quality,
+                "censoringReason": reason,
+                "censoringLimit": None if np.isnan(limit) else float(limit),
+            }
+            for moment, value, quality, reason, limit in zip(
+                self.datetimes(),
+                self.values,
+                self.status_quality_control,
+                self.censoring_reason,
+                self.censoring_limit,
+                strict=True,
+            )
+        ]
+
+
+class RowStorage:
+    """One MeasurementTvp per measurement."""
+
+    name = "rows"
+
+    def read(
+        self,
+        observation: Observation | uuid.UUID,
+        start: datetime.datetime | None = None,
+        end: datetime.datetime | None = None,
+    ) -> Series:
+        measurements = MeasurementTvp.objects.filter(observation=observation)
+        if start is not None:
+            measurements = measurements.filter(time__gte=start)
+        if end is not None:
+            measurements = measurements.filter(time__lt=end)
+        rows = measurements.order_by("time").values_list(
+            "time",
+            "value",
+            "status_quality_control",
+            "censoring_reason",
+            "censoring_limit",
+        )
+        columns = list(zip(*rows, strict=True)) or [[]] * 5
+        return Series.from_columns(*columns)
+
+    @transaction.atomic
+    def write(self, observation: Observation | uuid.UUID, series: Series) -> None:
+        """Replaces the measurements of the observation."""
+        self.delete(observation)
+        MeasurementTvp.objects.bulk_create(
+            (
+                MeasurementTvp(
+                    observation_id=getattr(observation, "pk", observation),
+                    time=moment,
+                    value=tvp["value"],
+                    status_quality_control=tvp["statusQualityControl"],
+                    censoring_reason=tvp["censoringReason"],
+                    censoring_limit=(
+                        None
+                        if tvp["censoringLimit"] is None
+                        else str(tvp["censoringLimit"])
+                    ),
+                )
+                for moment, tvp in zip(
+                    series.datetimes(), series.to_tvps(), strict=True
+                )
+            ),
+            batch_size=BULK_BATCH_SIZE,
+        )
+
+    def delete(self, observation: Observation | uuid.UUID) -> None:
+        MeasurementTvp.objects.filter(observation=observation).delete()
+
+    def count_subquery(self) -> Coalesce:
+        """Annotation with the number of measurements of each observation."""
+        return count_subquery(MeasurementTvp.objects, "observation")
+
+    def exists_subquery(self) -> Exists:
+        """Annotation with whether an observation has measurements."""
+        return Exists(MeasurementTvp.objects.filter(observation=OuterRef("pk")))
+
+    def count(self, observation: Observation | uuid.UUID) -> int:
+        return MeasurementTvp.objects.filter(observation=observation).count()
+
+
+def _encode_labels(labels: np.ndarray) -> tuple[bytes, list[str]]:
+    """Dictionary encodes labels as uint8 codes, 0 for None."""
+    distinct = list(dict.fromkeys(label for label in labels if label is not None))
+    if len(distinct) > MAX_LABELS:
+        raise ValueError(f"More than {MAX_LABELS} distinct labels in one chunk")
+    code_of = {label: code for code, label in enumerate(distinct, start=1)}
+    codes = np.fromiter(
+        (code_of.get(label, 0) for label in labels), dtype=np.uint8, count=len(labels)
+    )
+    return codes.tobytes(), distinct
+
+
+def _decode_labels(codes: bytes, labels: list[str]) -> np.ndarray:
+    lookup = np.asarray([None, *labels], dtype=object)
+    return lookup[np.frombuffer(codes, dtype=np.uint8)]
+
+
+def _float_bytes(values: np.ndarray) -> bytes:
+    return values.astype("<f8").tobytes()
+
+
+class ChunkStorage:
+    """A MeasurementChunk per observation per month (UTC)."""
+
+    name = "chunks"
+
+    def read(
+        self,
+        observation: Observation | uuid.UUID,
+        start: datetime.datetime | None = None,
+        end: datetime.datetime | None = None,
+    ) -> Series:
+        chunks = MeasurementChunk.objects.filter(observation=observation)
+        if start is not None:
+            chunks = chunks.filter(end_time__gte=start)
+        if end is not None:
+            chunks = chunks.filter(begin_time__lt=end)
+        parts = [self._decode(chunk) for chunk in chunks.order_by("period")]
+        return Series.concatenate(parts).window(start, end)
+
+    @transaction.atomic
+    def write(self, observation: Observation | uuid.UUID, series: Series) -> None:
+        """Replaces the measurements of the observation."""
+        self.delete(observation)
+        if not len(series):
+            return
+        series = series.sorted()
+        months = series.times.astype(f"datetime64[{TIME_UNIT}]").astype("datetime64[M]")
+        # Index of the first measurement of each month
+        boundaries = np.flatnonzero(np.r_[True, months[1:] != months[:-1]])
+        ends = np.r_[boundaries[1:], len(series)]
+        MeasurementChunk.objects.bulk_create(
+            (
+                self._encode(
+                    observation,
+                    months[first].astype("datetime64[D]").item(),
+                    series._take(slice(first, last)),
+                )
+                for first, last in zip(boundaries, ends, strict=True)
+            ),
+            batch_size=BULK_BATCH_SIZE // 100,
+        )
+
+    def delete(self, observation: Observation | uuid.UUID) -> None:
+        MeasurementChunk.objects.filter(observation=observation).delete()
+
+    def count_subquery(self) -> Coalesce:
+        """Annotation with the number of measurements of each observation."""
+        counts = (
+            MeasurementChunk.objects.filter(observation=OuterRef("pk"))
+            .order_by()
+            .values("observation")
+            .annotate(total=Sum("count"))
+            .values("total")
+        )
+        return Coalesce(Subquery(counts), 0)
+
+    def exists_subquery(self) -> Exists:
+        """Annotation with whether an observation has measurements."""
+        return Exists(MeasurementChunk.objects.filter(observation=OuterRef("pk")))
+
+    def count(self, observation: Observation | uuid.UUID) -> int:
+        total = MeasurementChunk.objects.filter(observation=observation).aggregate(
+            total=Sum("count")
+        )["total"]
+        return total or 0
+
+    def _encode(
+        self,
+        observation: Observation | uuid.UUID,
+        period: datetime.date,
+        series: Series,
+    ) -> MeasurementChunk:
+        quality, quality_labels = _encode_labels(series.status_quality_control)
+        reason, reason_labels = _encode_labels(series.censoring_reason)
+        return MeasurementChunk(
+            observation_id=getattr(observation, "pk", observation),
+            period=period,
+            begin_time=from_epoch_ms(int(series.times[0])),
+            end_time=from_epoch_ms(int(series.times[-1])),
+            count=len(series),
+            time_deltas=np.diff(series.times, prepend=0).astype("<i8").tobytes(),
+            values=_float_bytes(series.values),
+            status_quality_control=quality,
+            status_quality_control_labels=quality_labels,
+            censoring_reason=reason,
+            censoring_reason_labels=reason_labels,
+            censoring_limit=_float_bytes(series.censoring_limit),
+        )
+
+    def _decode(self, chunk: MeasurementChunk) -> Series:
+        return Series(
+            times=np.cumsum(np.frombuffer(bytes(chunk.time_deltas), dtype="<i8")),
+            values=np.frombuffer(bytes(chunk.values), dtype="<f8"),
+            status_quality_control=_decode_labels(
+                bytes(chunk.status_quality_control),
+                chunk.status_quality_control_labels,
+            ),
+            censoring_reason=_decode_labels(
+                bytes(chunk.censoring_reason), chunk.censoring_reason_labels
+            ),
+            censoring_limit=np.frombuffer(bytes(chunk.censoring_limit), dtype="<f8"),
+        )
+
+
+STORAGES = {storage.name: storage for storage in (RowStorage, ChunkStorage)}
+
+
+def get_series_storage(name: str | None = None) -> RowStorage | ChunkStorage:
+    """The storage of this deployment, or the one with the given name."""
+    name = name or settings.GLD_SERIES_STORAGE
+    try:
+        return STORAGES[name]()
+    except KeyError:
+        raise ImproperlyConfigured(
+            f"Unknown GLD_SERIES_STORAGE {name!r}, use one of {', '.join(STORAGES)}"
+        ) from None
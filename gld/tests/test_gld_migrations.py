@@ -0,0 +1,77 @@
+import datetime
+import importlib
+
+import pytest
+from django.db import connection
+
+compact_schema = importlib.import_module(
+    "gld.migrations.0011_measurementtvp_compact_schema"
+)
+
+
+def convert_time(value: str) -> datetime.datetime:
+    """Converts a stored time like migration 0011 does."""
+    with connection.cursor() as cursor:
+        cursor.execute(
+            "SELECT "
+            + compact_schema.TIME_AS_TIMESTAMPTZ
+            + ' FROM (VALUES (%s)) AS measurement("time")',
+            [value],
+        )
+        return cursor.fetchone()[0]
+
+
+@pytest.mark.django_db
+@pytest.mark.parametrize(
+    "value, expected",
+    [
+        # With an offset or Z, the time is kept
+        ("2024-01-01T12:00:00Z", datetime.datetime(2024, 1, 1, 12)),
+        ("2024-01-01T12:00:00+02:00", datetime.datetime(2024, 1, 1, 10)),
+        ("2024-01-01T12:00:00.5-0100", datetime.datetime(2024, 1, 1, 13, 0, 0, 500000)),
+        # Without, it is Dutch time (CET in winter, CEST in summer)
+        ("2024-01-01T12:00:00", datetime.datetime(2024, 1, 1, 11)),
+        ("2024-07-01 12:00:00", datetime.datetime(2024, 7, 1, 10)),
+        # The "-01" of a date is no offset
+        ("2024-01-01", datetime.datetime(2023, 12, 31, 23)),
+    ],
+)
+def test_time_to_timestamptz(value, expected):
+    assert convert_time(value) == expected.replace(tzinfo=datetime.UTC)
+
+
+def is_valid_time(value: str) -> bool:
+    """Whether migration 0011 keeps a stored time."""
+    with connection.cursor() as cursor:
+        cursor.execute(
+            "SELECT "
+            + compact_schema.IS_VALID_TIME
+            + ' FROM (VALUES (%s)) AS measurement("time")',
+            [value],
+        )
+        return cursor.fetchone()[0]
+
+
+@pytest.mark.django_db
+@pytest.mark.parametrize(
+    "value, valid",
+    [
+        ("2024-01-01", True),
+        ("2024-01-01T12:00", True),
+        ("2024-07-01 12:00:00", True),
+        ("2024-01-01T12:00:00.5-0100", True),
+        ("2024-02-29T12:00:00Z", True),
+        ("", False),
+        ("onbekend", False),
+        ("2020-13-45", False),
+        ("2023-02-29", False),
+        ("2024-01-01T25:00:00", False),
+        ("2024-01-01T12:00:00 CET", False),
+        ("2024-01-01T12:00:00+25:00", False),
+    ],
+)
+def test_invalid_times_are_deleted(value, valid):
+    assert is_valid_time(value) is valid
+    if valid:
+        # The valid times can all be converted
+        convert_time(value)
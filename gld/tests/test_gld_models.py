@@ -65,9 +65,8 @@ class MeasurementTvpModelTestCase(TestCase):
         )
         self.measurement = MeasurementTvp.objects.create(
             observation=self.observation,
-            time="2023-01-01T12:00:00Z",
+            time=datetime.datetime(2023, 1, 1, 12, tzinfo=datetime.UTC),
             value=10.5,
-            data_owner=self.organisation,
         )
 
     def test_measurement_creation(self):
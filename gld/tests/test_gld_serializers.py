@@ -63,9 +63,8 @@ class MeasurementTvpSerializerTestCase(TestCase):
         )
         self.measurement = MeasurementTvp.objects.create(
             observation=self.observation,
-            time="2023-01-01T12:00:00Z",
+            time=datetime.datetime(2023, 1, 1, 12, tzinfo=datetime.UTC),
             value=10.5,
-            data_owner=self.organisation,
         )
 
     def test_serializer_data(self):
@@ -73,4 +72,3 @@ class MeasurementTvpSerializerTestCase(TestCase):
         self.assertIn("value", serializer.data)
         self.assertEqual(serializer.data["value"], 10.5)
         self.assertEqual(serializer.data["time"], "2023-01-01T12:00:00Z")
-        self.assertEqual(serializer.data["data_owner"], self.organisation.uuid)
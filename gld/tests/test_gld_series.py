@@ -0,0 +1,141 @@
+import datetime
+
+import numpy as np
+import pytest
+from django.core.exceptions import ImproperlyConfigured
+
+from api.tests import fixtures
+from gld.models import MeasurementChunk, MeasurementTvp, Observation
+from gld.series import ChunkStorage, RowStorage, Series, get_series_storage
+
+organisation = fixtures.organisation
+gld = fixtures.gld
+observation = fixtures.observation
+
+START = datetime.datetime(2024, 1, 31, 23, 0, tzinfo=datetime.UTC)
+QUARTER = datetime.timedelta(minutes=15)
+
+
+@pytest.fixture
+def series():
+    # Eight quarters around a month boundary, given in reverse order
+    return Series.from_columns(
+        [START + i * QUARTER for i in reversed(range(8))],
+        [8.0, 7.0, None, 5.0, 4.0, 3.0, 2.0, 1.0],
+        ["goedgekeurd", None] * 4,
+        [None] * 7 + ["kleinerDanLimietwaarde"],
+        [None] * 7 + ["0.5"],
+    )
+
+
+def test_series_is_sorted(series):
+    assert series.datetimes()[0] == START
+    assert np.all(np.diff(series.times) == 15 * 60 * 1000)
+    assert series.values[0] == 1.0
+
+
+def test_series_window(series):
+    window = series.window(START + 2 * QUARTER, START + 4 * QUARTER)
+    assert window.datetimes() == [START + 2 * QUARTER, START + 3 * QUARTER]
+
+
+def test_series_resample_skips_missing_values(series):
+    hourly = series.resample(datetime.timedelta(hours=1))
+    assert hourly.datetimes() == [START, START + 4 * QUARTER]
+    # The missing value at 00:15 is left out of the mean
+    assert hourly.values.tolist() == [2.5, (5.0 + 7.0 + 8.0) / 3]
+
+
+def test_series_to_tvps(series):
+    tvp = series.to_tvps()[0]
+    assert tvp == {
+        "time": "2024-01-31T23:00:00+00:00",
+        "value": 1.0,
+        "statusQualityControl": None,
+        "censoringReason": "kleinerDanLimietwaarde",
+        "censoringLimit": 0.5,
+    }
+
+
+def test_get_series_storage(settings):
+    assert isinstance(get_series_storage(), RowStorage)
+    settings.GLD_SERIES_STORAGE = "chunks"
+    assert isinstance(get_series_storage(), ChunkStorage)
+    settings.GLD_SERIES_STORAGE = "parquet"
+    with pytest.raises(ImproperlyConfigured):
+        get_series_storage()
+
+
+@pytest.mark.django_db
+@pytest.mark.parametrize("storage", [RowStorage(), ChunkStorage()])
+def test_storage_round_trip(storage, observation, series):
+    storage.write(observation, series)
+    stored = storage.read(observation)
+
+    assert stored.times.tolist() == series.times.tolist()
+    assert np.array_equal(stored.values, series.values, equal_nan=True)
+    assert stored.to_tvps() == series.to_tvps()
+    assert storage.count(observation) == 8
+
+
+@pytest.mark.django_db
+@pytest.mark.parametrize("storage", [RowStorage(), ChunkStorage()])
+def test_storage_read_window(storage, observation, series):
+    storage.write(observation, series)
+    window = storage.read(observation, START + QUARTER, START + 5 * QUARTER)
+    assert window.values.tolist() == [2.0, 3.0, 4.0, 5.0]
+
+
+@pytest.mark.django_db
+@pytest.mark.parametrize("storage", [RowStorage(), ChunkStorage()])
+def test_storage_write_replaces(storage, observation, series):
+    storage.write(observation, series)
+    storage.write(observation, series.window(end=START + QUARTER))
+    assert storage.count(observation) == 1
+
+
+@pytest.mark.django_db
+@pytest.mark.parametrize("storage", [RowStorage(), ChunkStorage()])
+def test_storage_annotations(storage, observation, series):
+    storage.write(observation, series)
+    annotated = Observation.objects.annotate(
+        measurement_count=storage.count_subquery(),
+        has_measurements=storage.exists_subquery(),
+    ).get()
+    assert annotated.measurement_count == 8
+    assert annotated.has_measurements
+
+
+@pytest.mark.django_db
+def test_chunk_storage_packs_months(observation, series):
+    ChunkStorage().write(observation, series)
+
+    chunks = MeasurementChunk.objects.order_by("period")
+    assert [chunk.period for chunk in chunks] == [
+        datetime.date(2024, 1, 1),
+        datetime.date(2024, 2, 1),
+    ]
+    assert [chunk.count for chunk in chunks] == [4, 4]
+    assert chunks[0].status_quality_control_labels == ["goedgekeurd"]
+    assert not MeasurementTvp.objects.exists()
+
+
+@pytest.mark.django_db
+def test_nr_of_measurements_uses_storage(observation, series, settings):
+    settings.GLD_SERIES_STORAGE = "chunks"
+    ChunkStorage().write(observation, series)
+    assert observation.nr_of_measurements == 8
+
+
+def test_series_lttb_keeps_ends(series):
+    picked = series.lttb(4)
+    # The missing value is never picked
+    assert len(picked) == 4
+    assert not np.isnan(picked.values).any()
+    assert picked.times[0] == series.times[0]
+    assert picked.times[-1] == series.times[-1]
+
+
+def test_series_min_max_keeps_peaks(series):
+    picked = series.min_max(4)
+    assert set(picked.values.tolist()) == {1.0, 4.0, 5.0, 8.0}
@@ -1,17 +1,23 @@
 import datetime
 
+import pyarrow as pa
 import pytest
+from django.db import connection
+from django.test.utils import CaptureQueriesContext
 from django.urls import reverse
 from rest_framework import status
 from rest_framework.test import APIClient, APITestCase
 
 from api.models import InviteUser, Organisation
 from api.tests import fixtures
-from gld.models import GLD, Observation
+from gld.models import GLD, MeasurementTvp, Observation
+from gld.series import Series, get_series_storage
 
 user = fixtures.user
 organisation = fixtures.organisation  # imported, even though not used in this file, because required for userprofile fixture
 userprofile = fixtures.userprofile
+gld = fixtures.gld
+observation = fixtures.observation
 
 
 @pytest.fixture
@@ -106,3 +112,281 @@ class ObservationViewTestCase(APITestCase):
         )
         response = self.client.get(url)
         self.assertEqual(response.status_code, status.HTTP_200_OK)
+
+
+def nr_of_queries(api_client, url):
+    with CaptureQueriesContext(connection) as context:
+        response = api_client.get(url)
+    assert response.status_code == 200
+    return len(context.captured_queries)
+
+
+@pytest.fixture
+def authenticated_client(api_client, user, userprofile):
+    api_client.force_authenticate(user=user)
+    # Warm up, so the userprofile lookup is cached on the user
+    api_client.get(reverse("api:gld:gld-ids"))
+    return api_client
+
+
+@pytest.mark.django_db
+def test_gld_list_counts_are_annotated(authenticated_client, organisation, gld):
+    url = reverse("api:gld:gld-list")
+    Observation.objects.create(
+        gld=gld,
+        data_owner=organisation,
+        observation_id="_obs1",
+        begin_position=datetime.date(2024, 1, 1),
+        end_position=datetime.date(2024, 12, 31),
+        result_time=datetime.datetime(2024, 12, 31, tzinfo=fixtures.TZ_INFO),
+    )
+    baseline = nr_of_queries(authenticated_client, url)
+
+    for index in range(3):
+        GLD.objects.create(data_owner=organisation, bro_id=f"GLD00000000000{index}")
+
+    assert nr_of_queries(authenticated_client, url) == baseline
+    results = authenticated_client.get(url).json()["results"]
+    assert sorted(result["nr_of_observations"] for result in results) == [0, 0, 0, 1]
+
+
+@pytest.mark.django_db
+def test_gld_detail_counts(authenticated_client, gld):
+    url = reverse("api:gld:gld-detail", kwargs={"uuid": gld.uuid})
+
+    assert nr_of_queries(authenticated_client, url) == 1
+    assert authenticated_client.get(url).json()["nr_of_observations"] == 0
+
+
+@pytest.mark.django_db
+def test_observation_list_counts_are_annotated(
+    authenticated_client, organisation, gld, observation
+):
+    url = reverse("api:gld:observation-list")
+    MeasurementTvp.objects.create(
+        observation=observation,
+        time=datetime.datetime(2024, 6, 1, tzinfo=fixtures.TZ_INFO),
+        value=1.0,
+    )
+    baseline = nr_of_queries(authenticated_client, url)
+
+    for index in range(3):
+        Observation.objects.create(
+            gld=gld,
+            data_owner=organisation,
+            observation_id=f"_obs{index + 2}",
+            begin_position=datetime.date(2024, 1, 1),
+            end_position=datetime.date(2024, 12, 31),
+            result_time=datetime.datetime(2024, 12, 31, tzinfo=fixtures.TZ_INFO),
+        )
+
+    assert nr_of_queries(authenticated_client, url) == baseline
+    results = authenticated_client.get(url).json()["results"]
+    assert sorted(result["nr_of_measurements"] for result in results) == [0, 0, 0, 1]
+    assert {result["gld_bro_id"] for result in results} == {gld.bro_id}
+
+
+@pytest.mark.django_db
+def test_observation_counts_follow_series_storage(
+    authenticated_client, observation, settings
+):
+    settings.GLD_SERIES_STORAGE = "chunks"
+    get_series_storage().write(
+        observation,
+        Series.from_columns(
+            [datetime.datetime(2024, 6, 1, tzinfo=datetime.UTC)],
+            [1.0],
+            ["goedgekeurd"],
+            [None],
+            [None],
+        ),
+    )
+
+    url = reverse("api:gld:observation-detail", kwargs={"uuid": observation.uuid})
+    assert authenticated_client.get(url).json()["nr_of_measurements"] == 1
+    results = authenticated_client.get(reverse("api:gld:observation-list")).json()
+    assert results["results"][0]["nr_of_measurements"] == 1
+
+
+@pytest.mark.django_db
+def test_observation_detail_counts(authenticated_client, observation):
+    url = reverse("api:gld:observation-detail", kwargs={"uuid": observation.uuid})
+
+    # Observation with its GLD
+    assert nr_of_queries(authenticated_client, url) == 1
+    assert authenticated_client.get(url).json()["gld_bro_id"] == observation.gld.bro_id
+
+
+@pytest.mark.django_db
+def test_gld_list_sparse_fields(authenticated_client, gld):
+    url = reverse("api:gld:gld-list") + "?fields=uuid,bro_id"
+    with CaptureQueriesContext(connection) as context:
+        response = authenticated_client.get(url)
+
+    result = response.json()["results"][0]
+    assert set(result) == {"url", "uuid", "bro_id"}
+    # The unused JSON column is not fetched
+    assert not any("linked_gmns" in query["sql"] for query in context)
+
+
+@pytest.mark.django_db
+def test_gld_list_omit_keeps_method_field_sources(
+    authenticated_client, organisation, gld
+):
+    url = reverse("api:gld:gld-list") + "?omit=url"
+    baseline = nr_of_queries(authenticated_client, url)
+
+    for index in range(3):
+        GLD.objects.create(data_owner=organisation, bro_id=f"GLD00000000000{index}")
+
+    # linked_gmns is read by get_linked_gmns, so it must not be deferred
+    assert nr_of_queries(authenticated_client, url) == baseline
+    results = authenticated_client.get(url).json()["results"]
+    assert all(result["linked_gmns"] == [] for result in results)
+
+
+@pytest.mark.django_db
+def test_observation_list_omit_fields(authenticated_client, observation):
+    url = reverse("api:gld:observation-list") + "?omit=nr_of_measurements,gld_bro_id"
+    result = authenticated_client.get(url).json()["results"][0]
+
+    assert "nr_of_measurements" not in result
+    assert "gld_bro_id" not in result
+    assert result["observation_id"] == observation.observation_id
+
+
+@pytest.mark.django_db
+def test_gld_list_not_modified(authenticated_client, organisation, gld):
+    url = reverse("api:gld:gld-list")
+    etag = authenticated_client.get(url)["ETag"]
+
+    with CaptureQueriesContext(connection) as context:
+        response = authenticated_client.get(url, HTTP_IF_NONE_MATCH=etag)
+    assert response.status_code == 304
+    # The GLDs, and the observations they count
+    assert len(context.captured_queries) == 2
+
+    GLD.objects.create(data_owner=organisation, bro_id="GLD000000000001")
+    response = authenticated_client.get(url, HTTP_IF_NONE_MATCH=etag)
+    assert response.status_code == 200
+    assert response["ETag"] != etag
+
+
+@pytest.mark.django_db
+def test_gld_list_modified_by_new_observation(authenticated_client, organisation, gld):
+    url = reverse("api:gld:gld-list")
+    etag = authenticated_client.get(url)["ETag"]
+
+    Observation.objects.create(
+        data_owner=organisation,
+        gld=gld,
+        observation_id="_obs2",
+        begin_position=datetime.date(2025, 1, 1),
+        end_position=datetime.date(2025, 12, 31),
+        result_time=datetime.datetime(2025, 12, 31, tzinfo=datetime.UTC),
+        observation_type="reguliereMeting",
+    )
+    response = authenticated_client.get(url, HTTP_IF_NONE_MATCH=etag)
+    assert response.status_code == 200
+    assert response.json()["results"][0]["nr_of_observations"] == 1
+
+
+@pytest.mark.django_db
+def test_gld_detail_not_modified(authenticated_client, gld):
+    url = reverse("api:gld:gld-detail", kwargs={"uuid": gld.uuid})
+    etag = authenticated_client.get(url)["ETag"]
+
+    response = authenticated_client.get(url, HTTP_IF_NONE_MATCH=etag)
+    assert response.status_code == 304
+
+    gld.research_last_date = datetime.date(2025, 1, 1)
+    gld.save()
+    response = authenticated_client.get(url, HTTP_IF_NONE_MATCH=etag)
+    assert response.status_code == 200
+
+
+@pytest.fixture
+def hourly_measurements(observation):
+    start = datetime.datetime(2024, 1, 1, tzinfo=datetime.UTC)
+    get_series_storage().write(
+        observation,
+        Series.from_columns(
+            [start + datetime.timedelta(hours=hour) for hour in range(100)],
+            [float(hour % 10) for hour in range(100)],
+            ["goedgekeurd"] * 100,
+            [None] * 100,
+            [None] * 100,
+        ),
+    )
+    return observation
+
+
+@pytest.mark.django_db
+def test_observation_series(authenticated_client, hourly_measurements):
+    url = reverse(
+        "api:gld:observation-series", kwargs={"uuid": hourly_measurements.uuid}
+    )
+    data = authenticated_client.get(url).json()
+
+    assert data["count"] == 100
+    assert not data["downsampled"]
+    assert data["measurements"][1] == {
+        "time": "2024-01-01T01:00:00+00:00",
+        "value": 1.0,
+        "statusQualityControl": "goedgekeurd",
+        "censoringReason": None,
+        "censoringLimit": None,
+    }
+
+
+@pytest.mark.django_db
+@pytest.mark.parametrize("method", ["lttb", "minmax"])
+def test_observation_series_downsampled(
+    authenticated_client, hourly_measurements, method
+):
+    url = reverse(
+        "api:gld:observation-series", kwargs={"uuid": hourly_measurements.uuid}
+    )
+    data = authenticated_client.get(
+        url,
+        {
+            "start": "2024-01-02T00:00:00Z",
+            "end": "2024-01-04T00:00:00Z",
+            "max_points": 10,
+            "method": method,
+        },
+    ).json()
+
+    assert data["count"] == 48
+    assert data["downsampled"]
+    assert len(data["measurements"]) <= 10
+    # The peaks survive
+    values = [measurement["value"] for measurement in data["measurements"]]
+    assert max(values) == 9.0
+
+
+@pytest.mark.django_db
+def test_observation_series_arrow(authenticated_client, hourly_measurements):
+    url = reverse(
+        "api:gld:observation-series", kwargs={"uuid": hourly_measurements.uuid}
+    )
+    response = authenticated_client.get(
+        url, HTTP_ACCEPT="application/vnd.apache.arrow.stream"
+    )
+
+    assert response.status_code == status.HTTP_200_OK
+    assert response["X-Measurement-Count"] == "100"
+    table = pa.ipc.open_stream(response.content).read_all()
+    assert table.num_rows == 100
+    assert table.column("value").to_pylist()[:3] == [0.0, 1.0, 2.0]
+
+
+@pytest.mark.django_db
+def test_observation_series_invalid_range(authenticated_client, observation):
+    url = reverse("api:gld:observation-series", kwargs={"uuid": observation.uuid})
+    response = authenticated_client.get(
+        url, {"start": "2024-02-01T00:00:00Z", "end": "2024-01-01T00:00:00Z"}
+    )
+
+    assert response.status_code == status.HTTP_400_BAD_REQUEST
+    assert "end" in response.json()
@@ -14,4 +14,9 @@ urlpatterns = [
         views.ObservationDetailView.as_view(),
         name="observation-detail",
     ),
+    path(
+        "observations/<uuid:uuid>/series/",
+        views.ObservationSeriesView.as_view(),
+        name="observation-series",
+    ),
 ]
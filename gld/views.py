@@ -1,13 +1,47 @@
+import pyarrow as pa
+from django.db.models import QuerySet
 from django_filters.rest_framework import DjangoFilterBackend
-from rest_framework import generics
+from drf_yasg import openapi
+from drf_yasg.utils import swagger_auto_schema
+from rest_framework import generics, renderers
+from rest_framework.response import Response
 
 from api import mixins
+from api.utils import count_subquery
 
 from . import filters, serializers
 from . import models as gld_models
+from .series import Series, get_series_storage
 
+ARROW_STREAM = "application/vnd.apache.arrow.stream"
 
-class GLDListView(mixins.UserOrganizationMixin, generics.ListAPIView):
+# Counts shown by the GLD and Observation serializers, annotated instead of
+# queried per row
+GLD_WITH_COUNTS = gld_models.GLD.objects.annotate(
+    observation_count=count_subquery(gld_models.Observation.objects, "gld"),
+)
+
+
+class MeasurementCountMixin:
+    """Annotates the measurement counts of the Observation serializer.
+
+    Annotated per request, as the counts come from the series storage of
+    GLD_SERIES_STORAGE (see gld.series).
+    """
+
+    def get_queryset(self) -> QuerySet:
+        queryset = super().get_queryset()  # type: ignore
+        return queryset.select_related("gld").annotate(
+            measurement_count=get_series_storage().count_subquery()
+        )
+
+
+class GLDListView(
+    mixins.UserOrganizationMixin,
+    mixins.SparseFieldsMixin,
+    mixins.ConditionalGetMixin,
+    generics.ListAPIView,
+):
     """
     API view to retrieve a list of GLD objects for the user's organization.
 
@@ -16,14 +50,20 @@ class GLDListView(mixins.UserOrganizationMixin, generics.ListAPIView):
     """
 
     serializer_class = serializers.GLDSerializer
-    queryset = gld_models.GLD.objects.all()
+    etag_related_models = (gld_models.Observation,)
+    queryset = GLD_WITH_COUNTS
 
     filter_backends = [DjangoFilterBackend]
     filterset_class = filters.GldFilter
     ordering = ["id"]
 
 
-class GLDIdsList(mixins.UserOrganizationMixin, generics.ListAPIView):
+class GLDIdsList(
+    mixins.UserOrganizationMixin,
+    mixins.SparseFieldsMixin,
+    mixins.ConditionalGetMixin,
+    generics.ListAPIView,
+):
     """
     API view to retrieve a list of GLD IDs for the user's organization.
 
@@ -39,7 +79,12 @@ class GLDIdsList(mixins.UserOrganizationMixin, generics.ListAPIView):
     ordering = ["id"]
 
 
-class GLDOverviewList(mixins.UserOrganizationMixin, generics.ListAPIView):
+class GLDOverviewList(
+    mixins.UserOrganizationMixin,
+    mixins.SparseFieldsMixin,
+    mixins.ConditionalGetMixin,
+    generics.ListAPIView,
+):
     """
     API view to retrieve an overview list of GLD objects for the user's organization.
 
@@ -49,13 +94,19 @@ class GLDOverviewList(mixins.UserOrganizationMixin, generics.ListAPIView):
 
     queryset = gld_models.GLD.objects.all()
     serializer_class = serializers.GLDOverviewSerializer
+    etag_related_models = (gld_models.Observation,)
 
     filter_backends = [DjangoFilterBackend]
     filterset_class = filters.GldFilter
     ordering = ["id"]
 
 
-class GLDDetailView(mixins.UserOrganizationMixin, generics.RetrieveAPIView):
+class GLDDetailView(
+    mixins.UserOrganizationMixin,
+    mixins.SparseFieldsMixin,
+    mixins.ConditionalGetMixin,
+    generics.RetrieveAPIView,
+):
     """
     API view to retrieve the details of a single GLD object by UUID.
 
@@ -66,12 +117,18 @@ class GLDDetailView(mixins.UserOrganizationMixin, generics.RetrieveAPIView):
         Detailed information about the specified GLD object.
     """
 
-    queryset = gld_models.GLD.objects.all()
+    queryset = GLD_WITH_COUNTS
     serializer_class = serializers.GLDSerializer
+    etag_related_models = (gld_models.Observation,)
     lookup_field = "uuid"
 
 
-class ObservationListView(mixins.UserOrganizationMixin, generics.ListAPIView):
+class ObservationListView(
+    mixins.UserOrganizationMixin,
+    mixins.SparseFieldsMixin,
+    MeasurementCountMixin,
+    generics.ListAPIView,
+):
     """
     API view to retrieve a list of Observation objects for the user's organization.
 
@@ -80,14 +137,19 @@ class ObservationListView(mixins.UserOrganizationMixin, generics.ListAPIView):
     """
 
     serializer_class = serializers.ObservationSerializer
-    queryset = gld_models.Observation.objects.all().order_by("-created")
+    queryset = gld_models.Observation.objects.order_by("-created")
 
     filter_backends = [DjangoFilterBackend]
     filterset_class = filters.ObservationFilter
     ordering = ["id"]
 
 
-class ObservationDetailView(mixins.UserOrganizationMixin, generics.RetrieveAPIView):
+class ObservationDetailView(
+    mixins.UserOrganizationMixin,
+    mixins.SparseFieldsMixin,
+    MeasurementCountMixin,
+    generics.RetrieveAPIView,
+):
     """
     API view to retrieve the details of a single Observation object by UUID.
 
@@ -101,3 +163,87 @@ class ObservationDetailView(mixins.UserOrganizationMixin, generics.RetrieveAPIVi
     queryset = gld_models.Observation.objects.all()
     serializer_class = serializers.ObservationSerializer
     lookup_field = "uuid"
+
+
+class ArrowStreamRenderer(renderers.BaseRenderer):
+    """Renders a Series as an Arrow IPC stream, with ?format=arrow or the Accept header.
+
+    Errors are still rendered as JSON.
+    """
+
+    media_type = ARROW_STREAM
+    format = "arrow"
+    charset = None
+    render_style = "binary"
+
+    def render(self, data, accepted_media_type=None, renderer_context=None):
+        if not isinstance(data, Series):
+            return renderers.JSONRenderer().render(data)
+
+        table = pa.table(
+            {
+                "time": pa.array(data.times, type=pa.timestamp("ms", tz="UTC")),
+                "value": pa.array(data.values, from_pandas=True),
+                "status_quality_control": pa.array(
+                    data.status_quality_control, type=pa.string()
+                ),
+                "censoring_reason": pa.array(data.censoring_reason, type=pa.string()),
+                "censoring_limit": pa.array(data.censoring_limit, from_pandas=True),
+            }
+        )
+        sink = pa.BufferOutputStream()
+        with pa.ipc.new_stream(sink, table.schema) as writer:
+            writer.write_table(table)
+        return sink.getvalue().to_pybytes()
+
+
+class ObservationSeriesView(mixins.UserOrganizationMixin, generics.GenericAPIView):
+    """Endpoint to get the measurements of an observation, downsampled for charts"""
+
+    queryset = gld_models.Observation.objects.all()
+    lookup_field = "uuid"
+    renderer_classes = [
+        renderers.JSONRenderer,
+        renderers.BrowsableAPIRenderer,
+        ArrowStreamRenderer,
+    ]
+
+    @swagger_auto_schema(
+        operation_description=(
+            "Get the measurements of an observation between start and end, "
+            "downsampled to at most max_points. Use ?format=arrow or 'Accept: "
+            f"{ARROW_STREAM}' to get them as an Arrow IPC stream instead of JSON."
+        ),
+        query_serializer=serializers.ObservationSeriesQuerySerializer,
+        responses={
+            200: openapi.Response(
+                description="The (downsampled) measurements",
+                schema=openapi.Schema(type=openapi.TYPE_OBJECT),
+            )
+        },
+    )
+    def get(self, request, uuid) -> Response:
+        observation = self.get_object()
+        query = serializers.ObservationSeriesQuerySerializer(data=request.query_params)
+        query.is_valid(raise_exception=True)
+        start, end = query.validated_data.get("start"), query.validated_data.get("end")
+        max_points = query.validated_data["max_points"]
+
+        series = get_series_storage().read(observation, start, end)
+        if query.validated_data["method"] == "minmax":
+            points = series.min_max(max_points)
+        else:
+            points = series.lttb(max_points)
+
+        if request.accepted_renderer.format == ArrowStreamRenderer.format:
+            return Response(points, headers={"X-Measurement-Count": len(series)})
+        return Response(
+            {
+                "observation": observation.uuid,
+                "start": start,
+                "end": end,
+                "count": len(series),
+                "downsampled": len(series) > max_points,
+                "measurements": points.to_tvps(),
+            }
+        )
@@ -0,0 +1,19 @@
+# Generated by Django 5.2.7 on 2026-10-19 10:12
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+    dependencies = [
+        ("gmn", "0027_gmn_end_date_monitoring"),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name="measuringpoint",
+            index=models.Index(
+                fields=["gmw_bro_id", "tube_number"],
+                name="gmn_mp_gmw_bro_id_tube_idx",
+            ),
+        ),
+    ]
@@ -0,0 +1,37 @@
+# Generated by Django 5.2.7 on 2026-10-19 11:03
+
+from django.db import migrations
+from django.db.models import OuterRef, Subquery
+
+
+def backfill_monitoring_tube_fk(apps, schema_editor):
+    """Link the measuring points that were created after 0026 to their tube.
+
+    Matches on gmw_bro_id, tube_number and data_owner, like the serializer
+    used to do per request.
+    """
+    Measuringpoint = apps.get_model("gmn", "Measuringpoint")
+    MonitoringTube = apps.get_model("gmw", "MonitoringTube")
+
+    tubes = MonitoringTube.objects.filter(
+        gmw__bro_id=OuterRef("gmw_bro_id"),
+        tube_number=OuterRef("tube_number"),
+        data_owner=OuterRef("data_owner"),
+    ).order_by("created")
+
+    updated = Measuringpoint.objects.filter(monitoring_tube__isnull=True).update(
+        monitoring_tube=Subquery(tubes.values("uuid")[:1])
+    )
+    orphaned = Measuringpoint.objects.filter(monitoring_tube__isnull=True).count()
+    print(f"Checked {updated} unlinked measuringpoints, {orphaned} still orphaned")
+
+
+class Migration(migrations.Migration):
+    dependencies = [
+        ("gmn", "0028_measuringpoint_gmw_bro_id_tube_idx"),
+        ("gmw", "0022_alter_gmw_internal_id_and_more"),
+    ]
+
+    operations = [
+        migrations.RunPython(backfill_monitoring_tube_fk, migrations.RunPython.noop),
+    ]
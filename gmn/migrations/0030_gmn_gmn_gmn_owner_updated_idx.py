@@ -0,0 +1,19 @@
+# Generated by Django 5.2.7 on 2026-10-19 13:41
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+    dependencies = [
+        ("gmn", "0029_backfill_measuringpoint_monitoring_tube"),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name="gmn",
+            index=models.Index(
+                fields=["data_owner", "updated"],
+                name="gmn_gmn_owner_updated_idx",
+            ),
+        ),
+    ]
@@ -51,6 +51,13 @@ class GMN(models.Model):
 
     class Meta:
         verbose_name_plural = "GMN's"
+        indexes = [
+            # Validator for the ETag of the list
+            models.Index(
+                fields=["data_owner", "updated"],
+                name="gmn_gmn_owner_updated_idx",
+            ),
+        ]
 
 
 class Measuringpoint(models.Model):
@@ -92,6 +99,13 @@ class Measuringpoint(models.Model):
 
     class Meta:
         verbose_name_plural = "Measuring Points"
+        indexes = [
+            # The linked GMNs of GMWs and tubes are looked up by BRO-ID
+            models.Index(
+                fields=["gmw_bro_id", "tube_number"],
+                name="gmn_mp_gmw_bro_id_tube_idx",
+            ),
+        ]
 
 
 class IntermediateEvent(models.Model):
@@ -1,8 +1,6 @@
-from django.core.exceptions import MultipleObjectsReturned, ObjectDoesNotExist
 from rest_framework import serializers
 
 from api.mixins import RequiredFieldsMixin, UrlFieldMixin
-from gmw import models as gmw_models
 
 from . import models as gmn_models
 
@@ -51,58 +49,20 @@ class MeasuringpointSerializer(
         model = gmn_models.Measuringpoint
         fields = "__all__"
 
+    # The list and detail views select the monitoring tube and its GMW, which
+    # are linked through the gmw_bro_id and tube_number by gmn.signals.
     def get_location(self, obj: gmn_models.Measuringpoint) -> str | None:
-        try:
-            return gmw_models.GMW.objects.get(
-                bro_id=obj.gmw_bro_id, data_owner=obj.data_owner
-            ).standardized_location
-        except ObjectDoesNotExist:
+        if obj.monitoring_tube is None:
             return None
-        except MultipleObjectsReturned:
-            return (
-                gmw_models.GMW.objects.filter(
-                    bro_id=obj.gmw_bro_id, data_owner=obj.data_owner
-                )
-                .first()
-                .standardized_location
-            )
+        return obj.monitoring_tube.gmw.standardized_location
 
     def get_gmw_uuid(self, obj: gmn_models.Measuringpoint) -> str | None:
-        try:
-            return gmw_models.GMW.objects.get(
-                bro_id=obj.gmw_bro_id, data_owner=obj.data_owner
-            ).uuid
-        except ObjectDoesNotExist:
+        if obj.monitoring_tube is None:
             return None
-        except MultipleObjectsReturned:
-            return (
-                gmw_models.GMW.objects.filter(
-                    bro_id=obj.gmw_bro_id, data_owner=obj.data_owner
-                )
-                .first()
-                .uuid
-            )
+        return obj.monitoring_tube.gmw_id
 
     def get_monitoringtube_uuid(self, obj: gmn_models.Measuringpoint) -> str | None:
-        try:
-            gmw_uuid = self.get_gmw_uuid(obj)
-            return gmw_models.MonitoringTube.objects.get(
-                gmw=gmw_uuid,
-                tube_number=obj.tube_number,
-                data_owner=obj.data_owner,
-            ).uuid
-        except ObjectDoesNotExist:
-            return None
-        except MultipleObjectsReturned:
-            return (
-                gmw_models.MonitoringTube.objects.filter(
-                    gmw=gmw_uuid,
-                    tube_number=obj.tube_number,
-                    data_owner=obj.data_owner,
-                )
-                .first()
-                .uuid
-            )
+        return obj.monitoring_tube_id
 
 
 class GMNIdsSerializer(serializers.ModelSerializer):
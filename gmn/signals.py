@@ -0,0 +1,38 @@
+from django.db.models.signals import post_save
+from django.dispatch import receiver
+
+from gmw.models import MonitoringTube
+
+from .models import Measuringpoint
+
+
+def find_monitoring_tube(measuringpoint: Measuringpoint) -> MonitoringTube | None:
+    """Returns the tube a measuring point refers to, by GMW BRO-ID and tube number."""
+    return (
+        MonitoringTube.objects.filter(
+            gmw__bro_id=measuringpoint.gmw_bro_id,
+            tube_number=measuringpoint.tube_number,
+            data_owner=measuringpoint.data_owner_id,
+        )
+        .order_by("created")
+        .first()
+    )
+
+
+@receiver(post_save, sender=Measuringpoint)
+def link_monitoring_tube(sender, instance: Measuringpoint, raw=False, **kwargs):
+    """Keeps the monitoring_tube of a measuring point in line with its gmw_bro_id
+    and tube_number.
+
+    Written with an update, because update_or_create only saves its defaults.
+    """
+    if raw:
+        return
+
+    monitoring_tube = find_monitoring_tube(instance)
+    monitoring_tube_id = monitoring_tube.uuid if monitoring_tube else None
+    if monitoring_tube_id != instance.monitoring_tube_id:
+        Measuringpoint.objects.filter(uuid=instance.uuid).update(
+            monitoring_tube=monitoring_tube
+        )
+        instance.monitoring_tube = monitoring_tube
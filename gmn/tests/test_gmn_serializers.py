@@ -11,6 +11,7 @@ from gmn.serializers import (
     IntermediateEventSerializer,
     MeasuringpointSerializer,
 )
+from gmw.models import MonitoringTube
 
 # this setup is chosen because ruff removes the fixture imports in other methods
 organisation = fixtures.organisation
@@ -18,6 +19,7 @@ gmn = fixtures.gmn
 measuringpoint = fixtures.measuringpoint
 intermediate_event = fixtures.intermediate_event
 gmw = fixtures.gmw
+tube = fixtures.tube
 
 
 @pytest.mark.django_db
@@ -48,6 +50,28 @@ def test_gmn_deserialization(gmn, organisation):
     assert serializer.is_valid(), serializer.errors
 
 
+@pytest.mark.django_db
+def test_measuringpoint_serialization_through_tube(gmw, tube, measuringpoint):
+    assert measuringpoint.monitoring_tube == tube
+
+    serializer = MeasuringpointSerializer(instance=measuringpoint)
+    assert serializer.data["gmw_uuid"] == gmw.uuid
+    assert serializer.data["monitoringtube_uuid"] == tube.uuid
+    assert serializer.data["location"] == gmw.standardized_location
+
+
+@pytest.mark.django_db
+def test_new_tube_links_earlier_measuringpoints(organisation, gmw, measuringpoint):
+    assert measuringpoint.monitoring_tube is None
+
+    tube = MonitoringTube.objects.create(
+        data_owner=organisation, gmw=gmw, tube_number=measuringpoint.tube_number
+    )
+
+    measuringpoint.refresh_from_db()
+    assert measuringpoint.monitoring_tube == tube
+
+
 class GMNSerializerTestCase(TestCase):
     def setUp(self):
         self.organisation = Organisation.objects.create(name="Nelen & Schuurmans")
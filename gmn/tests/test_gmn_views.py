@@ -0,0 +1,62 @@
+import pytest
+from django.db import connection
+from django.test.utils import CaptureQueriesContext
+from django.urls import reverse
+from rest_framework.test import APIClient
+
+from api.tests import fixtures
+from gmn import models as gmn_models
+from gmw import models as gmw_models
+
+# this setup is chosen because ruff removes the fixture imports in other methods
+user = fixtures.user
+organisation = fixtures.organisation
+userprofile = fixtures.userprofile
+gmn = fixtures.gmn
+gmw = fixtures.gmw
+tube = fixtures.tube
+measuringpoint = fixtures.measuringpoint
+
+
+@pytest.fixture
+def api_client(user, userprofile):
+    api_client = APIClient()
+    api_client.force_authenticate(user=user)
+    # Warm up, so the userprofile lookup is cached on the user
+    api_client.get(reverse("api:gmn:gmn-list"))
+    return api_client
+
+
+def nr_of_queries(api_client, url):
+    with CaptureQueriesContext(connection) as context:
+        response = api_client.get(url)
+    assert response.status_code == 200
+    return len(context.captured_queries)
+
+
+@pytest.mark.django_db
+def test_measuringpoint_list_queries(
+    api_client, organisation, gmn, gmw, tube, measuringpoint
+):
+    url = reverse("api:gmn:measuringpoint-list")
+    baseline = nr_of_queries(api_client, url)
+
+    for index in range(3):
+        other_gmw = gmw_models.GMW.objects.create(
+            data_owner=organisation, bro_id=f"GMW00000000000{index}"
+        )
+        gmw_models.MonitoringTube.objects.create(
+            data_owner=organisation, gmw=other_gmw, tube_number="1"
+        )
+        gmn_models.Measuringpoint.objects.create(
+            data_owner=organisation,
+            gmn=gmn,
+            measuringpoint_code=f"MP{index}",
+            gmw_bro_id=other_gmw.bro_id,
+            tube_number="1",
+        )
+
+    assert nr_of_queries(api_client, url) == baseline
+    results = api_client.get(url).json()["results"]
+    assert all(result["monitoringtube_uuid"] for result in results)
+    assert str(gmw.uuid) in {result["gmw_uuid"] for result in results}
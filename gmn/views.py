@@ -2,12 +2,18 @@ from django_filters.rest_framework import DjangoFilterBackend
 from rest_framework import generics
 
 from api import mixins
+from gmw import models as gmw_models
 
 from . import filters, serializers
 from . import models as gmn_models
 
 
-class GMNListView(mixins.UserOrganizationMixin, generics.ListAPIView):
+class GMNListView(
+    mixins.UserOrganizationMixin,
+    mixins.SparseFieldsMixin,
+    mixins.ConditionalGetMixin,
+    generics.ListAPIView,
+):
     """
     Retrieve a list of GMN objects.
 
@@ -22,7 +28,12 @@ class GMNListView(mixins.UserOrganizationMixin, generics.ListAPIView):
     filterset_class = filters.GmnFilter
 
 
-class GMNIdsList(mixins.UserOrganizationMixin, generics.ListAPIView):
+class GMNIdsList(
+    mixins.UserOrganizationMixin,
+    mixins.SparseFieldsMixin,
+    mixins.ConditionalGetMixin,
+    generics.ListAPIView,
+):
     """
     Retrieve a list of GMN object IDs.
 
@@ -36,7 +47,12 @@ class GMNIdsList(mixins.UserOrganizationMixin, generics.ListAPIView):
     filterset_class = filters.GmnFilter
 
 
-class GMNOverviewList(mixins.UserOrganizationMixin, generics.ListAPIView):
+class GMNOverviewList(
+    mixins.UserOrganizationMixin,
+    mixins.SparseFieldsMixin,
+    mixins.ConditionalGetMixin,
+    generics.ListAPIView,
+):
     """
     Retrieve a list of GMN objects with overview serializer.
 
@@ -50,7 +66,12 @@ class GMNOverviewList(mixins.UserOrganizationMixin, generics.ListAPIView):
     filterset_class = filters.GmnFilter
 
 
-class GMNDetailView(mixins.UserOrganizationMixin, generics.RetrieveAPIView):
+class GMNDetailView(
+    mixins.UserOrganizationMixin,
+    mixins.SparseFieldsMixin,
+    mixins.ConditionalGetMixin,
+    generics.RetrieveAPIView,
+):
     """
     Retrieve a single GMN object by UUID.
 
@@ -66,7 +87,12 @@ class GMNDetailView(mixins.UserOrganizationMixin, generics.RetrieveAPIView):
     lookup_field = "uuid"
 
 
-class MeasuringpointListView(mixins.UserOrganizationMixin, generics.ListAPIView):
+class MeasuringpointListView(
+    mixins.UserOrganizationMixin,
+    mixins.SparseFieldsMixin,
+    mixins.ConditionalGetMixin,
+    generics.ListAPIView,
+):
     """
     Retrieve a list of Measuringpoint objects.
 
@@ -75,23 +101,37 @@ class MeasuringpointListView(mixins.UserOrganizationMixin, generics.ListAPIView)
     """
 
     serializer_class = serializers.MeasuringpointSerializer
-    queryset = gmn_models.Measuringpoint.objects.all().order_by("-created")
+    etag_related_models = (gmw_models.MonitoringTube, gmw_models.GMW)
+    queryset = gmn_models.Measuringpoint.objects.select_related(
+        "monitoring_tube__gmw"
+    ).order_by("-created")
 
     filter_backends = [DjangoFilterBackend]
     filterset_class = filters.MeasuringPointFilter
 
 
-class MeasuringpointDetailView(mixins.UserOrganizationMixin, generics.RetrieveAPIView):
+class MeasuringpointDetailView(
+    mixins.UserOrganizationMixin,
+    mixins.SparseFieldsMixin,
+    mixins.ConditionalGetMixin,
+    generics.RetrieveAPIView,
+):
     """
     Retrieve a single Measuringpoint object by UUID.
     """
 
-    queryset = gmn_models.Measuringpoint.objects.all()
+    queryset = gmn_models.Measuringpoint.objects.select_related("monitoring_tube__gmw")
     serializer_class = serializers.MeasuringpointSerializer
+    etag_related_models = (gmw_models.MonitoringTube, gmw_models.GMW)
     lookup_field = "uuid"
 
 
-class EventListView(mixins.UserOrganizationMixin, generics.ListAPIView):
+class EventListView(
+    mixins.UserOrganizationMixin,
+    mixins.SparseFieldsMixin,
+    mixins.ConditionalGetMixin,
+    generics.ListAPIView,
+):
     """
     Retrieve a list of IntermediateEvent objects.
 
@@ -106,7 +146,12 @@ class EventListView(mixins.UserOrganizationMixin, generics.ListAPIView):
     filterset_class = filters.IntermediateEventFilter
 
 
-class EventDetailView(mixins.UserOrganizationMixin, generics.RetrieveAPIView):
+class EventDetailView(
+    mixins.UserOrganizationMixin,
+    mixins.SparseFieldsMixin,
+    mixins.ConditionalGetMixin,
+    generics.RetrieveAPIView,
+):
     """
     Retrieve a single IntermediateEvent object by UUID.
     """
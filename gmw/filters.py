@@ -1,15 +1,32 @@
 from typing import Any
 
 import django_filters
-from django.db.models import ForeignKey
+from django.db.models import BooleanField, FloatField, ForeignKey
+from django.db.models.expressions import RawSQL
 from django_filters import DateFilter, FilterSet
 from django_filters import rest_framework as filters
+from rest_framework.exceptions import ValidationError
 
 from api.mixins import DateTimeFilterMixin
 from gmn.models import Measuringpoint
 
 from .models import GMW, Event, MonitoringTube
 
+# The location column is generated from the standardized location, see
+# migration 0024. Distances are measured in RD, which has an index of its own.
+RD_LOCATION = "ST_Transform(gmw_gmw.location, 28992)"
+RD_POINT = "ST_Transform(ST_SetSRID(ST_MakePoint(%s, %s), 4258), 28992)"
+
+
+class FloatCSVFilter(filters.BaseCSVFilter, filters.NumberFilter):
+    pass
+
+
+def _floats(values: list, count: int, name: str) -> list[float]:
+    if len(values) != count:
+        raise ValidationError({name: f"Expected {count} comma separated numbers."})
+    return [float(value) for value in values]
+
 
 class GmwFilter(DateTimeFilterMixin, FilterSet):
     bro_id__icontains = filters.CharFilter(field_name="bro_id", lookup_expr="icontains")
@@ -28,6 +45,19 @@ class GmwFilter(DateTimeFilterMixin, FilterSet):
 
     linked_gmn = filters.CharFilter(method="filter_by_linked_gmn")
 
+    bbox = FloatCSVFilter(
+        method="filter_by_bbox",
+        label="Bounding box as min_lon,min_lat,max_lon,max_lat (EPSG:4258)",
+    )
+    near = FloatCSVFilter(
+        method="filter_by_near",
+        label="Point as lon,lat (EPSG:4258), orders the GMWs from near to far",
+    )
+    radius = filters.NumberFilter(
+        method="filter_by_radius",
+        label="Maximum distance in meters to the point of near",
+    )
+
     class Meta:
         model = GMW
         fields = "__all__"
@@ -39,6 +69,38 @@ class GmwFilter(DateTimeFilterMixin, FilterSet):
 
         return queryset.filter(tubes__measuring_points__gmn__uuid=value).distinct()
 
+    def filter_by_bbox(self, queryset, name, value):
+        min_lon, min_lat, max_lon, max_lat = _floats(value, 4, name)
+        return queryset.filter(
+            RawSQL(
+                "gmw_gmw.location && ST_MakeEnvelope(%s, %s, %s, %s, 4258)",
+                [min_lon, min_lat, max_lon, max_lat],
+                output_field=BooleanField(),
+            )
+        )
+
+    def filter_by_near(self, queryset, name, value):
+        lon, lat = _floats(value, 2, name)
+        radius = self.form.cleaned_data.get("radius")
+        if radius is not None:
+            queryset = queryset.filter(
+                RawSQL(
+                    f"ST_DWithin({RD_LOCATION}, {RD_POINT}, %s)",
+                    [lon, lat, float(radius)],
+                    output_field=BooleanField(),
+                )
+            )
+        # The <-> operator orders with the index, nearest first
+        return queryset.annotate(
+            distance=RawSQL(
+                f"{RD_LOCATION} <-> {RD_POINT}", [lon, lat], output_field=FloatField()
+            )
+        ).order_by("distance")
+
+    def filter_by_radius(self, queryset, name, value):
+        # Applied by filter_by_near
+        return queryset
+
 
 class MonitoringTubeFilter(DateTimeFilterMixin, FilterSet):
     gmn_bro_id = filters.CharFilter(
@@ -52,6 +114,26 @@ class MonitoringTubeFilter(DateTimeFilterMixin, FilterSet):
         label="GMW BRO ID",
     )
 
+    # Served by the (data_owner, position) indexes of the MonitoringTube
+    screen_top_position__gte = filters.NumberFilter(
+        field_name="screen_top_position", lookup_expr="gte"
+    )
+    screen_top_position__lte = filters.NumberFilter(
+        field_name="screen_top_position", lookup_expr="lte"
+    )
+    screen_bottom_position__gte = filters.NumberFilter(
+        field_name="screen_bottom_position", lookup_expr="gte"
+    )
+    screen_bottom_position__lte = filters.NumberFilter(
+        field_name="screen_bottom_position", lookup_expr="lte"
+    )
+    tube_top_position__gte = filters.NumberFilter(
+        field_name="tube_top_position", lookup_expr="gte"
+    )
+    tube_top_position__lte = filters.NumberFilter(
+        field_name="tube_top_position", lookup_expr="lte"
+    )
+
     class Meta:
         model = MonitoringTube
         exclude = ["geo_ohm_cables"]
@@ -0,0 +1,162 @@
+"""Cached GeoJSON FeatureCollection of the GMWs of an organisation.
+
+The collection is stored in the cache as gzipped JSON bytes, which the
+GMWGeoJSONView serves as is. Every change to a GMW, MonitoringTube or
+Measuringpoint bumps the version of the organisation (see gmw.signals) and
+schedules a rebuild in the background. Changes in quick succession, like
+during an import, share one rebuild. Until it is done, the last built
+collection is served: only an organisation without any collection waits
+for a build.
+"""
+
+import gzip
+import json
+import logging
+import time
+import uuid
+
+from django.core.cache import cache
+from django.core.serializers.json import DjangoJSONEncoder
+from django.db import transaction
+from django.db.models import FloatField, Prefetch
+from django.db.models.expressions import RawSQL
+
+from gmn import models as gmn_models
+
+from . import models as gmw_models
+from . import serializers
+
+logger = logging.getLogger(__name__)
+
+# Invalidation is leading, this only cleans up collections nobody asks for
+GEOJSON_CACHE_TIMEOUT = 60 * 60 * 24
+# Seconds between the first change and the background rebuild
+GEOJSON_REBUILD_DELAY = 60
+
+
+def _version_key(organisation_id: uuid.UUID | str) -> str:
+    return f"gmw_geojson:{organisation_id}:version"
+
+
+def _body_key(organisation_id: uuid.UUID | str, version: int) -> str:
+    return f"gmw_geojson:{organisation_id}:{version}"
+
+
+def _latest_key(organisation_id: uuid.UUID | str) -> str:
+    return f"gmw_geojson:{organisation_id}:latest"
+
+
+def _rebuild_key(organisation_id: uuid.UUID | str) -> str:
+    return f"gmw_geojson:{organisation_id}:rebuild"
+
+
+def get_version(organisation_id: uuid.UUID | str) -> int:
+    return cache.get_or_set(_version_key(organisation_id), 0, None)
+
+
+def build_geojson(organisation_id: uuid.UUID | str) -> bytes:
+    """Returns the gzipped FeatureCollection of the GMWs of an organisation."""
+    start_time = time.perf_counter()
+    queryset = (
+        gmw_models.GMW.objects.filter(data_owner=organisation_id)
+        .annotate(
+            # From the location column, see migration 0024
+            longitude=RawSQL("ST_X(gmw_gmw.location)", [], output_field=FloatField()),
+            latitude=RawSQL("ST_Y(gmw_gmw.location)", [], output_field=FloatField()),
+        )
+        .prefetch_related(
+            "tubes",
+            Prefetch(
+                "tubes__measuring_points",
+                queryset=gmn_models.Measuringpoint.objects.select_related("gmn"),
+            ),
+        )
+    )
+    features = serializers.GMWGeoJSONSerializer(queryset, many=True).data
+    geojson = {
+        "type": "FeatureCollection",
+        "count": len(features),
+        "features": features,
+    }
+    body = gzip.compress(
+        json.dumps(geojson, cls=DjangoJSONEncoder, separators=(",", ":")).encode()
+    )
+    logger.info(
+        f"Generated {len(features)} features for org {organisation_id} "
+        f"in {time.perf_counter() - start_time:.2f}s ({len(body)} bytes gzipped)"
+    )
+    return body
+
+
+def rebuild_geojson(organisation_id: uuid.UUID | str) -> tuple[int, bytes]:
+    """Builds and stores the collection for the current version.
+
+    A change during the build bumps the version, so a collection that is
+    outdated by the time it is stored is only served until the next rebuild.
+    """
+    cache.delete(_rebuild_key(organisation_id))
+    version = get_version(organisation_id)
+    body = build_geojson(organisation_id)
+    cache.set(_body_key(organisation_id, version), body, GEOJSON_CACHE_TIMEOUT)
+    # A slower build of an older version doesn't replace a newer collection
+    latest = cache.get(_latest_key(organisation_id))
+    if latest is None or latest[0] <= version:
+        cache.set(_latest_key(organisation_id), (version, body), GEOJSON_CACHE_TIMEOUT)
+    return version, body
+
+
+def get_geojson(organisation_id: uuid.UUID | str) -> tuple[int, bytes]:
+    """Returns the version and the gzipped collection.
+
+    While a rebuild is pending, the last built collection and its version
+    are returned. The collection is only built in the request when none was
+    built before.
+    """
+    version = get_version(organisation_id)
+    body = cache.get(_body_key(organisation_id, version))
+    if body is not None:
+        return version, body
+
+    latest = cache.get(_latest_key(organisation_id))
+    if latest is not None:
+        # E.g. when the scheduled rebuild was lost, schedule another one
+        if cache.add(_rebuild_key(organisation_id), True, GEOJSON_REBUILD_DELAY * 2):
+            transaction.on_commit(lambda: _schedule_rebuild(organisation_id))
+        return latest
+
+    logger.info(f"No cached GeoJSON for org {organisation_id}, building it")
+    return rebuild_geojson(organisation_id)
+
+
+def invalidate_geojson(organisation_id: uuid.UUID | str | None) -> None:
+    """Bumps the version of the collection, and schedules a rebuild."""
+    if organisation_id is None:
+        return
+
+    try:
+        version_key = _version_key(organisation_id)
+        cache.add(version_key, 0, None)
+        cache.incr(version_key)
+        # Only the first change in the delay schedules a rebuild
+        schedule_rebuild = cache.add(
+            _rebuild_key(organisation_id), True, GEOJSON_REBUILD_DELAY * 2
+        )
+    except Exception as e:
+        # Saving the GMW is more important than the map
+        logger.warning(f"Failed to invalidate the GeoJSON of {organisation_id}: {e}")
+        return
+
+    if schedule_rebuild:
+        transaction.on_commit(lambda: _schedule_rebuild(organisation_id))
+
+
+def _schedule_rebuild(organisation_id: uuid.UUID | str) -> None:
+    from api.tasks import rebuild_gmw_geojson_task
+
+    try:
+        rebuild_gmw_geojson_task.apply_async(
+            (str(organisation_id),), countdown=GEOJSON_REBUILD_DELAY
+        )
+    except Exception as e:
+        # The next request builds it instead
+        logger.warning(f"Failed to schedule the GeoJSON of {organisation_id}: {e}")
@@ -0,0 +1,19 @@
+# Generated by Django 5.2.7 on 2026-10-19 13:41
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+    dependencies = [
+        ("gmw", "0022_alter_gmw_internal_id_and_more"),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name="gmw",
+            index=models.Index(
+                fields=["data_owner", "updated"],
+                name="gmw_gmw_owner_updated_idx",
+            ),
+        ),
+    ]
@@ -0,0 +1,40 @@
+# Generated by Django 5.2.7 on 2026-10-19 15:02
+
+from django.db import migrations
+
+# The standardized location is stored as "lat lon" in ETRS89 (EPSG:4258).
+# Values that don't parse as two numbers get no location.
+ADD_LOCATION = r"""
+CREATE EXTENSION IF NOT EXISTS postgis;
+
+ALTER TABLE gmw_gmw ADD COLUMN location geometry(Point, 4258)
+GENERATED ALWAYS AS (
+    CASE
+        WHEN standardized_location ~ '^-?[0-9]+(\.[0-9]+)? -?[0-9]+(\.[0-9]+)?$'
+        THEN ST_SetSRID(
+            ST_MakePoint(
+                split_part(standardized_location, ' ', 2)::double precision,
+                split_part(standardized_location, ' ', 1)::double precision
+            ),
+            4258
+        )
+    END
+) STORED;
+
+CREATE INDEX gmw_gmw_location_gist ON gmw_gmw USING GIST (location);
+"""
+
+DROP_LOCATION = """
+DROP INDEX IF EXISTS gmw_gmw_location_gist;
+ALTER TABLE gmw_gmw DROP COLUMN IF EXISTS location;
+"""
+
+
+class Migration(migrations.Migration):
+    dependencies = [
+        ("gmw", "0023_gmw_gmw_gmw_owner_updated_idx"),
+    ]
+
+    operations = [
+        migrations.RunSQL(ADD_LOCATION, reverse_sql=DROP_LOCATION),
+    ]
@@ -0,0 +1,20 @@
+# Generated by Django 5.2.7 on 2026-10-19 15:40
+
+from django.db import migrations
+
+
+class Migration(migrations.Migration):
+    # The radius and nearest filters of the GMWs measure in RD (EPSG:28992)
+    atomic = False
+
+    dependencies = [
+        ("gmw", "0024_gmw_location"),
+    ]
+
+    operations = [
+        migrations.RunSQL(
+            "CREATE INDEX CONCURRENTLY IF NOT EXISTS gmw_gmw_rd_location_gist "
+            "ON gmw_gmw USING GIST (ST_Transform(location, 28992));",
+            reverse_sql="DROP INDEX CONCURRENTLY IF EXISTS gmw_gmw_rd_location_gist;",
+        ),
+    ]
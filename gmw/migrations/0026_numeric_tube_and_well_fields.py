@@ -0,0 +1,111 @@
+# Generated by Django 5.2.7 on 2026-10-19 16:20
+
+from django.db import migrations, models
+
+NUMBER = r"^[-+]?([0-9]+(\.[0-9]*)?|\.[0-9]+)([eE][-+]?[0-9]+)?$"
+
+
+def clean_numbers_sql(table: str, fields: list[str]) -> str:
+    """Trims the values and uses dots, and clears what still isn't a number.
+
+    Without this, the cast of the column type fails on the first bad value.
+    """
+    statements = []
+    for field in fields:
+        statements.append(
+            f"UPDATE {table} SET \"{field}\" = replace(btrim(\"{field}\"), ',', '.') "
+            f'WHERE "{field}" IS NOT NULL'
+        )
+        statements.append(
+            f'UPDATE {table} SET "{field}" = NULL WHERE "{field}" !~ \'{NUMBER}\''
+        )
+    return ";\n".join(statements) + ";"
+
+
+GMW_FIELDS = ["offset", "ground_level_position"]
+TUBE_FIELDS = [
+    "tube_top_diameter",
+    "tube_top_position",
+    "screen_length",
+    "screen_top_position",
+    "screen_bottom_position",
+    "plain_tube_part_length",
+]
+
+
+class Migration(migrations.Migration):
+    dependencies = [
+        ("gmw", "0025_gmw_rd_location_index"),
+    ]
+
+    operations = [
+        migrations.RunSQL(
+            clean_numbers_sql("gmw_gmw", GMW_FIELDS),
+            reverse_sql=migrations.RunSQL.noop,
+        ),
+        migrations.RunSQL(
+            clean_numbers_sql("gmw_monitoringtube", TUBE_FIELDS),
+            reverse_sql=migrations.RunSQL.noop,
+        ),
+        migrations.AlterField(
+            model_name="gmw",
+            name="offset",
+            field=models.FloatField(null=True),
+        ),
+        migrations.AlterField(
+            model_name="gmw",
+            name="ground_level_position",
+            field=models.FloatField(null=True, blank=True),
+        ),
+        migrations.AlterField(
+            model_name="monitoringtube",
+            name="tube_top_diameter",
+            field=models.FloatField(null=True, blank=True),
+        ),
+        migrations.AlterField(
+            model_name="monitoringtube",
+            name="tube_top_position",
+            field=models.FloatField(null=True),
+        ),
+        migrations.AlterField(
+            model_name="monitoringtube",
+            name="screen_length",
+            field=models.FloatField(null=True),
+        ),
+        migrations.AlterField(
+            model_name="monitoringtube",
+            name="screen_top_position",
+            field=models.FloatField(null=True),
+        ),
+        migrations.AlterField(
+            model_name="monitoringtube",
+            name="screen_bottom_position",
+            field=models.FloatField(null=True),
+        ),
+        migrations.AlterField(
+            model_name="monitoringtube",
+            name="plain_tube_part_length",
+            field=models.FloatField(null=True),
+        ),
+        migrations.AddIndex(
+            model_name="monitoringtube",
+            index=models.Index(
+                fields=["data_owner", "screen_top_position"],
+                name="gmw_tube_owner_screen_top_idx",
+            ),
+        ),
+        migrations.AddIndex(
+            model_name="monitoringtube",
+            index=models.Index(
+                fields=["data_owner", "screen_bottom_position"],
+                name="gmw_tube_owner_screen_bot_idx",
+            ),
+        ),
+        migrations.AddIndex(
+            model_name="monitoringtube",
+            index=models.Index(
+                fields=["data_owner", "tube_top_position"],
+                name="gmw_tube_owner_tube_top_idx",
+            ),
+        ),
+    ]
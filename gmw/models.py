@@ -38,10 +38,12 @@ class GMW(models.Model):
     delivered_location = models.CharField(max_length=100, null=True)
     horizontal_positioning_method = models.CharField(max_length=100, null=True)
     local_vertical_reference_point = models.CharField(max_length=100, null=True)
-    offset = models.CharField(max_length=100, null=True)
+    offset = models.FloatField(null=True)
     vertical_datum = models.CharField(max_length=100, null=True)
-    ground_level_position = models.CharField(max_length=100, null=True, blank=True)
+    ground_level_position = models.FloatField(null=True, blank=True)
     ground_level_positioning_method = models.CharField(max_length=100, null=True)
+    # Also stored as a PostGIS point in the generated location column, which
+    # is left out of the model (see migration 0024 and gmw.tiles)
     standardized_location = models.CharField(max_length=100, null=True)
     object_registration_time = models.DateTimeField(null=True)
     registration_status = models.CharField(max_length=50, null=True)
@@ -58,6 +60,13 @@ class GMW(models.Model):
 
     class Meta:
         verbose_name_plural = "GMW's"
+        indexes = [
+            # Validator for the ETag of the list
+            models.Index(
+                fields=["data_owner", "updated"],
+                name="gmw_gmw_owner_updated_idx",
+            ),
+        ]
 
     @property
     def nr_of_monitoring_tubes(self) -> int:
@@ -88,22 +97,22 @@ class MonitoringTube(models.Model):
     sediment_sump_length = models.CharField(max_length=100, null=True, blank=True)
     number_of_geo_ohm_cables = models.CharField(max_length=100, null=True)
     geo_ohm_cables = JSONField("Geoohm Cables", default=list, blank=True)
-    tube_top_diameter = models.CharField(max_length=100, null=True, blank=True)
+    tube_top_diameter = models.FloatField(null=True, blank=True)
     variable_diameter = models.CharField(max_length=100, null=True)
     tube_status = models.CharField(max_length=100, null=True)
-    tube_top_position = models.CharField(max_length=100, null=True)
+    tube_top_position = models.FloatField(null=True)
     tube_top_positioning_method = models.CharField(max_length=100, null=True)
     tube_part_inserted = models.CharField(max_length=100, null=True)
     tube_in_use = models.CharField(max_length=100, null=True)
     tube_packing_material = models.CharField(max_length=100, null=True)
     tube_material = models.CharField(max_length=100, null=True)
     glue = models.CharField(max_length=100, null=True)
-    screen_length = models.CharField(max_length=100, null=True)
+    screen_length = models.FloatField(null=True)
     screen_protection = models.CharField(max_length=100, null=True, blank=True)
     sock_material = models.CharField(max_length=100, null=True)
-    screen_top_position = models.CharField(max_length=100, null=True)
-    screen_bottom_position = models.CharField(max_length=100, null=True)
-    plain_tube_part_length = models.CharField(max_length=100, null=True)
+    screen_top_position = models.FloatField(null=True)
+    screen_bottom_position = models.FloatField(null=True)
+    plain_tube_part_length = models.FloatField(null=True)
 
     def __str__(self) -> str:
         try:
@@ -113,6 +122,21 @@ class MonitoringTube(models.Model):
 
     class Meta:
         verbose_name_plural = "Monitoring Tubes"
+        indexes = [
+            # Range filters of the MonitoringTubeFilter
+            models.Index(
+                fields=["data_owner", "screen_top_position"],
+                name="gmw_tube_owner_screen_top_idx",
+            ),
+            models.Index(
+                fields=["data_owner", "screen_bottom_position"],
+                name="gmw_tube_owner_screen_bot_idx",
+            ),
+            models.Index(
+                fields=["data_owner", "tube_top_position"],
+                name="gmw_tube_owner_tube_top_idx",
+            ),
+        ]
 
 
 class Event(models.Model):
@@ -1,3 +1,4 @@
+from typing import Any
 from uuid import UUID
 
 from rest_framework import serializers
@@ -8,6 +9,19 @@ from gmn import models as gmn_models
 from . import models as gmw_models
 
 
+def _linked_gmns(obj: Any, **lookups: str) -> list[UUID]:
+    """Returns the linked_gmn_uuids annotated by the views, or queries them."""
+    if hasattr(obj, "linked_gmn_uuids"):
+        return list(obj.linked_gmn_uuids or [])
+    return list(
+        set(
+            gmn_models.Measuringpoint.objects.filter(**lookups).values_list(
+                "gmn_id", flat=True
+            )
+        )
+    )
+
+
 class MonitoringTubeOverviewSerializer(serializers.ModelSerializer):
     class Meta:
         model = gmw_models.MonitoringTube
@@ -72,9 +86,12 @@ class GMWGeoJSONSerializer(serializers.ModelSerializer):
         """Convert to GeoJSON Feature format"""
         data = super().to_representation(instance)
 
-        # Parse coordinates
         location_string = data.pop("standardized_location", None)
-        coordinates = self.parse_coordinates(location_string)
+        if getattr(instance, "longitude", None) is not None:
+            # Annotated from the location column by gmw.geojson
+            coordinates = (instance.longitude, instance.latitude)
+        else:
+            coordinates = self.parse_coordinates(location_string)
 
         # Build GeoJSON Feature
         feature = {
@@ -100,19 +117,16 @@ class GMWSerializer(UrlFieldMixin, serializers.ModelSerializer):
         fields = "__all__"
 
     def get_linked_gmns(self, obj: gmw_models.GMW) -> list[UUID]:
-        linked_gmns = set(
-            measuringpoint.gmn.uuid
-            for measuringpoint in gmn_models.Measuringpoint.objects.filter(
-                gmw_bro_id=obj.bro_id
-            )
-        )
-        return list(linked_gmns)
+        return _linked_gmns(obj, gmw_bro_id=obj.bro_id)
 
     def get_nr_of_monitoring_tubes(self, obj: gmw_models.GMW) -> int:
-        return obj.nr_of_monitoring_tubes
+        # Annotated by the list and detail views
+        count = getattr(obj, "monitoring_tube_count", None)
+        return obj.nr_of_monitoring_tubes if count is None else count
 
     def get_nr_of_intermediate_events(self, obj: gmw_models.GMW) -> int:
-        return obj.nr_of_intermediate_events
+        count = getattr(obj, "intermediate_event_count", None)
+        return obj.nr_of_intermediate_events if count is None else count
 
 
 class GMWOverviewSerializer(serializers.ModelSerializer):
@@ -136,13 +150,7 @@ class GMWOverviewSerializer(serializers.ModelSerializer):
         ]
 
     def get_linked_gmns(self, obj: gmw_models.GMW) -> list[UUID]:
-        linked_gmns = set(
-            measuringpoint.gmn.uuid
-            for measuringpoint in gmn_models.Measuringpoint.objects.filter(
-                gmw_bro_id=obj.bro_id
-            )
-        )
-        return list(linked_gmns)
+        return _linked_gmns(obj, gmw_bro_id=obj.bro_id)
 
 
 class GMWIdsSerializer(serializers.ModelSerializer):
@@ -172,14 +180,7 @@ class MonitoringTubeSerializer(UrlFieldMixin, serializers.ModelSerializer):
         return obj.gmw.bro_id
 
     def get_linked_gmns(self, obj: gmw_models.MonitoringTube) -> list[UUID]:
-        linked_gmns = set(
-            measuringpoint.gmn.uuid
-            for measuringpoint in gmn_models.Measuringpoint.objects.filter(
-                gmw_bro_id=obj.gmw.bro_id,
-                tube_number=obj.tube_number,
-            )
-        )
-        return list(linked_gmns)
+        return _linked_gmns(obj, gmw_bro_id=obj.gmw.bro_id, tube_number=obj.tube_number)
 
 
 class EventSerializer(UrlFieldMixin, serializers.ModelSerializer):
@@ -0,0 +1,36 @@
+from django.db.models.signals import post_delete, post_save
+from django.dispatch import receiver
+
+from gmn.models import Measuringpoint
+
+from .geojson import invalidate_geojson
+from .models import GMW, MonitoringTube
+
+
+@receiver(post_save, sender=MonitoringTube)
+def link_measuringpoints(
+    sender, instance: MonitoringTube, created: bool, raw=False, **kwargs
+):
+    """Links the measuring points that were registered before their tube was."""
+    if not created or raw:
+        return
+
+    Measuringpoint.objects.filter(
+        monitoring_tube=None,
+        gmw_bro_id=instance.gmw.bro_id,
+        tube_number=instance.tube_number,
+        data_owner=instance.data_owner_id,
+    ).update(monitoring_tube=instance)
+
+
+@receiver(post_save, sender=GMW)
+@receiver(post_delete, sender=GMW)
+@receiver(post_save, sender=MonitoringTube)
+@receiver(post_delete, sender=MonitoringTube)
+@receiver(post_save, sender=Measuringpoint)
+@receiver(post_delete, sender=Measuringpoint)
+def invalidate_gmw_geojson(sender, instance, raw=False, **kwargs):
+    """The GeoJSON of the GMWs includes their tubes and linked GMNs."""
+    if raw:
+        return
+    invalidate_geojson(instance.data_owner_id)
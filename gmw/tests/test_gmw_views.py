@@ -0,0 +1,298 @@
+import gzip
+import json
+
+import pytest
+from django.db import connection
+from django.test.utils import CaptureQueriesContext
+from django.urls import reverse
+from rest_framework.test import APIClient
+
+from api.tests import fixtures
+from gmn import models as gmn_models
+from gmw import geojson
+from gmw import models as gmw_models
+
+# this setup is chosen because ruff removes the fixture imports in other methods
+user = fixtures.user
+organisation = fixtures.organisation
+userprofile = fixtures.userprofile
+gmw = fixtures.gmw
+tube = fixtures.tube
+event = fixtures.event
+gmn = fixtures.gmn
+measuringpoint = fixtures.measuringpoint
+
+
+@pytest.fixture
+def local_cache(settings):
+    settings.CACHES = {
+        "default": {"BACKEND": "django.core.cache.backends.locmem.LocMemCache"}
+    }
+
+
+@pytest.fixture
+def api_client(user, userprofile):
+    api_client = APIClient()
+    api_client.force_authenticate(user=user)
+    # Warm up, so the userprofile lookup is cached on the user
+    api_client.get(reverse("api:gmw:gmw-ids"))
+    return api_client
+
+
+def nr_of_queries(api_client, url):
+    with CaptureQueriesContext(connection) as context:
+        response = api_client.get(url)
+    assert response.status_code == 200
+    return len(context.captured_queries)
+
+
+@pytest.mark.django_db
+def test_gmw_detail_counts(api_client, gmw, tube, event):
+    url = reverse("api:gmw:gmw-detail", kwargs={"uuid": gmw.uuid})
+    response = api_client.get(url)
+
+    assert response.json()["nr_of_monitoring_tubes"] == 1
+    assert response.json()["nr_of_intermediate_events"] == 1
+    assert nr_of_queries(api_client, url) == 1
+
+
+@pytest.mark.django_db
+def test_gmw_list_counts_are_annotated(api_client, organisation, gmw, tube, event):
+    url = reverse("api:gmw:gmw-list")
+    baseline = nr_of_queries(api_client, url)
+
+    for index in range(3):
+        other_gmw = gmw_models.GMW.objects.create(
+            data_owner=organisation, bro_id=f"GMW00000000000{index}"
+        )
+        gmw_models.MonitoringTube.objects.create(
+            data_owner=organisation, gmw=other_gmw, tube_number="1"
+        )
+
+    assert nr_of_queries(api_client, url) == baseline
+    results = api_client.get(url).json()["results"]
+    assert sorted(result["nr_of_monitoring_tubes"] for result in results) == [
+        1,
+        1,
+        1,
+        1,
+    ]
+
+
+@pytest.mark.django_db
+def test_gmw_list_linked_gmns_are_annotated(
+    api_client, organisation, gmw, gmn, measuringpoint
+):
+    url = reverse("api:gmw:gmw-list")
+    baseline = nr_of_queries(api_client, url)
+
+    for index in range(3):
+        other_gmw = gmw_models.GMW.objects.create(
+            data_owner=organisation, bro_id=f"GMW00000000000{index}"
+        )
+        gmn_models.Measuringpoint.objects.create(
+            data_owner=organisation,
+            gmn=gmn,
+            measuringpoint_code=f"MP{index}",
+            gmw_bro_id=other_gmw.bro_id,
+            tube_number="1",
+        )
+
+    assert nr_of_queries(api_client, url) == baseline
+    results = api_client.get(url).json()["results"]
+    assert all(result["linked_gmns"] == [str(gmn.uuid)] for result in results)
+
+
+@pytest.mark.django_db
+def test_gmw_overview_queries(api_client, organisation, gmw, tube, event):
+    url = reverse("api:gmw:gmw-overview")
+    baseline = nr_of_queries(api_client, url)
+
+    for index in range(3):
+        other_gmw = gmw_models.GMW.objects.create(
+            data_owner=organisation, bro_id=f"GMW00000000000{index}"
+        )
+        gmw_models.MonitoringTube.objects.create(
+            data_owner=organisation, gmw=other_gmw, tube_number="1"
+        )
+
+    assert nr_of_queries(api_client, url) == baseline
+
+
+@pytest.mark.django_db
+def test_monitoring_tube_list_queries(
+    api_client, organisation, gmw, tube, gmn, measuringpoint
+):
+    url = reverse("api:gmw:monitoringtube-list")
+    baseline = nr_of_queries(api_client, url)
+
+    for index in range(3):
+        gmw_models.MonitoringTube.objects.create(
+            data_owner=organisation, gmw=gmw, tube_number=str(index + 2)
+        )
+
+    assert nr_of_queries(api_client, url) == baseline
+    results = api_client.get(url).json()["results"]
+    linked_gmns = {result["tube_number"]: result["linked_gmns"] for result in results}
+    assert linked_gmns["1"] == [str(gmn.uuid)]
+    assert linked_gmns["2"] == []
+    assert {result["gmw_bro_id"] for result in results} == {gmw.bro_id}
+
+
+@pytest.mark.django_db
+def test_gmw_geojson_is_served_from_cache(local_cache, api_client, gmw, tube):
+    url = reverse("api:gmw:gmw-geojson-list")
+    response = api_client.get(url, HTTP_ACCEPT_ENCODING="gzip")
+
+    assert response["Content-Encoding"] == "gzip"
+    geojson = json.loads(gzip.decompress(response.content))
+    assert geojson["count"] == 1
+    assert geojson["features"][0]["properties"]["nr_of_monitoring_tubes"] == 1
+
+    assert nr_of_queries(api_client, url) == 0
+    response = api_client.get(url, HTTP_IF_NONE_MATCH=response["ETag"])
+    assert response.status_code == 304
+
+
+@pytest.mark.django_db
+def test_gmw_geojson_is_invalidated_by_changes(
+    local_cache, api_client, organisation, gmw, tube
+):
+    url = reverse("api:gmw:gmw-geojson-list")
+    etag = api_client.get(url)["ETag"]
+
+    gmw_models.MonitoringTube.objects.create(
+        data_owner=organisation, gmw=gmw, tube_number="2"
+    )
+
+    # The last collection is served until the rebuild is done
+    assert nr_of_queries(api_client, url) == 0
+    response = api_client.get(url, HTTP_IF_NONE_MATCH=etag)
+    assert response.status_code == 304
+
+    geojson.rebuild_geojson(organisation.uuid)
+    response = api_client.get(url, HTTP_IF_NONE_MATCH=etag)
+    assert response.status_code == 200
+    collection = json.loads(response.content)
+    assert collection["features"][0]["properties"]["nr_of_monitoring_tubes"] == 2
+
+
+@pytest.mark.django_db
+def test_gmw_tile_contains_located_gmws(local_cache, api_client, gmw, tube):
+    gmw.standardized_location = "52.0907 5.1214"
+    gmw.save()
+
+    url = reverse("api:gmw:gmw-tiles", kwargs={"z": 1, "x": 1, "y": 0})
+    response = api_client.get(url)
+    assert response.status_code == 200
+    assert response["Content-Type"] == "application/vnd.mapbox-vector-tile"
+    assert gmw.bro_id.encode() in response.content
+
+    assert nr_of_queries(api_client, url) == 0
+    response = api_client.get(url, HTTP_IF_NONE_MATCH=response["ETag"])
+    assert response.status_code == 304
+
+    # Utrecht is not in the south-west of the world
+    url = reverse("api:gmw:gmw-tiles", kwargs={"z": 1, "x": 0, "y": 1})
+    assert api_client.get(url).content == b""
+
+
+@pytest.mark.django_db
+def test_gmw_tile_is_invalidated_by_changes(local_cache, api_client, gmw):
+    url = reverse("api:gmw:gmw-tiles", kwargs={"z": 0, "x": 0, "y": 0})
+    response = api_client.get(url)
+    assert response.content == b""
+
+    gmw.standardized_location = "52.0907 5.1214"
+    gmw.save()
+
+    response = api_client.get(url, HTTP_IF_NONE_MATCH=response["ETag"])
+    assert response.status_code == 200
+    assert gmw.bro_id.encode() in response.content
+
+
+@pytest.mark.django_db
+def test_gmw_tile_out_of_range(api_client):
+    url = reverse("api:gmw:gmw-tiles", kwargs={"z": 1, "x": 2, "y": 0})
+    assert api_client.get(url).status_code == 404
+
+
+@pytest.fixture
+def located_gmws(organisation):
+    locations = {
+        "GMW000000000001": "52.0907 5.1214",  # Utrecht
+        "GMW000000000002": "52.3676 4.9041",  # Amsterdam
+        "GMW000000000003": "51.9244 4.4777",  # Rotterdam
+    }
+    for bro_id, location in locations.items():
+        gmw_models.GMW.objects.create(
+            data_owner=organisation, bro_id=bro_id, standardized_location=location
+        )
+
+
+def bro_ids(api_client, query):
+    response = api_client.get(f"{reverse('api:gmw:gmw-list')}?{query}")
+    assert response.status_code == 200
+    return [result["bro_id"] for result in response.json()["results"]]
+
+
+@pytest.mark.django_db
+def test_gmw_bbox_filter(api_client, located_gmws):
+    assert set(bro_ids(api_client, "bbox=4.8,52.0,5.2,52.5")) == {
+        "GMW000000000001",
+        "GMW000000000002",
+    }
+    assert bro_ids(api_client, "bbox=4.0,50.0,4.5,51.0") == []
+
+
+@pytest.mark.django_db
+def test_gmw_near_filter(api_client, located_gmws):
+    # Nearest first, from the center of Utrecht
+    assert bro_ids(api_client, "near=5.12,52.09") == [
+        "GMW000000000001",
+        "GMW000000000002",
+        "GMW000000000003",
+    ]
+    # Amsterdam is ~35 km from Utrecht, Rotterdam ~50 km
+    assert bro_ids(api_client, "near=5.12,52.09&radius=40000") == [
+        "GMW000000000001",
+        "GMW000000000002",
+    ]
+
+
+@pytest.mark.django_db
+def test_gmw_spatial_filter_validation(api_client, located_gmws):
+    url = reverse("api:gmw:gmw-list")
+    assert api_client.get(f"{url}?bbox=4.8,52.0").status_code == 400
+    assert api_client.get(f"{url}?near=north").status_code == 400
+
+
+@pytest.mark.django_db
+def test_gmw_geojson_coordinates_from_location(local_cache, api_client, gmw):
+    gmw.standardized_location = "52.0907 5.1214"
+    gmw.save()
+
+    geojson = json.loads(api_client.get(reverse("api:gmw:gmw-geojson-list")).content)
+    assert geojson["features"][0]["geometry"]["coordinates"] == [5.1214, 52.0907]
+
+
+@pytest.mark.django_db
+def test_monitoringtube_range_filters(api_client, organisation, gmw, tube):
+    gmw_models.MonitoringTube.objects.create(
+        data_owner=organisation,
+        gmw=gmw,
+        tube_number="2",
+        screen_top_position=-20.0,
+        screen_bottom_position=-21.0,
+    )
+    url = reverse("api:gmw:monitoringtube-list")
+
+    response = api_client.get(f"{url}?screen_top_position__lte=-15")
+    assert [result["tube_number"] for result in response.json()["results"]] == ["2"]
+
+    response = api_client.get(
+        f"{url}?screen_bottom_position__gte=-12&screen_bottom_position__lte=-10"
+    )
+    results = response.json()["results"]
+    assert [result["tube_number"] for result in results] == ["1"]
+    assert results[0]["screen_bottom_position"] == -11.0
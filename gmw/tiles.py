@@ -0,0 +1,118 @@
+"""Mapbox Vector Tiles of the GMWs of an organisation.
+
+The tiles are generated by PostGIS with ST_AsMVT, from the location column
+that is derived from the standardized location (see migration 0024), and
+carry the same properties as the GeoJSON. Tiles share the version of the
+GeoJSON of the organisation, so the same changes (see gmw.signals) make all
+cached tiles of the organisation unreachable.
+"""
+
+import logging
+import uuid
+
+from django.core.cache import cache
+from django.db import connection
+
+from .geojson import GEOJSON_CACHE_TIMEOUT, get_version
+
+logger = logging.getLogger(__name__)
+
+MAX_ZOOM = 22
+TILE_LAYER = "gmws"
+TILE_EXTENT = 4096
+
+TILE_SQL = """
+WITH bounds AS (
+    SELECT ST_TileEnvelope(%(z)s, %(x)s, %(y)s) AS geom
+),
+features AS (
+    SELECT
+        ST_AsMVTGeom(
+            ST_Transform(gmw.location, 3857), bounds.geom, %(extent)s
+        ) AS geom,
+        gmw.uuid::text AS uuid,
+        gmw.bro_id,
+        (
+            SELECT string_agg(DISTINCT mp.gmn_id::text, ',')
+            FROM gmn_measuringpoint mp
+            JOIN gmw_monitoringtube tube ON tube.uuid = mp.monitoring_tube_id
+            WHERE tube.gmw_id = gmw.uuid
+        ) AS linked_gmns,
+        gmw.nitg_code,
+        gmw.well_construction_date,
+        (
+            SELECT count(*) FROM gmw_monitoringtube tube
+            WHERE tube.gmw_id = gmw.uuid
+        ) AS nr_of_monitoring_tubes,
+        gmw.quality_regime,
+        gmw.removed,
+        (
+            SELECT json_agg(
+                json_build_object(
+                    'uuid', tube.uuid,
+                    'tube_number', tube.tube_number,
+                    'tube_status', tube.tube_status
+                )
+            )::text
+            FROM gmw_monitoringtube tube
+            WHERE tube.gmw_id = gmw.uuid
+        ) AS tubes
+    FROM gmw_gmw gmw, bounds
+    WHERE gmw.data_owner_id = %(organisation_id)s
+        AND gmw.location && ST_Transform(bounds.geom, 4258)
+)
+SELECT ST_AsMVT(features.*, %(layer)s, %(extent)s, 'geom')
+FROM features
+WHERE features.geom IS NOT NULL
+"""
+
+
+def is_valid_tile(z: int, x: int, y: int) -> bool:
+    return 0 <= z <= MAX_ZOOM and 0 <= x < 2**z and 0 <= y < 2**z
+
+
+def _tile_key(
+    organisation_id: uuid.UUID | str, version: int, z: int, x: int, y: int
+) -> str:
+    return f"gmw_tile:{organisation_id}:{version}:{z}/{x}/{y}"
+
+
+def build_tile(organisation_id: uuid.UUID | str, z: int, x: int, y: int) -> bytes:
+    """Returns the tile with the GMWs of an organisation.
+
+    Vector tiles have no lists or objects as properties, so the linked GMNs
+    are joined with commas, and the tubes are a JSON string.
+    """
+    with connection.cursor() as cursor:
+        cursor.execute(
+            TILE_SQL,
+            {
+                "z": z,
+                "x": x,
+                "y": y,
+                "extent": TILE_EXTENT,
+                "layer": TILE_LAYER,
+                "organisation_id": str(organisation_id),
+            },
+        )
+        tile = cursor.fetchone()[0]
+    return bytes(tile) if tile else b""
+
+
+def get_tile(
+    organisation_id: uuid.UUID | str, z: int, x: int, y: int
+) -> tuple[int, bytes]:
+    """Returns the version and the tile, building it on a miss."""
+    version = get_version(organisation_id)
+    key = _tile_key(organisation_id, version, z, x, y)
+    tile = cache.get(key)
+    if tile is not None:
+        return version, tile
+
+    tile = build_tile(organisation_id, z, x, y)
+    try:
+        cache.set(key, tile, GEOJSON_CACHE_TIMEOUT)
+    except Exception as e:
+        # The next request builds it again
+        logger.warning(f"Failed to cache tile {z}/{x}/{y} of {organisation_id}: {e}")
+    return version, tile
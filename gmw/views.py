@@ -1,28 +1,68 @@
+import gzip
 import logging
-import time
 
-from django.core.cache import cache
-from django.db.models import Prefetch
-from django.http import HttpResponse, JsonResponse
+from django.contrib.postgres.aggregates import ArrayAgg
+from django.db.models import OuterRef, Subquery
+from django.http import Http404, HttpResponse, JsonResponse
+from django.utils.cache import patch_vary_headers
+from django.utils.http import parse_etags, quote_etag
 from django.views import View
 from django_filters.rest_framework import DjangoFilterBackend
 from drf_yasg import openapi
 from drf_yasg.utils import swagger_auto_schema
 from rest_framework import generics
-from rest_framework.response import Response
 from rest_framework.views import APIView
 
 from api import mixins
 from api.bro_upload.upload_datamodels import GMWConstruction
+from api.utils import count_subquery
 from gmn import models as gmn_models  # ADDED: Import GMN models
 
-from . import filters, serializers
+from . import filters, geojson, serializers, tiles
 from . import models as gmw_models
 from .xml_reader.xml_model import GMWXML
 
 logger = logging.getLogger(__name__)
 
 
+def linked_gmns_subquery(**outer_refs: str) -> Subquery:
+    """The uuids of the GMNs with a measuring point that matches the outer row.
+
+    The keyword arguments map Measuringpoint fields to fields of the outer
+    queryset. Annotated as linked_gmn_uuids, which the serializers read
+    instead of querying the measuring points per object.
+    """
+    linked_gmns = (
+        gmn_models.Measuringpoint.objects.filter(
+            **{
+                field: OuterRef(outer_field)
+                for field, outer_field in outer_refs.items()
+            }
+        )
+        .order_by()
+        .values("gmw_bro_id")
+        .annotate(gmns=ArrayAgg("gmn_id", distinct=True))
+        .values("gmns")
+    )
+    return Subquery(linked_gmns)
+
+
+# Counts and linked GMNs shown by the GMWSerializer, annotated instead of
+# queried per GMW
+GMW_WITH_COUNTS = gmw_models.GMW.objects.annotate(
+    monitoring_tube_count=count_subquery(gmw_models.MonitoringTube.objects, "gmw"),
+    intermediate_event_count=count_subquery(gmw_models.Event.objects, "gmw"),
+    linked_gmn_uuids=linked_gmns_subquery(gmw_bro_id="bro_id"),
+)
+TUBES_WITH_LINKED_GMNS = gmw_models.MonitoringTube.objects.select_related(
+    "gmw"
+).annotate(
+    linked_gmn_uuids=linked_gmns_subquery(
+        gmw_bro_id="gmw__bro_id", tube_number="tube_number"
+    ),
+)
+
+
 class GMWGeoJSONView(APIView):
     """Endpoint to serve all GMW data as GeoJSON FeatureCollection"""
 
@@ -173,7 +213,7 @@ class GMWGeoJSONView(APIView):
             )
         },
     )
-    def get(self, request) -> Response:
+    def get(self, request) -> HttpResponse:
         """
         Returns GeoJSON FeatureCollection with structure:
         {
@@ -181,52 +221,62 @@ class GMWGeoJSONView(APIView):
             "count": int,
             "features": GMWGeoJSON[]
         }
+
+        The collection is served gzipped from the cache, see gmw.geojson.
         """
         user_org = request.user.userprofile.organisation
-
-        # Check cache first
-        cache_key = f"gmw_geojson_{user_org.uuid}"
-        cached_data = cache.get(cache_key)
-
-        if cached_data:
-            logger.info(f"✅ CACHE HIT - Returning cached data for org {user_org.uuid}")
-            return Response(cached_data)
-
-        # Cache miss - generate fresh data
-        logger.info(f"❌ CACHE MISS - Generating fresh data for org {user_org.uuid}")
-        start_time = time.time()
-
-        # Build queryset
-        queryset = (
-            gmw_models.GMW.objects.select_related("data_owner")
-            .filter(data_owner=user_org)
-            .prefetch_related(
-                "tubes",
-                Prefetch(
-                    "tubes__measuring_points",
-                    queryset=gmn_models.Measuringpoint.objects.select_related("gmn"),
-                ),
+        version, body = geojson.get_geojson(user_org.uuid)
+
+        etag = quote_etag(f"{user_org.uuid}-{version}")
+        if etag in parse_etags(request.headers.get("If-None-Match", "")):
+            response = HttpResponse(status=304)
+        elif "gzip" in request.headers.get("Accept-Encoding", ""):
+            response = HttpResponse(body, content_type="application/json")
+            response["Content-Encoding"] = "gzip"
+        else:
+            response = HttpResponse(
+                gzip.decompress(body), content_type="application/json"
             )
-        )
 
-        # Serialize data
-        serializer = serializers.GMWGeoJSONSerializer(queryset, many=True)
+        response["ETag"] = etag
+        patch_vary_headers(response, ["Accept-Encoding"])
+        return response
 
-        # Wrap in GeoJSON FeatureCollection
-        geojson = {
-            "type": "FeatureCollection",
-            "count": len(serializer.data),
-            "features": serializer.data,
-        }
 
-        generation_time = time.time() - start_time
-        logger.info(f"Generated {geojson['count']} features in {generation_time:.2f}s")
+class GMWTileView(APIView):
+    """Endpoint to serve the GMWs as Mapbox Vector Tiles"""
 
-        # Cache for 1 hour
-        cache.set(cache_key, geojson, 60 * 60)
-        logger.info(f"✅ Cached data for org {user_org.uuid}")
+    @swagger_auto_schema(
+        operation_description=(
+            "Get a Mapbox Vector Tile with the GMWs, in a layer named 'gmws'. "
+            "The features have the same properties as the GeoJSON, with the "
+            "linked GMNs joined by commas and the tubes as a JSON string."
+        ),
+        responses={
+            200: openapi.Response(
+                description="Mapbox Vector Tile",
+                schema=openapi.Schema(type=openapi.TYPE_STRING, format="binary"),
+            )
+        },
+    )
+    def get(self, request, z: int, x: int, y: int) -> HttpResponse:
+        """Tiles are cached per organisation, see gmw.tiles."""
+        if not tiles.is_valid_tile(z, x, y):
+            raise Http404(f"Tile {z}/{x}/{y} does not exist")
+
+        user_org = request.user.userprofile.organisation
+        etag = quote_etag(f"{user_org.uuid}-{geojson.get_version(user_org.uuid)}")
+        if etag in parse_etags(request.headers.get("If-None-Match", "")):
+            response = HttpResponse(status=304)
+        else:
+            version, tile = tiles.get_tile(user_org.uuid, z, x, y)
+            etag = quote_etag(f"{user_org.uuid}-{version}")
+            response = HttpResponse(
+                tile, content_type="application/vnd.mapbox-vector-tile"
+            )
 
-        return Response(geojson)
+        response["ETag"] = etag
+        return response
 
 
 class GMWAPIView(View):
@@ -264,7 +314,12 @@ class GMWAPIView(View):
         return JsonResponse(gmw_model.model_dump())
 
 
-class GMWListView(mixins.UserOrganizationMixin, generics.ListAPIView):
+class GMWListView(
+    mixins.UserOrganizationMixin,
+    mixins.SparseFieldsMixin,
+    mixins.ConditionalGetMixin,
+    generics.ListAPIView,
+):
     """
     API view to retrieve a list of GMW objects.
 
@@ -273,38 +328,70 @@ class GMWListView(mixins.UserOrganizationMixin, generics.ListAPIView):
     """
 
     serializer_class = serializers.GMWSerializer
-    queryset = gmw_models.GMW.objects.all()
+    etag_related_models = (
+        gmw_models.MonitoringTube,
+        gmw_models.Event,
+        gmn_models.Measuringpoint,
+    )
+    queryset = GMW_WITH_COUNTS
     filter_backends = [DjangoFilterBackend]
     filterset_class = filters.GmwFilter
     ordering = ["id"]
 
 
-class GMWDetailView(mixins.UserOrganizationMixin, generics.RetrieveAPIView):
+class GMWDetailView(
+    mixins.UserOrganizationMixin,
+    mixins.SparseFieldsMixin,
+    mixins.ConditionalGetMixin,
+    generics.RetrieveAPIView,
+):
     """
     API view to retrieve a single GMW object by UUID.
     """
 
-    queryset = gmw_models.GMW.objects.all()
+    queryset = GMW_WITH_COUNTS
     serializer_class = serializers.GMWSerializer
+    etag_related_models = (
+        gmw_models.MonitoringTube,
+        gmw_models.Event,
+        gmn_models.Measuringpoint,
+    )
     lookup_field = "uuid"
 
 
-class GMWOverviewList(mixins.UserOrganizationMixin, generics.ListAPIView):
+class GMWOverviewList(
+    mixins.UserOrganizationMixin,
+    mixins.SparseFieldsMixin,
+    mixins.ConditionalGetMixin,
+    generics.ListAPIView,
+):
     """
     API view to retrieve a list of GMW objects with overview serializer.
 
     Supports filtering via DjangoFilterBackend and GmwFilter.
     """
 
-    queryset = gmw_models.GMW.objects.all()
+    queryset = gmw_models.GMW.objects.annotate(
+        linked_gmn_uuids=linked_gmns_subquery(gmw_bro_id="bro_id"),
+    ).prefetch_related("tubes", "events")
     serializer_class = serializers.GMWOverviewSerializer
+    etag_related_models = (
+        gmw_models.MonitoringTube,
+        gmw_models.Event,
+        gmn_models.Measuringpoint,
+    )
 
     filter_backends = [DjangoFilterBackend]
     filterset_class = filters.GmwFilter
     ordering = ["id"]
 
 
-class GMWIdsList(mixins.UserOrganizationMixin, generics.ListAPIView):
+class GMWIdsList(
+    mixins.UserOrganizationMixin,
+    mixins.SparseFieldsMixin,
+    mixins.ConditionalGetMixin,
+    generics.ListAPIView,
+):
     """
     API view to retrieve a list of GMW object IDs.
 
@@ -319,7 +406,12 @@ class GMWIdsList(mixins.UserOrganizationMixin, generics.ListAPIView):
     ordering = ["id"]
 
 
-class MonitoringTubeListView(mixins.UserOrganizationMixin, generics.ListAPIView):
+class MonitoringTubeListView(
+    mixins.UserOrganizationMixin,
+    mixins.SparseFieldsMixin,
+    mixins.ConditionalGetMixin,
+    generics.ListAPIView,
+):
     """
     API view to retrieve a list of MonitoringTube objects.
 
@@ -328,24 +420,36 @@ class MonitoringTubeListView(mixins.UserOrganizationMixin, generics.ListAPIView)
     """
 
     serializer_class = serializers.MonitoringTubeSerializer
-    queryset = gmw_models.MonitoringTube.objects.all().order_by("-created")
+    etag_related_models = (gmw_models.GMW, gmn_models.Measuringpoint)
+    queryset = TUBES_WITH_LINKED_GMNS.order_by("-created")
 
     filter_backends = [DjangoFilterBackend]
     filterset_class = filters.MonitoringTubeFilter
     ordering = ["id"]
 
 
-class MonitoringTubeDetailView(mixins.UserOrganizationMixin, generics.RetrieveAPIView):
+class MonitoringTubeDetailView(
+    mixins.UserOrganizationMixin,
+    mixins.SparseFieldsMixin,
+    mixins.ConditionalGetMixin,
+    generics.RetrieveAPIView,
+):
     """
     API view to retrieve a single MonitoringTube object by UUID.
     """
 
-    queryset = gmw_models.MonitoringTube.objects.all()
+    queryset = TUBES_WITH_LINKED_GMNS
     serializer_class = serializers.MonitoringTubeSerializer
+    etag_related_models = (gmw_models.GMW, gmn_models.Measuringpoint)
     lookup_field = "uuid"
 
 
-class EventListView(mixins.UserOrganizationMixin, generics.ListAPIView):
+class EventListView(
+    mixins.UserOrganizationMixin,
+    mixins.SparseFieldsMixin,
+    mixins.ConditionalGetMixin,
+    generics.ListAPIView,
+):
     """
     API view to retrieve a list of Event objects.
 
@@ -354,18 +458,25 @@ class EventListView(mixins.UserOrganizationMixin, generics.ListAPIView):
     """
 
     serializer_class = serializers.EventSerializer
-    queryset = gmw_models.Event.objects.all().order_by("-created")
+    etag_related_models = (gmw_models.GMW,)
+    queryset = gmw_models.Event.objects.select_related("gmw").order_by("-created")
 
     filter_backends = [DjangoFilterBackend]
     filterset_class = filters.EventFilter
     ordering = ["id"]
 
 
-class EventDetailView(mixins.UserOrganizationMixin, generics.RetrieveAPIView):
+class EventDetailView(
+    mixins.UserOrganizationMixin,
+    mixins.SparseFieldsMixin,
+    mixins.ConditionalGetMixin,
+    generics.RetrieveAPIView,
+):
     """
     API view to retrieve a single Event object by UUID.
     """
 
-    queryset = gmw_models.Event.objects.all()
+    queryset = gmw_models.Event.objects.select_related("gmw")
     serializer_class = serializers.EventSerializer
+    etag_related_models = (gmw_models.GMW,)
     lookup_field = "uuid"
@@ -7,7 +7,12 @@ from . import filters, serializers
 from . import models as gpd_models
 
 
-class GPDListView(mixins.UserOrganizationMixin, generics.ListAPIView):
+class GPDListView(
+    mixins.UserOrganizationMixin,
+    mixins.SparseFieldsMixin,
+    mixins.ConditionalGetMixin,
+    generics.ListAPIView,
+):
     """
     API view to retrieve a list of GPD objects for the user's organization.
 
@@ -23,7 +28,12 @@ class GPDListView(mixins.UserOrganizationMixin, generics.ListAPIView):
     ordering = ["id"]
 
 
-class GPDIdsList(mixins.UserOrganizationMixin, generics.ListAPIView):
+class GPDIdsList(
+    mixins.UserOrganizationMixin,
+    mixins.SparseFieldsMixin,
+    mixins.ConditionalGetMixin,
+    generics.ListAPIView,
+):
     """
     API view to retrieve a list of GPD IDs for the user's organization.
 
@@ -39,7 +49,12 @@ class GPDIdsList(mixins.UserOrganizationMixin, generics.ListAPIView):
     ordering = ["id"]
 
 
-class GPDDetailView(mixins.UserOrganizationMixin, generics.RetrieveAPIView):
+class GPDDetailView(
+    mixins.UserOrganizationMixin,
+    mixins.SparseFieldsMixin,
+    mixins.ConditionalGetMixin,
+    generics.RetrieveAPIView,
+):
     """
     API view to retrieve the details of a single GPD object by UUID.
 
@@ -55,7 +70,12 @@ class GPDDetailView(mixins.UserOrganizationMixin, generics.RetrieveAPIView):
     lookup_field = "uuid"
 
 
-class ReportListView(mixins.UserOrganizationMixin, generics.ListAPIView):
+class ReportListView(
+    mixins.UserOrganizationMixin,
+    mixins.SparseFieldsMixin,
+    mixins.ConditionalGetMixin,
+    generics.ListAPIView,
+):
     """
     API view to retrieve a list of GPD reports for the user's organization.
 
@@ -71,7 +91,12 @@ class ReportListView(mixins.UserOrganizationMixin, generics.ListAPIView):
     ordering = ["id"]
 
 
-class ReportDetailView(mixins.UserOrganizationMixin, generics.RetrieveAPIView):
+class ReportDetailView(
+    mixins.UserOrganizationMixin,
+    mixins.SparseFieldsMixin,
+    mixins.ConditionalGetMixin,
+    generics.RetrieveAPIView,
+):
     """
     API view to retrieve the details of a single GPD report by UUID.
 
@@ -87,7 +112,12 @@ class ReportDetailView(mixins.UserOrganizationMixin, generics.RetrieveAPIView):
     lookup_field = "uuid"
 
 
-class VolumeSeriesListView(mixins.UserOrganizationMixin, generics.ListAPIView):
+class VolumeSeriesListView(
+    mixins.UserOrganizationMixin,
+    mixins.SparseFieldsMixin,
+    mixins.ConditionalGetMixin,
+    generics.ListAPIView,
+):
     """
     API view to retrieve a list of VolumeSeries for the user's organization.
 
@@ -103,7 +133,12 @@ class VolumeSeriesListView(mixins.UserOrganizationMixin, generics.ListAPIView):
     ordering = ["id"]
 
 
-class VolumeSeriesDetailView(mixins.UserOrganizationMixin, generics.RetrieveAPIView):
+class VolumeSeriesDetailView(
+    mixins.UserOrganizationMixin,
+    mixins.SparseFieldsMixin,
+    mixins.ConditionalGetMixin,
+    generics.RetrieveAPIView,
+):
     """
     API view to retrieve the details of a single VolumeSeries by UUID.
 
@@ -7,7 +7,12 @@ from . import filters, serializers
 from . import models as guf_models
 
 
-class GUFListView(mixins.UserOrganizationMixin, generics.ListAPIView):
+class GUFListView(
+    mixins.UserOrganizationMixin,
+    mixins.SparseFieldsMixin,
+    mixins.ConditionalGetMixin,
+    generics.ListAPIView,
+):
     """
     API view to retrieve a list of GUF objects for the user's organization.
 
@@ -23,7 +28,12 @@ class GUFListView(mixins.UserOrganizationMixin, generics.ListAPIView):
     ordering = ["id"]
 
 
-class GUFIdsList(mixins.UserOrganizationMixin, generics.ListAPIView):
+class GUFIdsList(
+    mixins.UserOrganizationMixin,
+    mixins.SparseFieldsMixin,
+    mixins.ConditionalGetMixin,
+    generics.ListAPIView,
+):
     """
     API view to retrieve a list of GUF IDs for the user's organization.
 
@@ -39,7 +49,12 @@ class GUFIdsList(mixins.UserOrganizationMixin, generics.ListAPIView):
     ordering = ["id"]
 
 
-class GUFDetailView(mixins.UserOrganizationMixin, generics.RetrieveAPIView):
+class GUFDetailView(
+    mixins.UserOrganizationMixin,
+    mixins.SparseFieldsMixin,
+    mixins.ConditionalGetMixin,
+    generics.RetrieveAPIView,
+):
     """
     API view to retrieve the details of a single GUF object by UUID.
 
@@ -56,7 +71,12 @@ class GUFDetailView(mixins.UserOrganizationMixin, generics.RetrieveAPIView):
 
 
 # Design Installation Views
-class DesignInstallationListView(mixins.UserOrganizationMixin, generics.ListAPIView):
+class DesignInstallationListView(
+    mixins.UserOrganizationMixin,
+    mixins.SparseFieldsMixin,
+    mixins.ConditionalGetMixin,
+    generics.ListAPIView,
+):
     """
     API view to retrieve a list of Design Installation objects for the user's organization.
 
@@ -91,7 +111,12 @@ class DesignInstallationDetailView(
 
 
 # Design Loop Views
-class DesignLoopListView(mixins.UserOrganizationMixin, generics.ListAPIView):
+class DesignLoopListView(
+    mixins.UserOrganizationMixin,
+    mixins.SparseFieldsMixin,
+    mixins.ConditionalGetMixin,
+    generics.ListAPIView,
+):
     """
     API view to retrieve a list of Design Loop objects for the user's organization.
     """
@@ -104,7 +129,12 @@ class DesignLoopListView(mixins.UserOrganizationMixin, generics.ListAPIView):
     ordering = ["id"]
 
 
-class DesignLoopDetailView(mixins.UserOrganizationMixin, generics.RetrieveAPIView):
+class DesignLoopDetailView(
+    mixins.UserOrganizationMixin,
+    mixins.SparseFieldsMixin,
+    mixins.ConditionalGetMixin,
+    generics.RetrieveAPIView,
+):
     """
     API view to retrieve the details of a single Design Loop object by UUID.
     """
@@ -115,7 +145,12 @@ class DesignLoopDetailView(mixins.UserOrganizationMixin, generics.RetrieveAPIVie
 
 
 # Design Well Views
-class DesignWellListView(mixins.UserOrganizationMixin, generics.ListAPIView):
+class DesignWellListView(
+    mixins.UserOrganizationMixin,
+    mixins.SparseFieldsMixin,
+    mixins.ConditionalGetMixin,
+    generics.ListAPIView,
+):
     """
     API view to retrieve a list of Design Well objects for the user's organization.
     """
@@ -128,7 +163,12 @@ class DesignWellListView(mixins.UserOrganizationMixin, generics.ListAPIView):
     ordering = ["id"]
 
 
-class DesignWellDetailView(mixins.UserOrganizationMixin, generics.RetrieveAPIView):
+class DesignWellDetailView(
+    mixins.UserOrganizationMixin,
+    mixins.SparseFieldsMixin,
+    mixins.ConditionalGetMixin,
+    generics.RetrieveAPIView,
+):
     """
     API view to retrieve the details of a single Design Well object by UUID.
     """
@@ -167,7 +207,12 @@ class DesignSurfaceInfiltrationDetailView(
 
 
 # GUF Event Views
-class GUFEventListView(mixins.UserOrganizationMixin, generics.ListAPIView):
+class GUFEventListView(
+    mixins.UserOrganizationMixin,
+    mixins.SparseFieldsMixin,
+    mixins.ConditionalGetMixin,
+    generics.ListAPIView,
+):
     """
     API view to retrieve a list of GUF Event objects for the user's organization.
     """
@@ -180,7 +225,12 @@ class GUFEventListView(mixins.UserOrganizationMixin, generics.ListAPIView):
     ordering = ["id"]
 
 
-class GUFEventDetailView(mixins.UserOrganizationMixin, generics.RetrieveAPIView):
+class GUFEventDetailView(
+    mixins.UserOrganizationMixin,
+    mixins.SparseFieldsMixin,
+    mixins.ConditionalGetMixin,
+    generics.RetrieveAPIView,
+):
     """
     API view to retrieve the details of a single GUF Event object by UUID.
     """
@@ -191,7 +241,12 @@ class GUFEventDetailView(mixins.UserOrganizationMixin, generics.RetrieveAPIView)
 
 
 # Energy Characteristics Views
-class EnergyCharacteristicsListView(mixins.UserOrganizationMixin, generics.ListAPIView):
+class EnergyCharacteristicsListView(
+    mixins.UserOrganizationMixin,
+    mixins.SparseFieldsMixin,
+    mixins.ConditionalGetMixin,
+    generics.ListAPIView,
+):
     """
     API view to retrieve a list of Energy Characteristics objects for the user's organization.
     """